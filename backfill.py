@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Historical backfill - fetch, parse and score every game of a season
+
+Enumerates each week's scoreboard for a season (or one date range),
+downloads the game summaries with a bounded thread pool and hands each one
+to a process pool that parses and scores it, since parsing is CPU-bound
+pure Python. Every game's scored stat lines are written to a local store -
+one JSON file per game, or the SQLite stat warehouse with --warehouse -
+and games already in the store are skipped, so an interrupted backfill
+resumes where it stopped.
+
+Usage:
+    python backfill.py 2025                       # regular season + playoffs
+    python backfill.py 2025 --seasontype 2 --weeks 1-4
+    python backfill.py --dates 20260110-20260208 --seasontype 3
+    python backfill.py 2025 --replay recordings/2025 --workers 4
+    python backfill.py 2025 --warehouse stats.db
+
+Store layout:
+    <store>/<season>/<seasontype>-<week>/<game id>.json
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from championship_matchup import ChampionshipMatchup
+from data_sources import ESPNSource, ReplaySource
+from stat_warehouse import StatWarehouse, stat_rows
+
+# Weeks per season type (preseason, regular season, postseason incl. the Pro Bowl week)
+SEASON_WEEKS = {1: 4, 2: 18, 3: 5}
+
+# Matchup used by each worker process, built once by _init_worker
+_worker_matchup: Optional[ChampionshipMatchup] = None
+
+
+def _init_worker(settings_path: Optional[str]):
+    global _worker_matchup
+    _worker_matchup = ChampionshipMatchup(cache_dir=None, settings_path=settings_path)
+
+
+def parse_and_score(game_id: str, game_data: Dict) -> List[Dict]:
+    """Parse one summary and score every stat line in it (runs in a worker process)"""
+    return stat_rows(_worker_matchup, game_id, _worker_matchup.parse_game(game_data))
+
+
+class InlineExecutor:
+    """Executor stand-in that runs each task immediately (--workers 0)"""
+
+    def __init__(self, initializer=None, initargs=()):
+        if initializer:
+            initializer(*initargs)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def submit(self, fn, *args) -> Future:
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+class BackfillStore:
+    """Scored stat lines on disk, one JSON file per game"""
+
+    def __init__(self, root: str = 'backfill_data'):
+        self.root = root
+
+    def path(self, season, seasontype: int, week, game_id: str) -> str:
+        return os.path.join(self.root, str(season), f"{seasontype}-{week}", f"{game_id}.json")
+
+    def has(self, season, seasontype: int, week, game_id: str) -> bool:
+        return os.path.exists(self.path(season, seasontype, week, game_id))
+
+    def save(self, season, seasontype: int, week, game_id: str, rows: List[Dict]):
+        path = self.path(season, seasontype, week, game_id)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'season': season, 'seasontype': seasontype, 'week': week,
+                       'game_id': game_id, 'rows': rows}, f)
+        os.replace(tmp_path, path)
+
+
+class Backfill:
+    """Enumerate, fetch, parse and score a season's games into a BackfillStore"""
+
+    def __init__(self, matchup: ChampionshipMatchup, store: BackfillStore, workers: Optional[int] = None,
+                 settings_path: Optional[str] = None, force: bool = False):
+        self.matchup = matchup
+        self.store = store
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.settings_path = settings_path
+        self.force = force
+
+    def enumerate_games(self, season=None, seasontypes=(2, 3), weeks=None,
+                        dates: Optional[str] = None) -> Iterator[Tuple[object, int, object, str]]:
+        """
+        Yield (season, seasontype, week, game_id) for every game, each game once.
+        Season, type and week come from the event itself when ESPN includes them,
+        so games found through a --dates range are filed under their real week.
+        """
+        seen = set()
+        if dates:
+            queries = [(season or dates, seasontype, dates, None) for seasontype in seasontypes]
+        else:
+            queries = [(season, seasontype, season, week)
+                       for seasontype in seasontypes
+                       for week in (weeks or range(1, SEASON_WEEKS[seasontype] + 1))]
+
+        for label, seasontype, query_dates, week in queries:
+            params = self.matchup.scoreboard_params(query_dates, seasontype, week)
+            for event in self.matchup.fetch_scoreboard(params) or []:
+                game_id = event.get('id')
+                if game_id and game_id not in seen:
+                    seen.add(game_id)
+                    event_season = event.get('season') or {}
+                    yield (event_season.get('year', label), event_season.get('type', seasontype),
+                           (event.get('week') or {}).get('number', week if week is not None else 'all'), game_id)
+
+    def run(self, season=None, seasontypes=(2, 3), weeks=None, dates: Optional[str] = None) -> Dict[str, int]:
+        """Backfill every game; returns counts of stored, skipped and failed games"""
+        counts = {'stored': 0, 'skipped': 0, 'failed': 0}
+        games = []
+        for game in self.enumerate_games(season, seasontypes, weeks, dates):
+            if not self.force and self.store.has(*game):
+                counts['skipped'] += 1
+            else:
+                games.append(game)
+        print(f"✓ {len(games)} games to backfill ({counts['skipped']} already stored)")
+
+        # Downloads run on threads and parsing on processes. Both stages keep a
+        # bounded number of games in flight, so memory stays flat however long
+        # the season is.
+        max_downloads = 2 * self.matchup.max_workers
+        max_pending = 2 * max(self.workers, 1)
+        if self.workers:
+            parse_pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                             initargs=(self.settings_path,))
+        else:
+            parse_pool = InlineExecutor(initializer=_init_worker, initargs=(self.settings_path,))
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.matchup.max_workers) as fetchers, parse_pool as parsers:
+            queue = iter(games)
+            downloads = deque()
+            pending = {}
+            for game in queue:
+                downloads.append((game, fetchers.submit(self.matchup.fetch_game_stats, game[3])))
+                if len(downloads) >= max_downloads:
+                    break
+
+            while downloads:
+                game, download = downloads.popleft()
+                next_game = next(queue, None)
+                if next_game is not None:
+                    downloads.append((next_game, fetchers.submit(self.matchup.fetch_game_stats, next_game[3])))
+
+                game_data = download.result()
+                if not game_data:
+                    counts['failed'] += 1
+                    continue
+                pending[parsers.submit(parse_and_score, game[3], game_data)] = game
+                if len(pending) >= max_pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        self._finish(pending.pop(future), future, counts)
+            for future in list(pending):
+                self._finish(pending.pop(future), future, counts)
+
+        elapsed = time.perf_counter() - start
+        rate = counts['stored'] / elapsed if elapsed else 0
+        print(f"✓ Stored {counts['stored']} games in {elapsed:.1f}s ({rate:.1f} games/s), "
+              f"{counts['failed']} failed")
+        return counts
+
+    def _finish(self, game, future, counts: Dict[str, int]):
+        try:
+            rows = future.result()
+        except Exception as e:
+            print(f"✗ Game {game[3]}: {e}")
+            counts['failed'] += 1
+            return
+        self.store.save(*game, rows)
+        counts['stored'] += 1
+
+
+def parse_weeks(text: Optional[str]) -> Optional[List[int]]:
+    """'1-4,7' -> [1, 2, 3, 4, 7]"""
+    if not text:
+        return None
+    weeks = []
+    for part in text.split(','):
+        first, _, last = part.partition('-')
+        weeks.extend(range(int(first), int(last or first) + 1))
+    return weeks
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Backfill a season of scored player stats')
+    parser.add_argument('season', nargs='?', type=int, help='season year, e.g. 2025')
+    parser.add_argument('--seasontype', type=int, choices=(1, 2, 3), action='append',
+                        help='1 = preseason, 2 = regular season, 3 = postseason (default: 2 and 3)')
+    parser.add_argument('--weeks', help="weeks to backfill, e.g. '1-4,7' (default: all)")
+    parser.add_argument('--dates', help="date range instead of weeks, e.g. '20260110-20260208'")
+    parser.add_argument('--store', default='backfill_data', help='directory for the scored games')
+    parser.add_argument('--warehouse', metavar='DB', help='write to this SQLite stat warehouse instead of --store')
+    parser.add_argument('--workers', type=int, help='parser processes (default: CPU count; 0 parses in this process)')
+    parser.add_argument('--fetch-workers', type=int, default=8, help='concurrent downloads')
+    parser.add_argument('--settings', help='league settings file to score with')
+    parser.add_argument('--replay', metavar='DIR', help='read recorded ESPN responses instead of the live API')
+    parser.add_argument('--force', action='store_true', help='re-process games already in the store')
+    args = parser.parse_args()
+
+    if args.season is None and not args.dates:
+        parser.error('give a season or --dates')
+
+    if args.replay:
+        source = ReplaySource(args.replay, max_workers=args.fetch_workers)
+    else:
+        source = ESPNSource(max_workers=args.fetch_workers)
+    matchup = ChampionshipMatchup(settings_path=args.settings, source=source)
+
+    store = StatWarehouse(args.warehouse) if args.warehouse else BackfillStore(args.store)
+    backfill = Backfill(matchup, store, args.workers, args.settings, args.force)
+    backfill.run(args.season, tuple(args.seasontype or (2, 3)), parse_weeks(args.weeks), args.dates)
+
+
+if __name__ == '__main__':
+    main()
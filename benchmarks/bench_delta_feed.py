@@ -0,0 +1,96 @@
+"""
+Benchmark: bytes per refresh with the delta feed vs the full results file
+
+Replays a live game one drive at a time (NE-DEN, with SEA-LAR final), so
+each version differs by a kicker's or a defense's points and the totals,
+like a real refresh. Every version is published with delta_feed.publish;
+the patch chain is checked to rebuild each version exactly. Reports what a
+polling client downloads per new version either way, and the time spent
+diffing.
+
+Usage:
+    python -m benchmarks.bench_delta_feed [--drives 22]
+"""
+
+import argparse
+import contextlib
+import copy
+import io
+import json
+import os
+import tempfile
+
+import delta_feed
+from benchmarks.common import best_of, report
+from benchmarks.fixtures import build_summary
+from championship_matchup import ChampionshipMatchup
+from generate_website_data import build_website_data, content_hash
+from stat_store import SlateStats
+
+
+def versions(matchup: ChampionshipMatchup, drives: int):
+    """Website documents for the slate after each drive of the live game"""
+    live = build_summary('401700001', seed=1, home=('17', 'NE'), away=('7', 'DEN'), state='in', n_drives=drives)
+    final = build_summary('401700002', seed=2, home=('26', 'SEA'), away=('14', 'LAR'))
+    documents = []
+    for played in range(1, drives + 1):
+        partial = copy.deepcopy(live)
+        partial['drives']['previous'] = partial['drives']['previous'][:played]
+        stats = SlateStats()
+        for game_id, summary in (('401700001', partial), ('401700002', final)):
+            stats.add_game(*matchup.parse_game(summary), game_id=game_id)
+        with contextlib.redirect_stdout(io.StringIO()):
+            data = build_website_data(matchup, stats)
+        data['content_hash'] = content_hash(data)
+        if not documents or documents[-1]['content_hash'] != data['content_hash']:
+            documents.append(data)
+    return documents
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Delta feed payload sizes')
+    parser.add_argument('--drives', type=int, default=22)
+    args = parser.parse_args()
+
+    documents = versions(ChampionshipMatchup(cache_dir=None), args.drives)
+    full_bytes, manifest_bytes, patch_bytes = [], [], []
+    with tempfile.TemporaryDirectory() as directory:
+        for previous, data in zip([None] + documents, documents):
+            delta_feed.publish(data, directory)
+            full_bytes.append(len(json.dumps(data, indent=2)))
+            manifest_path = os.path.join(directory, delta_feed.MANIFEST)
+            manifest_bytes.append(os.path.getsize(manifest_path))
+            if previous is None:
+                continue
+            with open(manifest_path) as f:
+                step = json.load(f)['patches'][-1]
+            with open(os.path.join(directory, delta_feed.patch_name(step['from'], step['to']))) as f:
+                patch = json.load(f)
+            assert delta_feed.apply_patch(previous, patch) == data, step
+            patch_bytes.append(step['bytes'])
+
+    updates = len(patch_bytes)
+    full = sum(full_bytes[1:]) / updates
+    delta = (sum(manifest_bytes[1:]) + sum(patch_bytes)) / updates
+    print(f"{len(documents)} versions over {args.drives} drives, "
+          f"every patch rebuilds its version exactly\n")
+    print(f"  {'full results file':<40} {full:10,.0f} bytes per update")
+    print(f"  {'manifest + patch':<40} {delta:10,.0f} bytes per update   {full / delta:6.2f}x")
+    print(f"  {'  patch alone (mean / max)':<40} {sum(patch_bytes) / updates:10,.0f} / {max(patch_bytes):,}")
+    print(f"  {'  manifest alone (mean)':<40} {sum(manifest_bytes[1:]) / updates:10,.0f}\n")
+
+    previous, data = documents[-2], documents[-1]
+    report('diff one update', best_of(lambda: delta_feed.diff(previous, data), 5, 200))
+    with tempfile.TemporaryDirectory() as directory:
+        delta_feed.publish(previous, directory)
+        flip = [data, previous]
+
+        def publish_next():
+            flip.reverse()
+            delta_feed.publish(flip[0], directory)
+
+        report('publish one version', best_of(publish_next, 5, 20))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark: SSE fan-out from the live server's shared state
+
+Starts the live server's HTTP/SSE front end (without the ESPN poller) on a
+local port and connects N streaming clients. It then publishes new
+versions and times how long it takes until every client has the patch
+event. It also checks that each client receives the same patch that
+delta_feed.diff produces.
+
+Usage:
+    python -m benchmarks.bench_live_server [--clients 10 100 1000] [--updates 5]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+import delta_feed
+from benchmarks.bench_delta_feed import versions
+from championship_matchup import ChampionshipMatchup
+from live_server import LiveServer, LiveState
+
+
+async def read_event(reader: asyncio.StreamReader):
+    """(event name, payload) of the next non-comment SSE message"""
+    event, data = None, None
+    while True:
+        line = (await reader.readline()).decode().rstrip('\n')
+        if line.startswith('event: '):
+            event = line[7:]
+        elif line.startswith('data: '):
+            data = json.loads(line[6:])
+        elif not line and event:
+            return event, data
+
+
+async def fan_out(documents, clients: int, updates: int) -> float:
+    """Mean seconds from publish until every client has read the patch"""
+    server = LiveServer(matchup=None)
+    server.state = LiveState()
+    server.state.publish(documents[0])
+    listener = await asyncio.start_server(server.handle, '127.0.0.1', 0)
+    port = listener.sockets[0].getsockname()[1]
+
+    connections = []
+    for _ in range(clients):
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        writer.write(b'GET /events HTTP/1.1\r\nHost: localhost\r\n\r\n')
+        while await reader.readline() != b'\r\n':
+            pass
+        connections.append((reader, writer))
+    await asyncio.gather(*(read_event(reader) for reader, _ in connections))
+
+    total = 0.0
+    for i in range(1, updates + 1):
+        previous, data = documents[(i - 1) % len(documents)], documents[i % len(documents)]
+        start = time.perf_counter()
+        server.state.publish(data)
+        received = await asyncio.gather(*(read_event(reader) for reader, _ in connections))
+        total += time.perf_counter() - start
+        expected = delta_feed.diff(previous, data)
+        assert all(event == 'patch' and message['patch'] == expected for event, message in received)
+
+    for _, writer in connections:
+        writer.close()
+    listener.close()
+    return total / updates
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Live server SSE fan-out latency')
+    parser.add_argument('--clients', type=int, nargs='+', default=[10, 100, 1000])
+    parser.add_argument('--updates', type=int, default=5)
+    args = parser.parse_args()
+
+    documents = versions(ChampionshipMatchup(cache_dir=None), 22)
+    # Clients run in the same process, so this includes their reading and JSON parsing
+    print(f"Patch delivered to every connected client (mean of {args.updates} updates)\n")
+    for clients in args.clients:
+        seconds = asyncio.run(fan_out(documents, clients, args.updates))
+        print(f"  {f'{clients:,} clients':<40} {seconds * 1e3:10.3f} ms   "
+              f"{seconds / clients * 1e6:8.1f} us per client")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,156 @@
+"""
+Benchmark: single-pass play-by-play scanner vs the old two-pass parsers
+
+The legacy functions below are the kicker and D/ST parsers as they were
+before play_by_play.scan_plays existed: each walked every drive on its own,
+lowercased every play and ran uncompiled regexes. Both paths are timed on
+the same summary, in alternating rounds, and their outputs are compared.
+
+Usage:
+    python -m benchmarks.bench_play_by_play [--summary recorded_summary.json]
+"""
+
+import argparse
+import re
+from typing import Dict
+
+from benchmarks.common import best_of_each, load_summary, report
+from benchmarks.fixtures import build_summary
+from championship_matchup import ChampionshipMatchup
+from game_context import GameContext
+from play_by_play import scan_plays
+
+
+def legacy_parse_kicker_stats(game_data: Dict) -> Dict[str, Dict]:
+    kickers = {}
+    for drive in game_data.get('drives', {}).get('previous', []):
+        for play in drive.get('plays', []):
+            text = play.get('text', '').lower()
+            if 'field goal' in text:
+                name_match = re.search(r'([A-Z]\.[A-Za-z]+)', play.get('text', ''))
+                if name_match:
+                    kicker_name = name_match.group(1)
+                    if kicker_name not in kickers:
+                        kickers[kicker_name] = {
+                            'name': kicker_name, 'pat_made': 0, 'pat_missed': 0,
+                            'fg_0_39': 0, 'fg_40_49': 0, 'fg_50_plus': 0,
+                            'fg_miss_0_39': 0, 'fg_miss_40_49': 0, 'fg_miss_50_plus': 0
+                        }
+                    dist_match = re.search(r'(\d+)\s*yard', text)
+                    if dist_match:
+                        distance = int(dist_match.group(1))
+                        is_good = 'is good' in text
+                        is_missed = 'no good' in text or 'missed' in text or 'blocked' in text
+                        if is_good:
+                            if distance <= 39:
+                                kickers[kicker_name]['fg_0_39'] += 1
+                            elif 40 <= distance <= 49:
+                                kickers[kicker_name]['fg_40_49'] += 1
+                            else:
+                                kickers[kicker_name]['fg_50_plus'] += 1
+                        elif is_missed:
+                            if distance <= 39:
+                                kickers[kicker_name]['fg_miss_0_39'] += 1
+                            elif 40 <= distance <= 49:
+                                kickers[kicker_name]['fg_miss_40_49'] += 1
+                            else:
+                                kickers[kicker_name]['fg_miss_50_plus'] += 1
+            elif 'extra point' in text:
+                pat_match = re.search(r'([A-Z]\.[A-Za-z]+)\s+extra\s+point', play.get('text', ''))
+                if pat_match:
+                    kicker_name = pat_match.group(1)
+                    if kicker_name not in kickers:
+                        kickers[kicker_name] = {
+                            'name': kicker_name, 'pat_made': 0, 'pat_missed': 0,
+                            'fg_0_39': 0, 'fg_40_49': 0, 'fg_50_plus': 0,
+                            'fg_miss_0_39': 0, 'fg_miss_40_49': 0, 'fg_miss_50_plus': 0
+                        }
+                    if 'is good' in text:
+                        kickers[kicker_name]['pat_made'] += 1
+                    elif 'no good' in text or 'missed' in text or 'blocked' in text:
+                        kickers[kicker_name]['pat_missed'] += 1
+    return kickers
+
+
+def legacy_parse_defense_plays(game_data: Dict, defense_stats: Dict[str, Dict]) -> Dict[str, Dict]:
+    """The play-by-play half of the old parse_defense_stats"""
+    players_data = game_data.get('boxscore', {}).get('players', [])
+    for drive in game_data.get('drives', {}).get('previous', []):
+        for play in drive.get('plays', []):
+            text = play.get('text', '')
+            text_lower = text.lower()
+            if 'fumble' in text_lower and 'recovered by' in text_lower:
+                match = re.search(r'recovered by ([A-Z]{2,3})-', text, re.IGNORECASE)
+                if match and match.group(1) in defense_stats:
+                    defense_stats[match.group(1)]['fumble_recoveries'] += 1
+            if 'muff' in text_lower and 'recovered by' in text_lower:
+                match = re.search(r'recovered by ([A-Z]{2,3})-', text, re.IGNORECASE)
+                if match and match.group(1) in defense_stats:
+                    defense_stats[match.group(1)]['fumble_recoveries'] += 1
+            if 'blocked' in text_lower and ('field goal' in text_lower or 'kick' in text_lower):
+                for participant in play.get('teamParticipants', []):
+                    if participant.get('type') == 'defense':
+                        blocking_team = None
+                        for team_data in players_data:
+                            team_info_check = team_data.get('team', {})
+                            if team_info_check.get('id') == participant.get('id'):
+                                blocking_team = team_info_check.get('abbreviation')
+                                break
+                        if blocking_team and blocking_team in defense_stats:
+                            defense_stats[blocking_team]['blocked_kicks'] += 1
+                        break
+    return defense_stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--summary', help='recorded ESPN summary JSON (default: synthetic game)')
+    parser.add_argument('--repeat', type=int, default=9)
+    parser.add_argument('--number', type=int, default=50)
+    args = parser.parse_args()
+
+    game_data = load_summary(args.summary) or build_summary('401772988', seed=1)
+    matchup = ChampionshipMatchup(cache_dir=None)
+    n_plays = sum(len(d.get('plays', [])) for d in game_data.get('drives', {}).get('previous', []))
+
+    def boxscore_only_defense():
+        # parse_defense_stats with an empty event list = its boxscore half only
+        return matchup.parse_defense_stats(game_data, events=[])
+
+    def legacy():
+        kickers = legacy_parse_kicker_stats(game_data)
+        defenses = legacy_parse_defense_plays(game_data, boxscore_only_defense())
+        return kickers, defenses
+
+    def single_pass():
+        # As parse_game does it: one GameContext shared by the scan and the D/ST parser
+        context = GameContext(game_data)
+        events = scan_plays(game_data, context)
+        return matchup.parse_kicker_stats(game_data, events), matchup.parse_defense_stats(game_data, events, context)
+
+    # Sanity check: same kicker lines (the scanner also keeps per-kick distances);
+    # D/ST differs only by the return TDs the scanner adds
+    old_kickers, old_defenses = legacy()
+    new_kickers, new_defenses = single_pass()
+    # (the new lines are also keyed and labelled by kicking team)
+    distance_keys = ('fg_made_distances', 'fg_missed_distances', 'team')
+    new_kickers = {stats['name']: {k: v for k, v in stats.items() if k not in distance_keys}
+                   for stats in new_kickers.values()}
+    assert old_kickers == new_kickers, 'kicker stats differ'
+    for team, stats in old_defenses.items():
+        new = dict(new_defenses[team])
+        old = dict(stats)
+        new.pop('return_tds'), old.pop('return_tds')
+        assert old == new, f'D/ST stats differ for {team}'
+
+    print(f"Play-by-play parsing, {n_plays} plays per game "
+          f"({'recorded' if args.summary else 'synthetic'} summary)\n")
+    base, single, scan = best_of_each([legacy, single_pass, lambda: scan_plays(game_data)],
+                                      args.repeat, args.number)
+    report('two-pass (legacy kicker + D/ST)', base)
+    report('single-pass scan_plays + aggregators', single, base)
+    report('  scan_plays alone', scan, base)
+
+
+if __name__ == '__main__':
+    main()
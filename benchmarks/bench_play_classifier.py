@@ -0,0 +1,169 @@
+"""
+Benchmark: play-text classifier correctness and plays/sec
+
+benchmarks/play_corpus.json holds play strings in ESPN's formats (field
+goals, extra points, blocks, muffs, fumbles, return TDs, and ordinary plays
+that must produce nothing), each with the events it should produce. Every
+corpus play is checked against play_by_play.classify_play (exit status 1 on
+a mismatch), and compared with the classifier it replaced.
+
+Throughput is measured on the corpus itself (almost every play needs
+classifying) and on a realistic play stream: the plays of a synthetic
+16-game slate, or of the summaries in a recording with --replay. The two
+classifiers are timed in alternating rounds, since on a busy machine
+separate timing runs differ by more than the classifiers do.
+
+Usage:
+    python -m benchmarks.bench_play_classifier [--replay DIR]
+"""
+
+import argparse
+import glob
+import json
+import os
+import re
+import sys
+from typing import Dict, List
+
+import play_by_play
+from benchmarks.common import best_of_each
+from benchmarks.fixtures import build_slate
+from play_by_play import PlayEvent, classify_play, defense_team, kicking_team
+
+CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'play_corpus.json')
+
+LEGACY_KICKER_RE = re.compile(r'([A-Z]\.[A-Za-z]+)')
+LEGACY_PAT_KICKER_RE = re.compile(r'([A-Z]\.[A-Za-z]+)\s+extra\s+point')
+LEGACY_DISTANCE_RE = re.compile(r'(\d+)\s*yard')
+LEGACY_RECOVERED_BY_RE = re.compile(r'recovered by ([A-Z]{2,3})-', re.IGNORECASE)
+
+
+def legacy_kick_result(text_lower: str):
+    if 'is good' in text_lower:
+        return play_by_play.GOOD
+    if 'no good' in text_lower or 'missed' in text_lower or 'blocked' in text_lower:
+        return play_by_play.MISSED
+    return None
+
+
+def legacy_classify_play(play: Dict, id_map: Dict[str, str], text_lower: str) -> List[PlayEvent]:
+    """
+    classify_play before the named-group grammars: the kicker was the first name
+    anywhere in the text. Kicks carry the kicking team as they do now, so only
+    the grammars are compared.
+    """
+    text = play.get('text', '')
+    events = []
+    if 'field goal' in text_lower:
+        name_match = LEGACY_KICKER_RE.search(text)
+        if name_match:
+            dist_match = LEGACY_DISTANCE_RE.search(text_lower)
+            distance = int(dist_match.group(1)) if dist_match else None
+            result = legacy_kick_result(text_lower) if dist_match else None
+            events.append(PlayEvent(play_by_play.FG_ATTEMPT, kicker=name_match.group(1), distance=distance, result=result,
+                                    team=kicking_team(play, id_map)))
+    elif 'extra point' in text_lower:
+        pat_match = LEGACY_PAT_KICKER_RE.search(text)
+        if pat_match:
+            events.append(PlayEvent(play_by_play.PAT, kicker=pat_match.group(1), result=legacy_kick_result(text_lower),
+                                    team=kicking_team(play, id_map)))
+    if 'recovered by' in text_lower:
+        match = LEGACY_RECOVERED_BY_RE.search(text)
+        if match:
+            if 'fumble' in text_lower:
+                events.append(PlayEvent(play_by_play.FUMBLE_RECOVERY, team=match.group(1)))
+            if 'muff' in text_lower:
+                events.append(PlayEvent(play_by_play.MUFF_RECOVERY, team=match.group(1)))
+    if 'blocked' in text_lower and ('field goal' in text_lower or 'kick' in text_lower):
+        blocking_team = defense_team(play, id_map)
+        if blocking_team:
+            events.append(PlayEvent(play_by_play.BLOCKED_KICK, team=blocking_team))
+    if 'touchdown' in text_lower:
+        play_type = play.get('type', {}).get('text', '').lower()
+        if 'touchdown' in play_type and 'interception' not in play_type and (
+                'return' in play_type or 'blocked' in play_type):
+            scoring_team = defense_team(play, id_map)
+            if scoring_team:
+                events.append(PlayEvent(play_by_play.RETURN_TD, team=scoring_team))
+    return events
+
+
+def legacy_classify_plays(plays: List[Dict], id_map: Dict[str, str], events: List[PlayEvent]):
+    for play in plays:
+        text_lower = play.get('text', '').lower()
+        if ('field goal' in text_lower or 'extra point' in text_lower or 'recovered by' in text_lower
+                or 'blocked' in text_lower or 'touchdown' in text_lower):
+            events.extend(legacy_classify_play(play, id_map, text_lower))
+
+
+def load_corpus():
+    """(plays as ESPN play dicts, expected events per play, team id -> abbreviation)"""
+    with open(CORPUS_PATH) as f:
+        corpus = json.load(f)
+    teams = corpus['teams']
+    plays = [{'type': {'text': entry['type']}, 'text': entry['text'],
+              'teamParticipants': [{'id': teams[entry['offense']], 'type': 'offense'},
+                                   {'id': teams[entry['defense']], 'type': 'defense'}]}
+             for entry in corpus['plays']]
+    expected = [[PlayEvent(**event) for event in entry['events']] for entry in corpus['plays']]
+    return plays, expected, {team_id: abbr for abbr, team_id in teams.items()}
+
+
+def summary_plays(summaries) -> tuple:
+    """(every play in the summaries, merged team id map)"""
+    plays, id_map = [], {}
+    for summary in summaries:
+        id_map.update(play_by_play.team_ids_to_abbr(summary))
+        for drive in summary.get('drives', {}).get('previous', []):
+            plays.extend(drive.get('plays', []))
+    return plays, id_map
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Play-text classifier correctness and throughput')
+    parser.add_argument('--replay', metavar='DIR', help='time the plays of a recording made with --record')
+    parser.add_argument('--repeat', type=int, default=9)
+    args = parser.parse_args()
+
+    plays, expected, corpus_ids = load_corpus()
+    failures = 0
+    legacy_differences = []
+    for play, events in zip(plays, expected):
+        found = classify_play(play, corpus_ids)
+        if found != events:
+            failures += 1
+            print(f"  ✗ {play['text']}\n      expected {events}\n      got      {found}")
+        legacy = legacy_classify_play(play, corpus_ids, play['text'].lower())
+        if legacy != found:
+            legacy_differences.append((play['text'], legacy, found))
+    print(f"{'✓' if not failures else '✗'} {len(plays) - failures}/{len(plays)} corpus plays classified as expected")
+    for text, legacy, found in legacy_differences:
+        print(f"  previous classifier differs on: {text}\n      was {legacy}\n      now {found}")
+
+    if args.replay:
+        summaries = []
+        for path in sorted(glob.glob(os.path.join(args.replay, 'summary', '*.json'))):
+            with open(path) as f:
+                summaries.append(json.load(f))
+        stream, stream_ids = summary_plays(summaries)
+        label = f"{len(summaries)} recorded games"
+    else:
+        stream, stream_ids = summary_plays(build_slate(16).values())
+        label = '16 synthetic games'
+
+    print(f"\n  {'':<40} {'plays/s':>12} {'previous':>12} {'speedup':>8}")
+    for name, batch, id_map in ((f"corpus ({len(plays)} plays)", plays, corpus_ids),
+                                (f"{label} ({len(stream):,} plays)", stream, stream_ids)):
+        number = max(1, 20_000 // len(batch))
+        seconds, legacy_seconds = best_of_each([lambda: play_by_play._classify_plays(batch, id_map, []),
+                                                lambda: legacy_classify_plays(batch, id_map, [])],
+                                               args.repeat, number)
+        print(f"  {name:<40} {len(batch) / seconds:12,.0f} {len(batch) / legacy_seconds:12,.0f}"
+              f" {legacy_seconds / seconds:7.2f}x")
+
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark: scalar calculate_fantasy_points vs columnar score_columns
+
+Generates a mix of QB / RB / WR / TE / K / D/ST player-game rows, scores
+them one dict at a time and as columns, checks both give the same points
+and reports the speedup.
+
+Usage:
+    python -m benchmarks.bench_scoring [--rows 50000]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from benchmarks.common import best_of, report
+from championship_matchup import ChampionshipMatchup
+from vectorized_scoring import score_columns, stats_to_columns
+
+
+def random_rows(n: int, seed: int = 0):
+    """Player-game stat dicts with roughly realistic distributions per position"""
+    rng = np.random.default_rng(seed)
+    positions = rng.choice(['QB', 'RB', 'WR', 'TE', 'K', 'D/ST'], size=n, p=[.1, .2, .3, .15, .1, .15])
+    rows = []
+    for pos in positions:
+        row = {'position': str(pos)}
+        if pos == 'QB':
+            row.update(passing_yards=int(rng.integers(80, 450)), passing_tds=int(rng.poisson(1.6)),
+                       interceptions=int(rng.poisson(0.8)), rushing_yards=int(rng.integers(-5, 70)),
+                       rushing_tds=int(rng.poisson(0.2)), fumbles_lost=int(rng.poisson(0.1)))
+        elif pos in ('RB', 'WR', 'TE'):
+            row.update(rushing_yards=int(rng.integers(0, 160)) if pos == 'RB' else 0,
+                       rushing_tds=int(rng.poisson(0.5)) if pos == 'RB' else 0,
+                       receptions=int(rng.poisson(4)), receiving_yards=int(rng.integers(0, 180)),
+                       receiving_tds=int(rng.poisson(0.4)), fumbles_lost=int(rng.poisson(0.05)))
+        elif pos == 'K':
+            row.update(pat_made=int(rng.poisson(2.5)), pat_missed=int(rng.poisson(0.1)),
+                       fg_0_39=int(rng.poisson(1)), fg_40_49=int(rng.poisson(0.6)),
+                       fg_50_plus=int(rng.poisson(0.3)), fg_miss_0_39=int(rng.poisson(0.1)),
+                       fg_miss_40_49=int(rng.poisson(0.2)), fg_miss_50_plus=int(rng.poisson(0.2)))
+        else:
+            row.update(points_allowed=int(rng.integers(0, 50)), sacks=float(rng.integers(0, 12)) / 2,
+                       defensive_interceptions=int(rng.poisson(0.8)), fumble_recoveries=int(rng.poisson(0.6)),
+                       safeties=int(rng.poisson(0.05)), blocked_kicks=int(rng.poisson(0.05)),
+                       return_tds=int(rng.poisson(0.1)))
+        rows.append(row)
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Scalar vs vectorized fantasy scoring')
+    parser.add_argument('--rows', type=int, default=50000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    matchup = ChampionshipMatchup(cache_dir=None)
+    rows = random_rows(args.rows)
+
+    start = time.perf_counter()
+    columns = stats_to_columns(rows)
+    convert = time.perf_counter() - start
+
+    scalar = np.array([matchup.calculate_fantasy_points(row) for row in rows])
+    vector = score_columns(columns, matchup.rules)
+    mismatches = int(np.count_nonzero(scalar != vector))
+    assert mismatches == 0, f"{mismatches} rows score differently"
+
+    print(f"Scoring {args.rows} player-game rows (all rows match the scalar scorer)\n")
+    base = best_of(lambda: [matchup.calculate_fantasy_points(row) for row in rows], args.repeat, 1)
+    report('scalar calculate_fantasy_points loop', base)
+    report('score_columns', best_of(lambda: score_columns(columns, matchup.rules), args.repeat, 1), base)
+    report('stats_to_columns + score_columns',
+           convert + best_of(lambda: score_columns(columns, matchup.rules), args.repeat, 1), base)
+    print(f"\n  rows/sec vectorized: {args.rows / best_of(lambda: score_columns(columns, matchup.rules), 1, 1):,.0f}")
+
+
+if __name__ == '__main__':
+    main()
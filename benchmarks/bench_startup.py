@@ -0,0 +1,132 @@
+"""
+Benchmark: cold-start import time, tracked against a baseline
+
+Every cron tick is a fresh interpreter, so import time is part of every
+run. For each entry module this runs `python -X importtime -c "import M"`
+in a clean subprocess several times and keeps the fastest cumulative
+time, then times a whole cold `generate_website_data.py --replay` run on a
+synthetic recording.
+
+Two kinds of regression are reported (exit status 1):
+- an import that is more than 25% + 5 ms slower than
+  benchmarks/startup_baseline.json (timings are machine-specific; refresh
+  the baseline with --update after an intended change or on a new machine)
+- a scoring-path module pulling in the network or optional heavy
+  dependencies (requests, urllib3, ijson, numpy, yaml), which should only
+  load when a live fetch, streaming parse or simulation needs them
+
+Usage:
+    python -m benchmarks.bench_startup [--runs 5] [--update]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Set, Tuple
+
+from benchmarks.fixtures import build_slate, write_recording
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_PATH = os.path.join(ROOT, 'benchmarks', 'startup_baseline.json')
+
+# Modules a cron tick or a scoring-only script imports first
+ENTRY_MODULES = ['scoring_rules', 'stat_store', 'championship_matchup', 'generate_website_data', 'league']
+
+# Loaded lazily, only when a live fetch / streaming parse / simulation needs them
+LAZY_DEPENDENCIES = {'requests', 'urllib3', 'ijson', 'numpy', 'yaml'}
+
+# Allowed slowdown before a module counts as a regression
+TOLERANCE = 1.25
+SLACK_US = 5000
+
+
+def import_profile(args: List[str]) -> Tuple[Dict[str, int], Set[str], float]:
+    """Run python -X importtime with args; (cumulative us per top-level module, all modules, wall seconds)"""
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, '-X', 'importtime', *args], cwd=ROOT,
+                            capture_output=True, text=True, check=True)
+    wall = time.perf_counter() - start
+
+    cumulative, modules = {}, set()
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, total, name = line.split('|')
+        if not total.strip().isdigit():
+            continue
+        modules.add(name.strip().split('.')[0])
+        if not name.startswith('  '):
+            cumulative[name.strip()] = int(total)
+    return cumulative, modules, wall
+
+
+def measure(runs: int, recording: str) -> Tuple[Dict[str, int], Dict[str, Set[str]]]:
+    """Fastest import time per entry module (us) plus the cold replay run (us)"""
+    timings, leaks = {}, {}
+    for module in ENTRY_MODULES:
+        best = None
+        for _ in range(runs):
+            cumulative, modules, _ = import_profile(['-c', f"import {module}"])
+            best = min(best or cumulative[module], cumulative[module])
+        timings[module] = best
+        leaks[module] = modules & LAZY_DEPENDENCIES
+
+    output = os.path.join(recording, 'championship_results.json')
+    best = None
+    for _ in range(runs):
+        _, modules, wall = import_profile(['generate_website_data.py', '--replay', recording,
+                                           '-o', output, '--simulations', '0'])
+        best = min(best or wall, wall)
+    timings['cold replay run'] = int(best * 1e6)
+    leaks['cold replay run'] = modules & LAZY_DEPENDENCIES
+    return timings, leaks
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Cold-start import time vs the tracked baseline')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--update', action='store_true', help='write the current timings as the new baseline')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as recording:
+        write_recording(recording, build_slate(4))
+        timings, leaks = measure(args.runs, recording)
+
+    baseline = {}
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH) as f:
+            baseline = json.load(f)
+
+    print(f"Cold start, best of {args.runs} (baseline: {os.path.relpath(BASELINE_PATH, ROOT)})\n")
+    print(f"  {'':<28} {'ms':>8} {'baseline':>10}")
+    failed = False
+    for name, micros in timings.items():
+        line = f"  {name:<28} {micros / 1e3:8.1f}"
+        if name in baseline:
+            line += f" {baseline[name] / 1e3:10.1f}"
+            if micros > baseline[name] * TOLERANCE + SLACK_US:
+                line += '   ✗ slower than baseline'
+                failed = True
+        if leaks[name]:
+            line += f"   ✗ imports {', '.join(sorted(leaks[name]))}"
+            failed = True
+        print(line)
+
+    if args.update:
+        with open(BASELINE_PATH, 'w') as f:
+            json.dump(timings, f, indent=2)
+            f.write('\n')
+        print("\n✓ Baseline updated")
+    elif failed:
+        print("\n✗ Startup regressed")
+        sys.exit(1)
+    else:
+        print("\n✓ No startup regressions")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+"""
+Benchmark: dict stat lines vs __slots__ stat records
+
+legacy_parse_all_players below is parse_all_players as it was when every
+stat line was a 15-key dict. Both versions parse the same synthetic
+season (default 285 games, ~20k player-game rows); the benchmark reports
+parse time, memory retained by the parsed rows (tracemalloc) and the time
+to score every row.
+
+Usage:
+    python -m benchmarks.bench_stat_records [--games 285]
+"""
+
+import argparse
+import gc
+import tracemalloc
+from typing import Dict
+
+from benchmarks.common import best_of, report
+from benchmarks.fixtures import build_slate
+from championship_matchup import ChampionshipMatchup
+
+
+def legacy_player_line(name: str, team_abbr: str, position: str) -> Dict:
+    return {
+        'name': name, 'team': team_abbr, 'position': position,
+        'passing_yards': 0, 'passing_tds': 0, 'passing_2pt': 0, 'interceptions': 0,
+        'rushing_yards': 0, 'rushing_tds': 0, 'rushing_2pt': 0,
+        'receptions': 0, 'receiving_yards': 0, 'receiving_tds': 0, 'receiving_2pt': 0,
+        'fumbles_lost': 0
+    }
+
+
+def legacy_parse_all_players(game_data: Dict) -> Dict[str, Dict]:
+    players_dict = {}
+    for team in game_data.get('boxscore', {}).get('players', []):
+        team_abbr = team.get('team', {}).get('abbreviation', 'UNK')
+        for stat_category in team.get('statistics', []):
+            category = stat_category.get('name', '').lower()
+            for athlete in stat_category.get('athletes', []):
+                athlete_info = athlete.get('athlete', {})
+                player_name = athlete_info.get('displayName', 'Unknown')
+                player_id = athlete_info.get('id', player_name)
+                position = athlete_info.get('position', {}).get('abbreviation', 'N/A')
+                stats_array = athlete.get('stats', [])
+                player_key = f"{team_abbr}_{player_id}"
+                if player_key not in players_dict:
+                    players_dict[player_key] = legacy_player_line(player_name, team_abbr, position)
+                player = players_dict[player_key]
+                try:
+                    if category == 'passing' and len(stats_array) >= 5:
+                        player['passing_yards'] += int(stats_array[1]) if stats_array[1] != '--' else 0
+                        player['passing_tds'] += int(stats_array[3]) if stats_array[3] != '--' else 0
+                        player['interceptions'] += int(stats_array[4]) if stats_array[4] != '--' else 0
+                    elif category == 'rushing' and len(stats_array) >= 4:
+                        player['rushing_yards'] += int(stats_array[1]) if stats_array[1] != '--' else 0
+                        player['rushing_tds'] += int(stats_array[3]) if stats_array[3] != '--' else 0
+                    elif category == 'receiving' and len(stats_array) >= 4:
+                        player['receptions'] += int(stats_array[0]) if stats_array[0] != '--' else 0
+                        player['receiving_yards'] += int(stats_array[1]) if stats_array[1] != '--' else 0
+                        player['receiving_tds'] += int(stats_array[3]) if stats_array[3] != '--' else 0
+                    elif category == 'fumbles' and len(stats_array) >= 2:
+                        player['fumbles_lost'] += int(stats_array[1]) if stats_array[1] != '--' else 0
+                except:
+                    pass
+    return players_dict
+
+
+def retained(fn) -> int:
+    """Bytes still allocated by fn's result after it returns"""
+    gc.collect()
+    tracemalloc.start()
+    result = fn()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Dict vs __slots__ stat lines')
+    parser.add_argument('--games', type=int, default=285)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    matchup = ChampionshipMatchup(cache_dir=None)
+    games = list(build_slate(args.games).values())
+
+    def parse_dicts():
+        return [row for game in games for row in legacy_parse_all_players(game).values()]
+
+    def parse_records():
+        return [row for game in games for row in matchup.parse_all_players(game).values()]
+
+    dict_rows, record_rows = parse_dicts(), parse_records()
+    assert dict_rows == record_rows, 'parsed stat lines differ'
+
+    print(f"{len(record_rows):,} offensive player-game rows from {len(games)} games\n")
+    base = best_of(parse_dicts, args.repeat, 1)
+    report('parse_all_players, dict rows', base)
+    report('parse_all_players, PlayerLine rows', best_of(parse_records, args.repeat, 1), base)
+
+    base = best_of(lambda: [matchup.calculate_fantasy_points(row) for row in dict_rows], args.repeat, 1)
+    report('score every row, dict rows', base)
+    report('score every row, PlayerLine rows',
+           best_of(lambda: [matchup.calculate_fantasy_points(row) for row in record_rows], args.repeat, 1), base)
+
+    dict_bytes, record_bytes = retained(parse_dicts), retained(parse_records)
+    print(f"\n  memory held by parsed rows: dicts {dict_bytes / 2**20:.2f} MiB, "
+          f"records {record_bytes / 2**20:.2f} MiB ({dict_bytes / record_bytes:.2f}x smaller)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""
+Benchmark suite: parsing, scoring and website generation over whole slates
+
+Runs entirely offline through data_sources.ReplaySource. By default each
+slate size is a synthetic recording (benchmarks.fixtures) of 1, 16 and 285
+games - a single game, a busy week and a full regular season plus
+playoffs. Pass --replay with a directory recorded by
+`generate_website_data.py --record DIR` to time real payloads instead.
+
+For every stage it reports the best time per run, throughput and the peak
+memory allocated while it runs (tracemalloc, measured in a separate run).
+
+Usage:
+    python -m benchmarks.bench_suite [--games 1,16,285] [--replay DIR]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import tracemalloc
+from typing import Callable, Dict, List
+
+from benchmarks.common import best_of
+from benchmarks.fixtures import build_slate, write_recording
+from championship_matchup import ChampionshipMatchup
+from data_sources import ReplaySource
+from generate_website_data import generate_website_json
+
+
+def peak_memory(fn: Callable) -> int:
+    """Peak bytes allocated by one call of fn"""
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def stages(matchup: ChampionshipMatchup, games: List[Dict], workdir: str) -> Dict[str, tuple]:
+    """name -> (fn, units processed per call, unit label)"""
+    lines = []
+    for game_data in games:
+        players, kickers, defenses = matchup.parse_game(game_data)
+        lines.extend(players.values())
+        lines.extend(kickers.values())
+        lines.extend(defenses.values())
+
+    output_file = os.path.join(workdir, 'championship_results.json')
+
+    def end_to_end():
+        # Remove the previous output so the change-detecting writer always writes
+        if os.path.exists(output_file):
+            os.remove(output_file)
+        with contextlib.redirect_stdout(io.StringIO()):
+            generate_website_json(matchup, output_file)
+
+    return {
+        'parse_all_players': (lambda: [matchup.parse_all_players(g) for g in games], len(games), 'games'),
+        'parse_kicker_stats': (lambda: [matchup.parse_kicker_stats(g) for g in games], len(games), 'games'),
+        'parse_defense_stats': (lambda: [matchup.parse_defense_stats(g) for g in games], len(games), 'games'),
+        'calculate_fantasy_points': (lambda: [matchup.calculate_fantasy_points(s) for s in lines],
+                                     len(lines), 'lines'),
+        'generate_website_json': (end_to_end, len(games), 'games'),
+    }
+
+
+def run(directory: str, label: str, repeat: int):
+    matchup = ChampionshipMatchup(source=ReplaySource(directory))
+    with contextlib.redirect_stdout(io.StringIO()):
+        events = matchup.fetch_playoff_games()
+    games = [g for g in matchup.fetch_game_stats_many(e.get('id') for e in events).values() if g]
+
+    print(f"\n{label}: {len(games)} games")
+    print(f"  {'stage':<28} {'ms/run':>10} {'throughput':>20} {'peak MiB':>10}")
+    with tempfile.TemporaryDirectory() as workdir:
+        for name, (fn, units, unit) in stages(matchup, games, workdir).items():
+            seconds = best_of(fn, repeat, 1)
+            peak = peak_memory(fn)
+            print(f"  {name:<28} {seconds * 1e3:10.2f} {units / seconds:>14,.0f} {unit}/s {peak / 2**20:10.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Offline parsing/scoring benchmark suite')
+    parser.add_argument('--games', default='1,16,285', help='comma-separated synthetic slate sizes')
+    parser.add_argument('--replay', metavar='DIR', help='recorded ESPN responses to time instead')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    if args.replay:
+        run(args.replay, f"recording {args.replay}", args.repeat)
+        return
+
+    for n in (int(size) for size in args.games.split(',')):
+        with tempfile.TemporaryDirectory() as directory:
+            write_recording(directory, build_slate(n))
+            run(directory, 'synthetic slate', args.repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark: full json.load vs summary_trim.load_summary
+
+Real summary payloads carry several MB of news, odds, win probability and
+video metadata the parsers never read. The synthetic game is padded with
+that kind of bulk up to --size-kb, then both loaders are timed and their
+peak allocation measured with tracemalloc, per game and for a batch of
+games held in memory at once (as during a season backfill).
+
+Usage:
+    python -m benchmarks.bench_summary_trim [--size-kb 1500] [--games 50] [--summary recorded.json]
+"""
+
+import argparse
+import io
+import json
+import tracemalloc
+
+from benchmarks.common import best_of, load_summary as load_recorded, report
+from benchmarks.fixtures import build_summary
+from summary_trim import load_summary, streaming_parser
+
+
+def padded_summary(size_kb: int) -> bytes:
+    """A synthetic summary with unused sections grown to roughly size_kb"""
+    document = build_summary('401700000', seed=1)
+    raw = json.dumps(document).encode()
+    videos = []
+    while len(raw) + len(json.dumps(videos)) < size_kb * 1024:
+        videos.extend({'id': len(videos), 'headline': 'Highlight', 'description': 'y' * 300,
+                       'links': {'source': {'href': 'https://example.com/v.mp4'}}} for _ in range(100))
+    document['videos'] = videos
+    document['odds'] = [{'provider': {'name': f"Book {i}"}, 'spread': -3.5, 'overUnder': 47.5} for i in range(20)]
+    return json.dumps(document).encode()
+
+
+def peak(fn) -> int:
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Full vs trimmed summary parsing')
+    parser.add_argument('--size-kb', type=int, default=1500)
+    parser.add_argument('--games', type=int, default=50, help='games held in memory at once')
+    parser.add_argument('--summary', help='recorded ESPN summary JSON (default: padded synthetic game)')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    recorded = load_recorded(args.summary)
+    raw = json.dumps(recorded).encode() if recorded else padded_summary(args.size_kb)
+
+    def full():
+        return json.load(io.BytesIO(raw))
+
+    def trimmed():
+        return load_summary(io.BytesIO(raw))
+
+    kept = len(json.dumps(trimmed()).encode())
+    print(f"Summary {len(raw) / 1024:,.0f} KB, trimmed {kept / 1024:,.0f} KB "
+          f"({'ijson streaming' if streaming_parser() else 'json.load + trim, ijson not installed'})\n")
+
+    base = best_of(full, args.repeat, 5)
+    report('json.load (whole document)', base)
+    report('load_summary', best_of(trimmed, args.repeat, 5), base)
+
+    print(f"\n  {'peak MiB':<40} {'1 game':>10} {f'{args.games} games':>12}")
+    for label, fn in (('json.load (whole document)', full), ('load_summary', trimmed)):
+        one = peak(fn)
+        many = peak(lambda: [fn() for _ in range(args.games)])
+        print(f"  {label:<40} {one / 2**20:10.2f} {many / 2**20:12.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark: Monte Carlo win probability per refresh
+
+Builds a slate with the championship rosters' teams in the third quarter,
+checks that a finished slate simulates to exactly the realized totals,
+then times MatchupSimulator.win_probability for several simulation counts
+in this process and across a process pool.
+
+Usage:
+    python -m benchmarks.bench_win_probability [--simulations 10000 100000 250000] [--workers 4]
+"""
+
+import argparse
+import copy
+import os
+
+from benchmarks.common import best_of, report
+from benchmarks.fixtures import build_summary
+from championship_matchup import ChampionshipMatchup
+from stat_store import SlateStats
+from win_probability import MatchupSimulator
+
+
+def live_slate(matchup: ChampionshipMatchup, period: int = 3, clock: float = 450.0):
+    """(stats, scoreboard games) for NE-DEN and SEA-LAR, both in progress"""
+    summaries = {
+        '401700001': build_summary('401700001', seed=1, home=('17', 'NE'), away=('7', 'DEN'), state='in'),
+        '401700002': build_summary('401700002', seed=2, home=('26', 'SEA'), away=('14', 'LAR'), state='in'),
+    }
+    stats = SlateStats()
+    games = []
+    for game_id, summary in summaries.items():
+        stats.add_game(*matchup.parse_game(summary), game_id=game_id)
+        competitions = copy.deepcopy(summary['header']['competitions'])
+        competitions[0]['status'].update(period=period, clock=clock)
+        games.append({'id': game_id, 'competitions': competitions})
+    return stats, games
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Monte Carlo win probability throughput')
+    parser.add_argument('--simulations', type=int, nargs='+', default=[10_000, 100_000, 250_000])
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    matchup = ChampionshipMatchup(cache_dir=None)
+    stats, games = live_slate(matchup)
+
+    # With every game over, each simulation is just the realized score
+    final_games = copy.deepcopy(games)
+    for game in final_games:
+        game['competitions'][0]['status']['type']['state'] = 'post'
+    result = MatchupSimulator(matchup, simulations=1000).win_probability(stats, final_games)
+    for i, team in enumerate((matchup.team1, matchup.team2), 1):
+        realized = round(sum(row['points'] for row in matchup.score_roster(team['roster'], stats)), 2)
+        assert result[f"team{i}"]['projected_points'] == realized, (result, realized)
+
+    slots = len(matchup.team1['roster']) + len(matchup.team2['roster'])
+    print(f"Win probability for {slots} roster slots, games in the 3rd quarter\n")
+    for simulations in args.simulations:
+        for workers in sorted({0, args.workers if args.workers > 1 else 0}):
+            simulator = MatchupSimulator(matchup, simulations=simulations, workers=workers)
+            simulator.win_probability(stats, games)  # start the pool outside the timing
+            seconds = best_of(lambda: simulator.win_probability(stats, games), args.repeat, 1)
+            simulator.close()
+            label = f"{simulations:,} sims, " + (f"{workers} processes" if workers else 'in process')
+            report(label, seconds)
+            print(f"  {'':<40} {simulations / seconds:13,.0f} sims/s")
+
+    result = MatchupSimulator(matchup).win_probability(stats, games)
+    print(f"\n  {result['team1']['name']}: {result['team1']['win_probability']:.1%}, "
+          f"{result['team2']['name']}: {result['team2']['win_probability']:.1%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""Timing helpers shared by the benchmark scripts"""
+
+import json
+import time
+from typing import Callable, Dict, List, Optional
+
+
+def best_of(fn: Callable, repeat: int = 5, number: int = 10) -> float:
+    """Best average seconds per call over `repeat` rounds of `number` calls"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def best_of_each(fns: List[Callable], repeat: int = 5, number: int = 10) -> List[float]:
+    """
+    best_of for several functions, alternating them round by round so that
+    load changes on a busy machine hit every one of them alike
+    """
+    best = [float('inf')] * len(fns)
+    for _ in range(repeat):
+        for i, fn in enumerate(fns):
+            start = time.perf_counter()
+            for _ in range(number):
+                fn()
+            best[i] = min(best[i], (time.perf_counter() - start) / number)
+    return best
+
+
+def load_summary(path: Optional[str]) -> Optional[Dict]:
+    """Load a recorded ESPN summary payload, if a path was given"""
+    if not path:
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def report(label: str, seconds: float, baseline: Optional[float] = None):
+    """Print one timing line, with the speedup against a baseline if given"""
+    line = f"  {label:<40} {seconds * 1e3:10.3f} ms"
+    if baseline:
+        line += f"   {baseline / seconds:6.2f}x"
+    print(line)
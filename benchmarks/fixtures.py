@@ -0,0 +1,284 @@
+"""
+Synthetic ESPN payloads for offline benchmarks
+
+build_summary() produces a summary document with the same shape as the
+ESPN `summary` endpoint (header, boxscore.players, drives.previous) and a
+realistic amount of data: full boxscore categories for both teams and
+~180 plays with the play-text formats the parsers look for. Output is
+deterministic for a given seed, so timings are comparable across runs.
+Use a recorded payload instead whenever one is available.
+"""
+
+import json
+import os
+import random
+from typing import Dict, List, Tuple
+
+TEAMS = [
+    ('17', 'NE'), ('26', 'SEA'), ('14', 'LAR'), ('7', 'DEN'), ('12', 'KC'), ('2', 'BUF'),
+    ('33', 'BAL'), ('21', 'PHI'), ('6', 'DAL'), ('25', 'SF'), ('8', 'DET'), ('9', 'GB'),
+    ('16', 'MIN'), ('3', 'CHI'), ('11', 'IND'), ('34', 'HOU'), ('30', 'JAX'), ('10', 'TEN'),
+    ('4', 'CIN'), ('5', 'CLE'), ('23', 'PIT'), ('15', 'MIA'), ('20', 'NYJ'), ('19', 'NYG'),
+    ('28', 'WSH'), ('1', 'ATL'), ('29', 'CAR'), ('18', 'NO'), ('27', 'TB'), ('22', 'ARI'),
+    ('24', 'LAC'), ('13', 'LV'),
+]
+
+FIRST_NAMES = ['Drake', 'Will', 'Jason', 'Kyren', 'Puka', 'Davante', 'Hunter', 'Kenneth', 'Courtland',
+               'Stefon', 'Colby', 'Matthew', 'Rhamondre', 'Jaxon', 'Derrick', 'Josh', 'Travis', 'Cooper',
+               'Tyler', 'Justin', 'Brandon', 'Marcus', 'Chris', 'Jalen', 'Devon', 'Amon', 'Garrett']
+LAST_NAMES = ['Maye', 'Lutz', 'Myers', 'Williams', 'Nacua', 'Adams', 'Henry', 'Walker', 'Sutton',
+              'Diggs', 'Parkinson', 'Stafford', 'Stevenson', 'Smith', 'Jones', 'Allen', 'Kelce', 'Kupp',
+              'Boyd', 'Tucker', 'Aubrey', 'Mathis', 'Olave', 'Hurts', 'Achane', 'Brown', 'Wilson']
+
+DEFENSE_POSITIONS = ['DE', 'DT', 'DT', 'DE', 'LB', 'LB', 'LB', 'CB', 'CB', 'S', 'S']
+
+
+def _abbrev(name: str) -> str:
+    """Play-by-play short name: 'Will Lutz' -> 'W.Lutz'"""
+    first, last = name.split(' ', 1)
+    return f"{first[0]}.{last.replace(' ', '')}"
+
+
+def _roster(rng: random.Random, team_id: str) -> Dict[str, List[Tuple[str, str, str]]]:
+    """Build (athlete_id, display_name, position) lists per role"""
+    roster = {}
+    base = int(team_id) * 1000
+    n = 0
+    for role, positions in [('QB', ['QB']), ('RB', ['RB', 'RB']), ('WR', ['WR', 'WR', 'WR']),
+                            ('TE', ['TE']), ('K', ['K']), ('P', ['P']), ('DEF', DEFENSE_POSITIONS)]:
+        roster[role] = []
+        for pos in positions:
+            n += 1
+            name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+            roster[role].append((str(base + n), name, pos))
+    return roster
+
+
+def _athlete(entry: Tuple[str, str, str], stats: List[str]) -> Dict:
+    athlete_id, name, pos = entry
+    return {
+        'athlete': {'id': athlete_id, 'uid': f"s:20~l:28~a:{athlete_id}", 'displayName': name,
+                    'shortName': _abbrev(name), 'position': {'abbreviation': pos}},
+        'stats': stats,
+    }
+
+
+def _team_boxscore(rng: random.Random, team: Tuple[str, str], roster: Dict) -> Dict:
+    team_id, abbr = team
+    qb = roster['QB'][0]
+    passing = [_athlete(qb, [f"{rng.randint(15, 30)}/{rng.randint(30, 45)}", str(rng.randint(150, 420)),
+                             '7.1', str(rng.randint(0, 4)), str(rng.randint(0, 2)), '2-14', '55.2', '98.4'])]
+    rushing = [_athlete(p, [str(rng.randint(2, 22)), str(rng.randint(-2, 150)), '4.2',
+                            str(rng.randint(0, 2)), '18'])
+               for p in roster['RB'] + roster['QB']]
+    receiving = [_athlete(p, [str(rng.randint(0, 9)), str(rng.randint(0, 140)), '11.0',
+                              str(rng.randint(0, 2)), '31', str(rng.randint(1, 12))])
+                 for p in roster['WR'] + roster['TE'] + roster['RB']]
+    fumbles = [_athlete(p, [str(f), str(rng.randint(0, f)), '0'])
+               for p in roster['RB'][:1] + roster['QB'] for f in [rng.randint(0, 1)]]
+    defensive = [_athlete(p, [str(rng.randint(0, 9)), str(rng.randint(0, 6)),
+                              rng.choice(['0', '0', '0.5', '1', '2']), '0', '1', '0', '0'])
+                 for p in roster['DEF']]
+    interceptions = [_athlete(p, ['1', str(rng.randint(0, 40)), rng.choice(['0', '0', '0', '1'])])
+                     for p in rng.sample(roster['DEF'][7:], rng.randint(0, 2))]
+    kicking = [_athlete(roster['K'][0], ['2/3', '66.7', '52', '3/3', '9'])]
+    punting = [_athlete(roster['P'][0], ['4', '180', '2', '45.0', '1', '52'])]
+
+    def category(name, labels, athletes):
+        return {'name': name, 'keys': [l.lower() for l in labels], 'labels': labels,
+                'descriptions': labels, 'athletes': athletes, 'totals': []}
+
+    return {
+        'team': {'id': team_id, 'abbreviation': abbr, 'displayName': f"{abbr} Team"},
+        'statistics': [
+            category('passing', ['C/ATT', 'YDS', 'AVG', 'TD', 'INT', 'SACKS', 'QBR', 'RTG'], passing),
+            category('rushing', ['CAR', 'YDS', 'AVG', 'TD', 'LONG'], rushing),
+            category('receiving', ['REC', 'YDS', 'AVG', 'TD', 'LONG', 'TGTS'], receiving),
+            category('fumbles', ['FUM', 'LOST', 'REC'], fumbles),
+            category('defensive', ['TOT', 'SOLO', 'SACKS', 'TFL', 'PD', 'QB HTS', 'TD'], defensive),
+            category('interceptions', ['INT', 'YDS', 'TD'], interceptions),
+            category('kicking', ['FG', 'PCT', 'LONG', 'XP', 'PTS'], kicking),
+            category('punting', ['NO', 'YDS', 'TB', 'AVG', 'In 20', 'LONG'], punting),
+        ],
+    }
+
+
+def _play(rng: random.Random, play_id: int, offense: Tuple[str, str], defense: Tuple[str, str],
+          off_roster: Dict, def_roster: Dict) -> Tuple[Dict, int]:
+    """One play dict and the points the offense scored on it"""
+    o_abbr, d_abbr = offense[1], defense[1]
+    qb = _abbrev(off_roster['QB'][0][1])
+    rb = _abbrev(rng.choice(off_roster['RB'])[1])
+    wr = _abbrev(rng.choice(off_roster['WR'] + off_roster['TE'])[1])
+    kicker = _abbrev(off_roster['K'][0][1])
+    punter = _abbrev(off_roster['P'][0][1])
+    tackler = _abbrev(rng.choice(def_roster['DEF'])[1])
+    returner = _abbrev(rng.choice(def_roster['WR'])[1])
+    yards = rng.randint(-3, 25)
+    spot = rng.randint(1, 49)
+    points = 0
+
+    roll = rng.random()
+    if roll < 0.38:
+        type_text = 'Pass Reception'
+        text = f"(Shotgun) {qb} pass short right to {wr} to {o_abbr} {spot} for {yards} yards ({tackler})."
+    elif roll < 0.45:
+        type_text = 'Pass Incompletion'
+        text = f"(Shotgun) {qb} pass incomplete deep left to {wr} ({tackler})."
+    elif roll < 0.75:
+        type_text = 'Rush'
+        text = f"{rb} up the middle to {o_abbr} {spot} for {yards} yards ({tackler})."
+    elif roll < 0.79:
+        type_text = 'Sack'
+        text = f"(Shotgun) {qb} sacked at {o_abbr} {spot} for -{rng.randint(2, 10)} yards ({tackler})."
+    elif roll < 0.84:
+        type_text = 'Punt'
+        if rng.random() < 0.15:
+            text = (f"{punter} punts {rng.randint(38, 55)} yards to {d_abbr} {spot}, Center-{tackler}. "
+                    f"{returner} MUFFS catch, RECOVERED by {o_abbr}-{wr} at {d_abbr} {spot}.")
+        else:
+            text = f"{punter} punts {rng.randint(38, 55)} yards to {d_abbr} {spot}, Center-{tackler}. {returner} to {d_abbr} {spot + 6} for 6 yards."
+    elif roll < 0.87:
+        type_text = 'Rush'
+        text = (f"{rb} left end to {o_abbr} {spot} for {yards} yards ({tackler}). FUMBLES ({tackler}), "
+                f"RECOVERED by {d_abbr}-{tackler} at {o_abbr} {spot}.")
+    elif roll < 0.92:
+        type_text = 'Field Goal Good'
+        distance = rng.randint(20, 58)
+        result = rng.choice(['is GOOD', 'is GOOD', 'is GOOD', 'is No Good, Wide Right', 'is BLOCKED'])
+        text = f"{kicker} {distance} yard field goal {result}, Center-{tackler}, Holder-{punter}."
+        if 'GOOD' in result and 'No Good' not in result:
+            points = 3
+        elif 'BLOCKED' in result:
+            type_text = 'Blocked Field Goal'
+        else:
+            type_text = 'Field Goal Missed'
+    elif roll < 0.96:
+        type_text = 'Passing Touchdown'
+        text = f"(Shotgun) {qb} pass deep left to {wr} for {spot} yards, TOUCHDOWN."
+        points = 6
+    elif roll < 0.98:
+        type_text = 'Kickoff'
+        text = f"{kicker} kicks 65 yards from {o_abbr} 35 to end zone, Touchback."
+    elif roll < 0.99:
+        type_text = 'Punt Return Touchdown'
+        text = f"{punter} punts 44 yards to {d_abbr} 20, Center-{tackler}. {returner} for 80 yards, TOUCHDOWN."
+    else:
+        type_text = 'Penalty'
+        text = f"PENALTY on {o_abbr}-{wr}, False Start, 5 yards, enforced at {o_abbr} {spot} - No Play."
+
+    play = {
+        'id': str(play_id),
+        'sequenceNumber': str(play_id),
+        'type': {'id': '0', 'text': type_text},
+        'text': text,
+        'awayScore': 0,
+        'homeScore': 0,
+        'period': {'number': 1},
+        'clock': {'displayValue': '10:00'},
+        'scoringPlay': points > 0,
+        'teamParticipants': [{'id': offense[0], 'order': 1, 'type': 'offense'},
+                             {'id': defense[0], 'order': 2, 'type': 'defense'}],
+        'start': {'down': 1, 'distance': 10, 'yardLine': spot, 'team': {'id': offense[0]}},
+        'end': {'down': 2, 'distance': 10 - yards, 'yardLine': spot + yards, 'team': {'id': offense[0]}},
+    }
+    return play, points
+
+
+def build_summary(game_id: str, seed: int = 0, home: Tuple[str, str] = None, away: Tuple[str, str] = None,
+                  n_drives: int = 22, plays_per_drive: int = 8, state: str = 'post') -> Dict:
+    """A deterministic ESPN-shaped summary document for one game"""
+    rng = random.Random(seed)
+    if home is None or away is None:
+        home, away = rng.sample(TEAMS, 2)
+    rosters = {home[1]: _roster(rng, home[0]), away[1]: _roster(rng, away[0])}
+    scores = {home[1]: 0, away[1]: 0}
+
+    drives = []
+    play_id = int(game_id) * 1000
+    for d in range(n_drives):
+        offense, defense = (home, away) if d % 2 == 0 else (away, home)
+        plays = []
+        for _ in range(plays_per_drive):
+            play_id += 1
+            play, points = _play(rng, play_id, offense, defense, rosters[offense[1]], rosters[defense[1]])
+            scores[offense[1]] += points
+            plays.append(play)
+            if points == 6:
+                play_id += 1
+                kicker = _abbrev(rosters[offense[1]]['K'][0][1])
+                result = 'is GOOD' if rng.random() < 0.95 else 'is No Good'
+                scores[offense[1]] += 1 if result == 'is GOOD' else 0
+                plays.append({**play, 'id': str(play_id), 'type': {'id': '0', 'text': 'Extra Point'},
+                              'text': f"{kicker} extra point {result}, Center-X.Long, Holder-Y.Hold.",
+                              'scoringPlay': result == 'is GOOD'})
+        drives.append({'id': f"{game_id}{d}", 'team': {'id': offense[0], 'abbreviation': offense[1]},
+                       'description': f"{len(plays)} plays", 'plays': plays})
+
+    competitors = [
+        {'id': home[0], 'homeAway': 'home', 'score': str(scores[home[1]]),
+         'team': {'id': home[0], 'abbreviation': home[1]}},
+        {'id': away[0], 'homeAway': 'away', 'score': str(scores[away[1]]),
+         'team': {'id': away[0], 'abbreviation': away[1]}},
+    ]
+    status = {'clock': 0.0, 'displayClock': '0:00', 'period': 4,
+              'type': {'state': state, 'completed': state == 'post',
+                       'description': {'pre': 'Scheduled', 'in': 'In Progress', 'post': 'Final'}[state]}}
+
+    return {
+        'header': {'id': game_id, 'competitions': [{'id': game_id, 'status': status, 'competitors': competitors}]},
+        'boxscore': {
+            'teams': [],
+            'players': [_team_boxscore(rng, t, rosters[t[1]]) for t in (away, home)],
+        },
+        'drives': {'previous': drives},
+        # Bulk the real endpoint carries that the parsers never read
+        'news': {'articles': [{'headline': f"Story {i}", 'description': 'x' * 400} for i in range(10)]},
+        'winprobability': [{'playId': str(i), 'homeWinPercentage': rng.random()} for i in range(180)],
+    }
+
+
+def build_slate(n_games: int, seed: int = 0) -> Dict[str, Dict]:
+    """Summaries for n_games games keyed by game id"""
+    slate = {}
+    for i in range(n_games):
+        game_id = str(401700000 + i)
+        home, away = TEAMS[(2 * i) % len(TEAMS)], TEAMS[(2 * i + 1) % len(TEAMS)]
+        slate[game_id] = build_summary(game_id, seed=seed + i, home=home, away=away)
+    return slate
+
+
+def write_recording(directory: str, slate: Dict[str, Dict]):
+    """Lay a slate out on disk the way data_sources.ReplaySource reads it"""
+    os.makedirs(os.path.join(directory, 'summary'), exist_ok=True)
+    events = [{'id': game_id, 'date': '2026-01-25T20:00Z', 'competitions': summary['header']['competitions']}
+              for game_id, summary in slate.items()]
+    with open(os.path.join(directory, 'scoreboard.json'), 'w') as f:
+        json.dump({'events': events}, f)
+    for game_id, summary in slate.items():
+        with open(os.path.join(directory, 'summary', f"{game_id}.json"), 'w') as f:
+            json.dump(summary, f)
+
+
+def write_season_recording(directory: str, season: int = 2025, weeks: int = 18, games_per_week: int = 16):
+    """Week-by-week scoreboards plus summaries, as recorded by a live backfill"""
+    from championship_matchup import ChampionshipMatchup
+    from data_sources import replay_path
+
+    write_recording(directory, {})
+    for week in range(1, weeks + 1):
+        slate = {}
+        for i in range(games_per_week):
+            game_id = str(401800000 + week * 100 + i)
+            home, away = TEAMS[(2 * i) % len(TEAMS)], TEAMS[(2 * i + 1) % len(TEAMS)]
+            slate[game_id] = build_summary(game_id, seed=week * 100 + i, home=home, away=away)
+        events = [{'id': game_id, 'date': '2025-09-07T17:00Z', 'season': {'year': season, 'type': 2},
+                   'week': {'number': week}, 'competitions': summary['header']['competitions']}
+                  for game_id, summary in slate.items()]
+        path = replay_path(directory, 'scoreboard', ChampionshipMatchup.scoreboard_params(season, 2, week))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump({'events': events}, f)
+        for game_id, summary in slate.items():
+            with open(os.path.join(directory, 'summary', f"{game_id}.json"), 'w') as f:
+                json.dump(summary, f)
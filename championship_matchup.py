@@ -12,17 +12,52 @@ Author: Jon Korsgard
 Date: February 2026
 """
 
-import requests
+import argparse
 import json
-from datetime import datetime
-from typing import Dict, List, Any
+import logging
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Any, Optional, Tuple
+
+import play_by_play
+from data_sources import ESPNSource
+from game_context import GameContext
+from metrics import METRICS
+from play_by_play import PlayEvent
+from player_index import PlayerIndex
+from scoring_rules import CompiledScoring
+from stat_records import DefenseLine, KickerLine, PlayerLine
+from stat_store import SlateStats
+
+logger = logging.getLogger(__name__)
+
+# D/ST stat each play-by-play event kind adds to
+DST_EVENT_FIELDS = {
+    play_by_play.FUMBLE_RECOVERY: 'fumble_recoveries',
+    play_by_play.MUFF_RECOVERY: 'fumble_recoveries',
+    play_by_play.BLOCKED_KICK: 'blocked_kicks',
+    play_by_play.RETURN_TD: 'return_tds',
+}
+
+
+def configure_logging(verbose: bool = False):
+    """Warnings only by default; verbose adds per-slot debug diagnostics"""
+    logging.basicConfig(level=logging.DEBUG if verbose else logging.WARNING,
+                        format='%(levelname)s %(name)s: %(message)s')
 
 
 class ChampionshipMatchup:
     """Calculate fantasy points for two teams from Championship weekend"""
     
-    def __init__(self):
-        self.base_url = "https://site.api.espn.com/apis/site/v2/sports/football/nfl"
+    def __init__(self, cache_dir: Optional[str] = '.espn_cache', settings_path: Optional[str] = None,
+                 source=None):
+        # Where scoreboard/summary JSON comes from: the live API by default, or
+        # any object with the same get_json (e.g. data_sources.ReplaySource)
+        self.source = source or ESPNSource(cache_dir)
+        self.max_workers = self.source.max_workers
+        self.cache = self.source.cache
         
         # Your league's CORRECT scoring rules
         self.scoring = {
@@ -69,6 +104,12 @@ class ChampionshipMatchup:
             'dst_return_td': 5,
         }
         
+        # Compile the rules once; a league settings file (JSON/TOML/YAML) replaces the table above
+        if settings_path:
+            self.rules = CompiledScoring.from_file(settings_path)
+        else:
+            self.rules = CompiledScoring.from_scoring_table(self.scoring, 'Championship League')
+        
         # Define the two teams
         self.team1 = {
             'name': "Jon Korsgard's Team",
@@ -100,200 +141,130 @@ class ChampionshipMatchup:
             ]
         }
     
-    def fetch_playoff_games(self) -> List[Dict]:
-        """Fetch Championship weekend games"""
-        print("Fetching Championship Weekend games...")
-        
-        url = f"{self.base_url}/scoreboard"
-        params = {
-            'dates': '20260125-20260126',
-            'seasontype': 3,
-            'limit': 100
-        }
+    @staticmethod
+    def is_final(competition: Dict) -> bool:
+        """True once a competition's status says the game is over"""
+        status_type = competition.get('status', {}).get('type', {})
+        return status_type.get('completed', False) or status_type.get('state') == 'post'
+    
+    @classmethod
+    def summary_final(cls, game_data: Dict) -> bool:
+        """True once a summary's own header says the game is over"""
+        competitions = game_data.get('header', {}).get('competitions', [])
+        return bool(competitions) and cls.is_final(competitions[0])
+    
+    @staticmethod
+    def scoreboard_params(dates=None, seasontype: Optional[int] = None, week: Optional[int] = None) -> Dict:
+        """
+        Scoreboard query for a date or date range ('20260125-20260126'),
+        or for one week of a season (dates=2025, seasontype=2, week=1).
+        Season types: 1 = preseason, 2 = regular season, 3 = postseason.
+        """
+        params = {'limit': 100}
+        if dates is not None:
+            params['dates'] = dates
+        if seasontype is not None:
+            params['seasontype'] = seasontype
+        if week is not None:
+            params['week'] = week
+        return params
+    
+    def fetch_scoreboard(self, params: Dict) -> Optional[List[Dict]]:
+        """Fetch the events for a scoreboard query, or None on failure"""
+        # A query for a fixed window can't change once every game in it is final
+        def all_final(body):
+            events = body.get('events', [])
+            return bool(events) and all(
+                self.is_final(comp) for event in events for comp in event.get('competitions', [])
+            )
         
         try:
-            response = requests.get(url, params=params, timeout=30)
-            if response.status_code == 200:
-                data = response.json()
-                events = data.get('events', [])
-                print(f"✓ Found {len(events)} games\n")
-                return events
+            status_code, data = self.source.get_json('scoreboard', params, pin_when=all_final)
+            if data is not None:
+                return data.get('events', [])
             else:
-                print(f"✗ API Error: {response.status_code}")
-                return []
+                print(f"✗ API Error: {status_code}")
+                METRICS.count('fetch_errors', endpoint='scoreboard')
+                return None
         except Exception as e:
             print(f"✗ Error: {str(e)}")
+            METRICS.count('fetch_errors', endpoint='scoreboard')
+            return None
+    
+    def fetch_playoff_games(self) -> List[Dict]:
+        """Fetch Championship weekend games"""
+        print("Fetching Championship Weekend games...")
+        
+        events = self.fetch_scoreboard(self.scoreboard_params('20260125-20260126', seasontype=3))
+        if events is None:
             return []
+        print(f"✓ Found {len(events)} games\n")
+        return events
     
     def fetch_game_stats(self, game_id: str) -> Dict:
         """Fetch detailed stats for a game"""
-        url = f"{self.base_url}/summary"
         params = {'event': game_id}
         
+        # Final games never change again, so pin them in the cache permanently
         try:
-            response = requests.get(url, params=params, timeout=30)
-            if response.status_code == 200:
-                return response.json()
-            return {}
+            status_code, data = self.source.get_json('summary', params, pin_when=self.summary_final)
+            if data is None:
+                METRICS.count('fetch_errors', endpoint='summary')
+            return data or {}
         except:
+            METRICS.count('fetch_errors', endpoint='summary')
             return {}
     
-    def calculate_fantasy_points(self, stats: Dict) -> float:
-        """Calculate fantasy points"""
-        points = 0.0
-        
-        # PASSING
-        pass_yds = stats.get('passing_yards', 0)
-        pass_tds = stats.get('passing_tds', 0)
-        pass_2pt = stats.get('passing_2pt', 0)
-        ints = stats.get('interceptions', 0)
-        
-        if pass_yds > 0 or pass_tds > 0:
-            points += pass_yds / self.scoring['passing_yards_per_point']
-            points += pass_tds * self.scoring['passing_td']
-            points += pass_2pt * self.scoring['passing_2pt']
-            points += ints * self.scoring['interception']
-            if 300 <= pass_yds < 400:
-                points += self.scoring['passing_bonus_300']
-            elif pass_yds >= 400:
-                points += self.scoring['passing_bonus_400']
-        
-        # RUSHING
-        rush_yds = stats.get('rushing_yards', 0)
-        rush_tds = stats.get('rushing_tds', 0)
-        rush_2pt = stats.get('rushing_2pt', 0)
-        
-        if rush_yds > 0 or rush_tds > 0:
-            points += rush_yds / self.scoring['rushing_yards_per_point']
-            points += rush_tds * self.scoring['rushing_td']
-            points += rush_2pt * self.scoring['rushing_2pt']
-            if 100 <= rush_yds < 200:
-                points += self.scoring['rushing_bonus_100']
-            elif rush_yds >= 200:
-                points += self.scoring['rushing_bonus_200']
-        
-        # RECEIVING
-        recs = stats.get('receptions', 0)
-        rec_yds = stats.get('receiving_yards', 0)
-        rec_tds = stats.get('receiving_tds', 0)
-        rec_2pt = stats.get('receiving_2pt', 0)
-        
-        if recs > 0 or rec_tds > 0:
-            points += recs * self.scoring['reception']
-            points += rec_yds / self.scoring['receiving_yards_per_point']
-            points += rec_tds * self.scoring['receiving_td']
-            points += rec_2pt * self.scoring['receiving_2pt']
-            if 100 <= rec_yds < 200:
-                points += self.scoring['receiving_bonus_100']
-            elif rec_yds >= 200:
-                points += self.scoring['receiving_bonus_200']
-        
-        # FUMBLES
-        fumbles = stats.get('fumbles_lost', 0)
-        points += fumbles * self.scoring['fumble_lost']
-        
-        # KICKING
-        pat_made = stats.get('pat_made', 0)
-        pat_missed = stats.get('pat_missed', 0)
-        fg_0_39 = stats.get('fg_0_39', 0)
-        fg_40_49 = stats.get('fg_40_49', 0)
-        fg_50_plus = stats.get('fg_50_plus', 0)
-        fg_miss_0_39 = stats.get('fg_miss_0_39', 0)
-        fg_miss_40_49 = stats.get('fg_miss_40_49', 0)
-        
-        points += pat_made * self.scoring['pat_made']
-        points += pat_missed * self.scoring['pat_missed']
-        points += fg_0_39 * self.scoring['fg_0_39']
-        points += fg_40_49 * self.scoring['fg_40_49']
-        points += fg_50_plus * self.scoring['fg_50_plus']
-        points += fg_miss_0_39 * self.scoring['fg_miss_0_39']
-        points += fg_miss_40_49 * self.scoring['fg_miss_40_49']
-        
-        # DEFENSE
-        points_allowed = stats.get('points_allowed', -1)
-        if points_allowed >= 0:
-            if points_allowed == 0:
-                points += self.scoring['dst_points_0']
-            elif 1 <= points_allowed <= 6:
-                points += self.scoring['dst_points_1_6']
-            elif 7 <= points_allowed <= 13:
-                points += self.scoring['dst_points_7_13']
-            elif 14 <= points_allowed <= 17:
-                points += self.scoring['dst_points_14_17']
-            elif 18 <= points_allowed <= 21:
-                points += self.scoring['dst_points_18_21']
-            elif 22 <= points_allowed <= 27:
-                points += self.scoring['dst_points_22_27']
-            elif 28 <= points_allowed <= 34:
-                points += self.scoring['dst_points_28_34']
-            elif 35 <= points_allowed <= 45:
-                points += self.scoring['dst_points_35_45']
-            else:
-                points += self.scoring['dst_points_46_plus']
-        
-        dst_sacks = stats.get('sacks', 0)
-        dst_ints = stats.get('defensive_interceptions', 0)
-        dst_fumbles = stats.get('fumble_recoveries', 0)
-        dst_safeties = stats.get('safeties', 0)
-        dst_blocked = stats.get('blocked_kicks', 0)
-        dst_return_tds = stats.get('return_tds', 0)
-        
-        points += dst_sacks * self.scoring['dst_sack']
-        points += dst_ints * self.scoring['dst_interception']
-        points += dst_fumbles * self.scoring['dst_fumble_recovery']
-        points += dst_safeties * self.scoring['dst_safety']
-        points += dst_blocked * self.scoring['dst_blocked_kick']
-        points += dst_return_tds * self.scoring['dst_return_td']
-        
-        return round(points, 2)
+    def fetch_game_stats_many(self, game_ids: Iterable[str]) -> Dict[str, Dict]:
+        """
+        Fetch detailed stats for several games concurrently.
+        Returns dict keyed by game id, in the order given. A game that fails
+        to download maps to {} just like fetch_game_stats.
+        """
+        game_ids = [game_id for game_id in game_ids if game_id]
+        if not game_ids:
+            return {}
+        
+        workers = min(self.max_workers, len(game_ids))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(self.fetch_game_stats, game_ids)
+            return dict(zip(game_ids, results))
+    
+    def calculate_fantasy_points(self, stats: Dict, rules: Optional[CompiledScoring] = None) -> float:
+        """Calculate fantasy points (with this league's rules unless others are given)"""
+        return (rules or self.rules).score(stats)
     
-    def parse_defense_stats(self, game_data: Dict) -> Dict[str, Dict]:
+    def calculate_fantasy_points_many(self, columns, rules: Optional[CompiledScoring] = None):
+        """
+        Vectorized calculate_fantasy_points over many rows at once.
+        Takes a dict of arrays (or NumPy structured array) keyed by stat name
+        and returns a NumPy array of points. Requires numpy.
+        """
+        from vectorized_scoring import score_columns
+        return score_columns(columns, rules or self.rules)
+    
+    def parse_defense_stats(self, game_data: Dict, events: Optional[List[PlayEvent]] = None,
+                            context: Optional[GameContext] = None) -> Dict[str, Dict]:
         """
         Parse defense/special teams statistics.
         Returns dict keyed by team abbreviation with D/ST stats.
+        Pass the game's play_by_play events and GameContext to avoid rescanning.
         """
         defense_stats = {}
         
-        # Get final scores for points allowed
-        header = game_data.get('header', {})
-        competitions = header.get('competitions', [])
-        if not competitions:
-            return defense_stats
-        
-        competitors = competitions[0].get('competitors', [])
+        if context is None:
+            context = GameContext(game_data)
         
-        # Build score lookup
-        scores = {}
-        for competitor in competitors:
-            team_abbr = competitor.get('team', {}).get('abbreviation', '')
-            score = int(competitor.get('score', 0))
-            scores[team_abbr] = score
+        # Points allowed needs the header's scores
+        if context.competition is None:
+            return defense_stats
         
         # Parse defensive stats from boxscore
-        boxscore = game_data.get('boxscore', {})
-        players_data = boxscore.get('players', [])
-        
-        for team in players_data:
-            team_info = team.get('team', {})
-            team_abbr = team_info.get('abbreviation', 'UNK')
-            
-            # Points allowed (opponent's score)
-            points_allowed = None
-            for abbr, score in scores.items():
-                if abbr != team_abbr:
-                    points_allowed = score
-                    break
-            
-            # Initialize defense stats
-            defense_stats[team_abbr] = {
-                'points_allowed': points_allowed if points_allowed is not None else 0,
-                'sacks': 0,
-                'defensive_interceptions': 0,
-                'fumble_recoveries': 0,
-                'safeties': 0,
-                'blocked_kicks': 0,
-                'return_tds': 0
-            }
+        for team_abbr, team in context.teams:
+            # Initialize defense stats (points allowed is the opponent's score)
+            defense = defense_stats[team_abbr] = DefenseLine(
+                points_allowed=context.points_allowed(team_abbr)
+            )
             
             # Sum defensive stats from all players
             statistics = team.get('statistics', [])
@@ -313,7 +284,7 @@ class ChampionshipMatchup:
                             if len(stats_array) > sacks_idx and stats_array[sacks_idx] != '--':
                                 try:
                                     sacks = float(stats_array[sacks_idx])
-                                    defense_stats[team_abbr]['sacks'] += sacks
+                                    defense.sacks += sacks
                                 except:
                                     pass
                 
@@ -326,7 +297,7 @@ class ChampionshipMatchup:
                         if len(stats_array) > 0 and stats_array[0] != '--':
                             try:
                                 ints = int(stats_array[0])
-                                defense_stats[team_abbr]['defensive_interceptions'] += ints
+                                defense.defensive_interceptions += ints
                             except:
                                 pass
                         
@@ -334,271 +305,117 @@ class ChampionshipMatchup:
                         if len(stats_array) > 2 and stats_array[2] != '--':
                             try:
                                 int_tds = int(stats_array[2])
-                                defense_stats[team_abbr]['return_tds'] += int_tds
+                                defense.return_tds += int_tds
                             except:
                                 pass
         
-        # Parse fumble recoveries and blocked kicks from play-by-play
-        import re
-        drives_data = game_data.get('drives', {})
-        previous_drives = drives_data.get('previous', [])
-        
-        for drive in previous_drives:
-            plays = drive.get('plays', [])
-            
-            for play in plays:
-                text = play.get('text', '')
-                text_lower = text.lower()
-                
-                # Look for fumble recoveries
-                if 'fumble' in text_lower and 'recovered by' in text_lower:
-                    # Extract team that recovered
-                    # Format: "FUMBLES (player) [player], RECOVERED by TEAM-Player"
-                    match = re.search(r'recovered by ([A-Z]{2,3})-', text, re.IGNORECASE)
-                    if match:
-                        recovering_team = match.group(1)
-                        if recovering_team in defense_stats:
-                            defense_stats[recovering_team]['fumble_recoveries'] += 1
-                
-                # Look for muffed punts/kicks recovered (also counts as fumble recovery)
-                if 'muff' in text_lower and 'recovered by' in text_lower:
-                    # Format: "X.Smith MUFFS catch, RECOVERED by SEA-D.Young"
-                    match = re.search(r'recovered by ([A-Z]{2,3})-', text, re.IGNORECASE)
-                    if match:
-                        recovering_team = match.group(1)
-                        if recovering_team in defense_stats:
-                            defense_stats[recovering_team]['fumble_recoveries'] += 1
-                
-                # Look for blocked kicks
-                if 'blocked' in text_lower and ('field goal' in text_lower or 'kick' in text_lower):
-                    # Check if this play has teamParticipants showing which team made the block
-                    team_participants = play.get('teamParticipants', [])
-                    
-                    # Look for the team with type="defense" (they made the block)
-                    for participant in team_participants:
-                        if participant.get('type') == 'defense':
-                            team_id = participant.get('id')
-                            
-                            # Find this team's abbreviation in boxscore
-                            blocking_team = None
-                            for team_data in players_data:
-                                team_info_check = team_data.get('team', {})
-                                if team_info_check.get('id') == team_id:
-                                    blocking_team = team_info_check.get('abbreviation')
-                                    break
-                            
-                            # Increment that team's blocked kicks
-                            if blocking_team and blocking_team in defense_stats:
-                                defense_stats[blocking_team]['blocked_kicks'] += 1
-                            break  # Only process first defense participant
-
+        # Fumble/muff recoveries, blocked kicks and return TDs from play-by-play
+        if events is None:
+            events = play_by_play.scan_plays(game_data, context)
+        
+        # Tally locally, then write each team's totals once
+        dst_counts = Counter()
+        for event in events:
+            field = DST_EVENT_FIELDS.get(event.kind)
+            if field:
+                dst_counts[event.team, field] += 1
+        for (team_abbr, field), hits in dst_counts.items():
+            defense = defense_stats.get(team_abbr)
+            if defense is not None:
+                setattr(defense, field, getattr(defense, field) + hits)
         
         return defense_stats
     
-    def parse_kicker_stats(self, game_data: Dict) -> Dict[str, Dict]:
-        """
-        Parse kicker statistics from play-by-play data.
-        Returns dict keyed by kicker name with their stats.
-        """
-        import re
-        
-        kicker_stats = {}
-        
-        # Get play-by-play from drives
-        drives_data = game_data.get('drives', {})
-        previous_drives = drives_data.get('previous', [])
-        
-        for drive in previous_drives:
-            plays = drive.get('plays', [])
-            
-            for play in plays:
-                text = play.get('text', '').lower()
-                
-                # Look for field goal attempts
-                if 'field goal' in text:
-                    # Extract kicker name (before "yard field goal")
-                    # Format: "W.Lutz 54 yard field goal is No Good"
-                    fg_match = re.search(r'([a-z]+\.[a-z]+)\s+(\d+)\s+yard\s+field\s+goal', text, re.IGNORECASE)
-                    
-                    if fg_match:
-                        kicker_name = fg_match.group(1)
-                        distance = int(fg_match.group(2))
-                        
-                        # Initialize kicker if not exists
-                        if kicker_name not in kicker_stats:
-                            kicker_stats[kicker_name] = {
-                                'pat_made': 0,
-                                'pat_missed': 0,
-                                'fg_0_39': 0,
-                                'fg_40_49': 0,
-                                'fg_50_plus': 0,
-                                'fg_miss_0_39': 0,
-                                'fg_miss_40_49': 0,
-                                'fg_miss_50_plus': 0
-                            }
-                        
-                        # Determine if made or missed
-                        is_good = 'is good' in text
-                        is_blocked = 'blocked' in text
-                        is_missed = 'no good' in text or 'missed' in text or is_blocked
-                        
-                        # Categorize by distance and result
-                        if is_good:
-                            if distance <= 39:
-                                kicker_stats[kicker_name]['fg_0_39'] += 1
-                            elif distance <= 49:
-                                kicker_stats[kicker_name]['fg_40_49'] += 1
-                            else:
-                                kicker_stats[kicker_name]['fg_50_plus'] += 1
-                        elif is_missed:
-                            if distance <= 39:
-                                kicker_stats[kicker_name]['fg_miss_0_39'] += 1
-                            elif distance <= 49:
-                                kicker_stats[kicker_name]['fg_miss_40_49'] += 1
-                            else:
-                                # No penalty for 50+ yard misses
-                                kicker_stats[kicker_name]['fg_miss_50_plus'] += 1
-                
-                # Look for extra points
-                elif 'extra point' in text:
-                    # Format: "W.Lutz extra point is GOOD"
-                    pat_match = re.search(r'([a-z]+\.[a-z]+)\s+extra\s+point', text, re.IGNORECASE)
-                    
-                    if pat_match:
-                        kicker_name = pat_match.group(1)
-                        
-                        # Initialize kicker if not exists
-                        if kicker_name not in kicker_stats:
-                            kicker_stats[kicker_name] = {
-                                'pat_made': 0,
-                                'pat_missed': 0,
-                                'fg_0_39': 0,
-                                'fg_40_49': 0,
-                                'fg_50_plus': 0,
-                                'fg_miss_0_39': 0,
-                                'fg_miss_40_49': 0,
-                                'fg_miss_50_plus': 0
-                            }
-                        
-                        # Check if made or missed
-                        is_good = 'is good' in text
-                        is_blocked = 'blocked' in text or 'no good' in text
-                        
-                        if is_good:
-                            kicker_stats[kicker_name]['pat_made'] += 1
-                        else:
-                            kicker_stats[kicker_name]['pat_missed'] += 1
-        
-        return kicker_stats
-    
-    def parse_kicker_stats(self, game_data: Dict) -> Dict[str, Dict]:
+    def parse_kicker_stats(self, game_data: Dict, events: Optional[List[PlayEvent]] = None,
+                           context: Optional[GameContext] = None) -> Dict[str, Dict]:
         """
         Parse kicker statistics from play-by-play data.
-        Returns dict keyed by kicker name with their stats.
+        Returns dict keyed by "TEAM_W.Lutz" (kicking team and play-by-play name).
+        Pass the game's play_by_play events to avoid rescanning the drives.
         """
         kickers = {}
         
-        # Get play-by-play data
-        drives_data = game_data.get('drives', {})
-        previous_drives = drives_data.get('previous', [])
+        if events is None:
+            events = play_by_play.scan_plays(game_data, context)
         
-        import re
-        
-        for drive in previous_drives:
-            plays = drive.get('plays', [])
+        for event in events:
+            if event.kind not in (play_by_play.FG_ATTEMPT, play_by_play.PAT):
+                continue
             
-            for play in plays:
-                text = play.get('text', '').lower()
-                
-                # Look for field goal attempts
-                if 'field goal' in text:
-                    # Extract kicker name (format: "Name yards field goal")
-                    # Example: "W.Lutz 54 yard field goal is No Good"
-                    name_match = re.search(r'([A-Z]\.[A-Za-z]+)', play.get('text', ''))
-                    if name_match:
-                        kicker_name = name_match.group(1)
-                        
-                        # Initialize kicker if not exists
-                        if kicker_name not in kickers:
-                            kickers[kicker_name] = {
-                                'name': kicker_name,
-                                'pat_made': 0,
-                                'pat_missed': 0,
-                                'fg_0_39': 0,
-                                'fg_40_49': 0,
-                                'fg_50_plus': 0,
-                                'fg_miss_0_39': 0,
-                                'fg_miss_40_49': 0,
-                                'fg_miss_50_plus': 0
-                            }
-                        
-                        # Extract distance
-                        dist_match = re.search(r'(\d+)\s*yard', text)
-                        if dist_match:
-                            distance = int(dist_match.group(1))
-                            
-                            # Check if made or missed
-                            is_good = 'is good' in text or kicker_name.lower() in text and 'is good' in text
-                            is_missed = 'no good' in text or 'missed' in text or 'blocked' in text
-                            
-                            # Categorize by distance and result
-                            if is_good:
-                                if distance <= 39:
-                                    kickers[kicker_name]['fg_0_39'] += 1
-                                elif 40 <= distance <= 49:
-                                    kickers[kicker_name]['fg_40_49'] += 1
-                                else:  # 50+
-                                    kickers[kicker_name]['fg_50_plus'] += 1
-                            elif is_missed:
-                                if distance <= 39:
-                                    kickers[kicker_name]['fg_miss_0_39'] += 1
-                                elif 40 <= distance <= 49:
-                                    kickers[kicker_name]['fg_miss_40_49'] += 1
-                                else:  # 50+
-                                    kickers[kicker_name]['fg_miss_50_plus'] += 1
-                
-                # Look for extra points
-                elif 'extra point' in text:
-                    # Format: "W.Lutz extra point is GOOD"
-                    # Need to find name directly before "extra point"
-                    pat_match = re.search(r'([A-Z]\.[A-Za-z]+)\s+extra\s+point', play.get('text', ''))
-                    
-                    if pat_match:
-                        kicker_name = pat_match.group(1)
-                        
-                        if kicker_name not in kickers:
-                            kickers[kicker_name] = {
-                                'name': kicker_name,
-                                'pat_made': 0,
-                                'pat_missed': 0,
-                                'fg_0_39': 0,
-                                'fg_40_49': 0,
-                                'fg_50_plus': 0,
-                                'fg_miss_0_39': 0,
-                                'fg_miss_40_49': 0,
-                                'fg_miss_50_plus': 0
-                            }
-                        
-                        if 'is good' in text:
-                            kickers[kicker_name]['pat_made'] += 1
-                        elif 'no good' in text or 'missed' in text or 'blocked' in text:
-                            kickers[kicker_name]['pat_missed'] += 1
+            # Keyed by team like players, so two "B.Smith" kickers stay apart
+            team_abbr = event.team or 'UNK'
+            kicker_key = f"{team_abbr}_{event.kicker}"
+            kicker = kickers.get(kicker_key)
+            if kicker is None:
+                # Exact distances let leagues with other FG buckets score the same parse
+                kicker = kickers[kicker_key] = KickerLine(
+                    name=event.kicker, team=team_abbr, fg_made_distances=[], fg_missed_distances=[]
+                )
+            
+            if event.kind == play_by_play.PAT:
+                if event.result == play_by_play.GOOD:
+                    kicker.pat_made += 1
+                elif event.result == play_by_play.MISSED:
+                    kicker.pat_missed += 1
+                continue
+            
+            # Field goal: categorize by distance and result
+            if event.distance is None or event.result is None:
+                continue
+            if event.result == play_by_play.GOOD:
+                if event.distance <= 39:
+                    kicker.fg_0_39 += 1
+                elif event.distance <= 49:
+                    kicker.fg_40_49 += 1
+                else:  # 50+
+                    kicker.fg_50_plus += 1
+                kicker.fg_made_distances.append(event.distance)
+            else:
+                if event.distance <= 39:
+                    kicker.fg_miss_0_39 += 1
+                elif event.distance <= 49:
+                    kicker.fg_miss_40_49 += 1
+                else:  # 50+
+                    kicker.fg_miss_50_plus += 1
+                kicker.fg_missed_distances.append(event.distance)
         
         return kickers
     
-    def parse_all_players(self, game_data: Dict) -> Dict[str, Dict]:
+    @staticmethod
+    def new_player_line(name: str, team_abbr: str, position: str) -> PlayerLine:
+        """Zeroed offensive stat line for one player"""
+        return PlayerLine(name, team_abbr, position)
+    
+    @staticmethod
+    def apply_boxscore_row(player: PlayerLine, category: str, stats_array: List[str]):
+        """Add one box-score category row (e.g. 'passing') to a player's stat line"""
+        try:
+            if category == 'passing' and len(stats_array) >= 5:
+                # CORRECT INDICES: Index 1=YDS, Index 3=TD, Index 4=INT
+                player.passing_yards += int(stats_array[1]) if stats_array[1] != '--' else 0
+                player.passing_tds += int(stats_array[3]) if stats_array[3] != '--' else 0
+                player.interceptions += int(stats_array[4]) if stats_array[4] != '--' else 0
+            elif category == 'rushing' and len(stats_array) >= 4:
+                player.rushing_yards += int(stats_array[1]) if stats_array[1] != '--' else 0
+                player.rushing_tds += int(stats_array[3]) if stats_array[3] != '--' else 0
+            elif category == 'receiving' and len(stats_array) >= 4:
+                player.receptions += int(stats_array[0]) if stats_array[0] != '--' else 0
+                player.receiving_yards += int(stats_array[1]) if stats_array[1] != '--' else 0
+                player.receiving_tds += int(stats_array[3]) if stats_array[3] != '--' else 0
+            elif category == 'fumbles' and len(stats_array) >= 2:
+                # ADDED: Parse fumbles lost
+                player.fumbles_lost += int(stats_array[1]) if stats_array[1] != '--' else 0
+        except:
+            pass
+    
+    def parse_all_players(self, game_data: Dict, context: Optional[GameContext] = None) -> Dict[str, Dict]:
         """Parse all players and return dictionary by name"""
         players_dict = {}
         
-        boxscore = game_data.get('boxscore', {})
-        if not boxscore:
-            return players_dict
-        
-        players_data = boxscore.get('players', [])
+        if context is None:
+            context = GameContext(game_data)
         
-        for team in players_data:
-            team_info = team.get('team', {})
-            team_abbr = team_info.get('abbreviation', 'UNK')
+        for team_abbr, team in context.teams:
             statistics = team.get('statistics', [])
             
             for stat_category in statistics:
@@ -615,103 +432,216 @@ class ChampionshipMatchup:
                     player_key = f"{team_abbr}_{player_id}"
                     
                     if player_key not in players_dict:
-                        players_dict[player_key] = {
-                            'name': player_name,
-                            'team': team_abbr,
-                            'position': position,
-                            'passing_yards': 0,
-                            'passing_tds': 0,
-                            'passing_2pt': 0,
-                            'interceptions': 0,
-                            'rushing_yards': 0,
-                            'rushing_tds': 0,
-                            'rushing_2pt': 0,
-                            'receptions': 0,
-                            'receiving_yards': 0,
-                            'receiving_tds': 0,
-                            'receiving_2pt': 0,
-                            'fumbles_lost': 0
-                        }
+                        players_dict[player_key] = self.new_player_line(player_name, team_abbr, position)
                     
-                    try:
-                        if category == 'passing' and len(stats_array) >= 5:
-                            # CORRECT INDICES: Index 1=YDS, Index 3=TD, Index 4=INT
-                            players_dict[player_key]['passing_yards'] += int(stats_array[1]) if stats_array[1] != '--' else 0
-                            players_dict[player_key]['passing_tds'] += int(stats_array[3]) if stats_array[3] != '--' else 0
-                            players_dict[player_key]['interceptions'] += int(stats_array[4]) if stats_array[4] != '--' else 0
-                        elif category == 'rushing' and len(stats_array) >= 4:
-                            players_dict[player_key]['rushing_yards'] += int(stats_array[1]) if stats_array[1] != '--' else 0
-                            players_dict[player_key]['rushing_tds'] += int(stats_array[3]) if stats_array[3] != '--' else 0
-                        elif category == 'receiving' and len(stats_array) >= 4:
-                            players_dict[player_key]['receptions'] += int(stats_array[0]) if stats_array[0] != '--' else 0
-                            players_dict[player_key]['receiving_yards'] += int(stats_array[1]) if stats_array[1] != '--' else 0
-                            players_dict[player_key]['receiving_tds'] += int(stats_array[3]) if stats_array[3] != '--' else 0
-                        elif category == 'fumbles' and len(stats_array) >= 2:
-                            # ADDED: Parse fumbles lost
-                            players_dict[player_key]['fumbles_lost'] += int(stats_array[1]) if stats_array[1] != '--' else 0
-                    except:
-                        continue
+                    self.apply_boxscore_row(players_dict[player_key], category, stats_array)
         
         return players_dict
     
-    def find_player(self, player_name: str, team_abbr: str, all_players: Dict) -> Dict:
+    def parse_game(self, game_data: Dict) -> Tuple[Dict[str, Dict], Dict[str, Dict], Dict[str, Dict]]:
+        """
+        Parse one game summary into (players, kickers, defenses).
+        The header and boxscore are indexed once into a GameContext, and the
+        play-by-play is scanned once; both are shared by every parser.
+        """
+        context = GameContext(game_data)
+        with METRICS.stage('play_by_play'):
+            events = play_by_play.scan_plays(game_data, context)
+        with METRICS.stage('parse_players'):
+            players = self.parse_all_players(game_data, context)
+        with METRICS.stage('parse_kickers'):
+            kickers = self.parse_kicker_stats(game_data, events)
+        with METRICS.stage('parse_defenses'):
+            defenses = self.parse_defense_stats(game_data, events, context)
+        METRICS.count('games_parsed')
+        return players, kickers, defenses
+    
+    def build_index(self, all_players: Dict, all_kickers: Optional[Dict] = None) -> PlayerIndex:
+        """Build the name lookup index once per slate"""
+        return PlayerIndex(all_players, all_kickers)
+    
+    def report_ambiguous(self, index: PlayerIndex):
+        """Print lookups that matched more than one athlete"""
+        for name, candidates in index.ambiguous:
+            print(f"⚠ Ambiguous match for {name}: {', '.join(candidates)}")
+    
+    def find_player(self, player_name: str, team_abbr: str, all_players: Dict,
+                    index: Optional[PlayerIndex] = None) -> Dict:
         """Find a player in the all_players dictionary"""
-        # Try exact match first
-        for key, player in all_players.items():
-            if player['name'] == player_name and player['team'] == team_abbr:
-                return player
+        # Pass a prebuilt index when resolving a whole roster
+        if index is None:
+            index = self.build_index(all_players)
         
-        # Try partial match
-        for key, player in all_players.items():
-            if player_name.lower() in player['name'].lower() and player['team'] == team_abbr:
-                return player
+        player_key = self.find_player_key(player_name, team_abbr, index)
+        if player_key is not None:
+            return index.players[player_key]
         
         # Return empty player
-        return {
-            'name': player_name,
-            'team': team_abbr,
-            'position': 'N/A',
-            'passing_yards': 0,
-            'passing_tds': 0,
-            'passing_2pt': 0,
-            'interceptions': 0,
-            'rushing_yards': 0,
-            'rushing_tds': 0,
-            'rushing_2pt': 0,
-            'receptions': 0,
-            'receiving_yards': 0,
-            'receiving_tds': 0,
-            'receiving_2pt': 0,
-            'fumbles_lost': 0
-        }
+        return self.new_player_line(player_name, team_abbr, 'N/A')
+    
+    @staticmethod
+    def find_player_key(player_name: str, team_abbr: str, index: PlayerIndex) -> Optional[str]:
+        """Key of the player's stat line ("TEAM_athleteid"), or None"""
+        result = index.find_player(player_name, team_abbr)
+        return result.candidates[0] if result.record is not None else None
     
-    def find_kicker(self, player_name: str, all_kickers: Dict) -> Dict:
+    def find_kicker(self, player_name: str, team_abbr: str, all_kickers: Dict,
+                    index: Optional[PlayerIndex] = None) -> Dict:
         """Find a kicker in the kicker stats dictionary"""
-        # Kickers are stored with format "W.Lutz" in play-by-play
-        # Try to match last name
-        last_name = player_name.split()[-1].lower()
+        # Kickers are stored as "TEAM_W.Lutz", named as in the play-by-play
+        if index is None:
+            index = self.build_index({}, all_kickers)
         
-        for kicker_key, stats in all_kickers.items():
-            if last_name in kicker_key.lower():
-                return stats.copy()
+        kicker_key = self.find_kicker_key(player_name, team_abbr, index)
+        if kicker_key is not None:
+            return index.kickers[kicker_key].copy()
         
         # Return empty kicker stats
-        return {
-            'pat_made': 0,
-            'pat_missed': 0,
-            'fg_0_39': 0,
-            'fg_40_49': 0,
-            'fg_50_plus': 0,
-            'fg_miss_0_39': 0,
-            'fg_miss_40_49': 0,
-            'fg_miss_50_plus': 0
-        }
+        return KickerLine()
+    
+    @staticmethod
+    def find_kicker_key(player_name: str, team_abbr: str, index: PlayerIndex) -> Optional[str]:
+        """Key of the kicker's stat line ("TEAM_W.Lutz"), or None"""
+        result = index.find_kicker(player_name, team_abbr)
+        return result.candidates[0] if result.record is not None else None
+    
+    def collect_stats(self, games: List[Dict], live=None, stats: Optional[SlateStats] = None) -> SlateStats:
+        """
+        Fetch and parse every game on the slate once into a shared stat store.
+        With a live_state.LiveSlate, each game is parsed incrementally against
+        what was seen on the previous refresh. Passing the previous SlateStats
+        updates it in place, game by game.
+        
+        The scoreboard's game states decide which summaries are fetched:
+        scheduled games have no stats yet and are skipped, games in progress
+        are always fetched, and a final game is fetched until its final
+        summary has been parsed into stats (later refreshes keep those lines).
+        Its summary is pinned in the response cache, so other runs read it from
+        disk. Skipped games and pinned reads count as summary_fetches_avoided.
+        """
+        stats = stats if stats is not None else SlateStats()
+        
+        game_ids = []
+        avoided = {'not_started': 0, 'final_parsed': 0, 'final_cached': 0}
+        for event in games:
+            game_id = event.get('id')
+            if not game_id:
+                continue
+            competition = (event.get('competitions') or [{}])[0]
+            if self.is_final(competition) and game_id in stats.final_games:
+                avoided['final_parsed'] += 1
+            elif competition.get('status', {}).get('type', {}).get('state') == 'pre':
+                avoided['not_started'] += 1
+            else:
+                game_ids.append(game_id)
+        
+        pinned = METRICS.value('cache_hits', endpoint='summary', kind='pinned')
+        with METRICS.stage('fetch'):
+            game_stats = self.fetch_game_stats_many(game_ids)
+        avoided['final_cached'] = int(METRICS.value('cache_hits', endpoint='summary', kind='pinned') - pinned)
+        
+        for reason, count in avoided.items():
+            if count:
+                METRICS.count('summary_fetches_avoided', count, reason=reason)
+        if any(avoided.values()):
+            reasons = ', '.join(f"{count} {label}" for label, count in zip(
+                ('not started', 'final already parsed', 'final from cache'), avoided.values()) if count)
+            print(f"✓ Requested {len(game_ids) - avoided['final_cached']} of {len(games)} game summaries "
+                  f"({sum(avoided.values())} avoided: {reasons})")
+        
+        for game_id, game_data in game_stats.items():
+            if not game_data:
+                continue
+            if live is not None:
+                stats.replace_game(game_id, *live.update(self, game_id, game_data))
+            else:
+                # Offensive players from the boxscore, kickers and defenses
+                # from one shared pass over the play-by-play
+                stats.replace_game(game_id, *self.parse_game(game_data))
+            if self.summary_final(game_data):
+                stats.final_games.add(game_id)
+        
+        if live is not None:
+            live.prune(event.get('id') for event in games)
+            live.save()
+        return stats
+    
+    def roster_slot_key(self, player_name: str, roster_pos: str, team_abbr: str,
+                        stats: SlateStats) -> Tuple[str, Optional[str]]:
+        """(kind, key) of a roster slot's stat lines in a SlateStats; key is None if not found"""
+        if 'D/ST' in player_name or 'DST' in player_name:
+            return 'defense', team_abbr
+        if roster_pos == 'K':
+            return 'kicker', self.find_kicker_key(player_name, team_abbr, stats.index)
+        return 'player', self.find_player_key(player_name, team_abbr, stats.index)
+    
+    def score_roster(self, roster: List[Tuple[str, str, str]], stats: SlateStats,
+                     rules: Optional[CompiledScoring] = None) -> List[Dict]:
+        """Look up and score every roster slot against the slate's stats"""
+        results = []
+        for player_name, roster_pos, team_abbr in roster:
+            logger.debug("slot name=%s pos=%s team=%s", player_name, roster_pos, team_abbr)
+            
+            kind, key = self.roster_slot_key(player_name, roster_pos, team_abbr, stats)
+            found = key in stats.defenses if kind == 'defense' else key is not None
+            METRICS.count('lookups', kind=kind, result='hit' if found else 'miss')
+            if not found:
+                # Usually why a rostered player shows 0 points
+                METRICS.count('lookup_misses', kind=kind, name=player_name, team=team_abbr)
+                logger.debug("lookup miss kind=%s name=%s team=%s", kind, player_name, team_abbr)
+            
+            if kind == 'defense':
+                # Handle defense - look up actual stats
+                if team_abbr in stats.defenses:
+                    player_stats = stats.defenses[team_abbr].copy()
+                    player_stats['name'] = player_name
+                    player_stats['team'] = team_abbr
+                    player_stats['position'] = 'D/ST'
+                else:
+                    # Team didn't play: no points_allowed, so no points-allowed tier
+                    player_stats = DefenseLine(name=player_name, team=team_abbr, position='D/ST')
+            elif kind == 'kicker':
+                # Handle kicker - look up in kicker stats
+                player_stats = stats.kickers[key].copy() if key is not None else KickerLine()
+                player_stats['name'] = player_name
+                player_stats['team'] = team_abbr
+                player_stats['position'] = 'K'
+            elif key is not None:
+                player_stats = stats.players[key]
+            else:
+                player_stats = self.new_player_line(player_name, team_abbr, 'N/A')
+            
+            # Score each game separately and add them up, so per-game rules
+            # (yardage bonuses, points-allowed tiers) hold across multi-game slates
+            fantasy_points = stats.entity_points(kind, key, lambda line: self.calculate_fantasy_points(line, rules))
+            if fantasy_points is None:
+                fantasy_points = self.calculate_fantasy_points(player_stats, rules)
+            
+            # D/ST breakdown; the guard skips building the arguments unless debugging
+            if roster_pos == 'D/ST' and logger.isEnabledFor(logging.DEBUG):
+                logger.debug("dst name=%s points_allowed=%s sacks=%s interceptions=%s fumble_recoveries=%s "
+                             "blocked_kicks=%s return_tds=%s points=%s", player_name,
+                             *(player_stats.get(stat, 'N/A') for stat in (
+                                 'points_allowed', 'sacks', 'defensive_interceptions', 'fumble_recoveries',
+                                 'blocked_kicks', 'return_tds')),
+                             fantasy_points)
+            
+            results.append({
+                'name': player_name,
+                'roster_pos': roster_pos,
+                'team': team_abbr,
+                'points': fantasy_points,
+                'stats': player_stats
+            })
+        
+        return results
     
     def display_team_results(self, team_data: Dict, team_results: List[Dict]):
-        """Display fantasy results for a team"""
-        print(f"\n{'='*80}")
-        print(f"{team_data['name']} - CHAMPIONSHIP WEEKEND RESULTS")
-        print(f"{'='*80}\n")
+        """Display fantasy results for a team (written to stdout in one go)"""
+        lines = []
+        lines.append(f"\n{'='*80}")
+        lines.append(f"{team_data['name']} - CHAMPIONSHIP WEEKEND RESULTS")
+        lines.append(f"{'='*80}\n")
         
         total_points = 0.0
         
@@ -724,15 +654,15 @@ class ChampionshipMatchup:
             
             total_points += pts
             
-            print(f"{i}. {name} ({pos}, {team}) - {pts} pts")
+            lines.append(f"{i}. {name} ({pos}, {team}) - {pts} pts")
             
             # Show relevant stats (check if keys exist first)
             if stats.get('passing_yards', 0) > 0:
-                print(f"   Passing: {stats.get('passing_yards', 0)} yds, {stats.get('passing_tds', 0)} TD, {stats.get('interceptions', 0)} INT")
+                lines.append(f"   Passing: {stats.get('passing_yards', 0)} yds, {stats.get('passing_tds', 0)} TD, {stats.get('interceptions', 0)} INT")
             if stats.get('rushing_yards', 0) > 0:
-                print(f"   Rushing: {stats.get('rushing_yards', 0)} yds, {stats.get('rushing_tds', 0)} TD")
+                lines.append(f"   Rushing: {stats.get('rushing_yards', 0)} yds, {stats.get('rushing_tds', 0)} TD")
             if stats.get('receptions', 0) > 0:
-                print(f"   Receiving: {stats.get('receptions', 0)} rec, {stats.get('receiving_yards', 0)} yds, {stats.get('receiving_tds', 0)} TD")
+                lines.append(f"   Receiving: {stats.get('receptions', 0)} rec, {stats.get('receiving_yards', 0)} yds, {stats.get('receiving_tds', 0)} TD")
             
             # Show defense stats
             if pos == 'D/ST' or stats.get('position') == 'D/ST':
@@ -742,14 +672,14 @@ class ChampionshipMatchup:
                 fum_rec = stats.get('fumble_recoveries', 0)
                 ret_tds = stats.get('return_tds', 0)
                 
-                print(f"   Points Allowed: {pa}")
-                print(f"   Sacks: {sacks}, INTs: {ints}, Fumbles Recovered: {fum_rec}")
+                lines.append(f"   Points Allowed: {pa}")
+                lines.append(f"   Sacks: {sacks}, INTs: {ints}, Fumbles Recovered: {fum_rec}")
                 if ret_tds > 0:
-                    print(f"   Return TDs: {ret_tds}")
+                    lines.append(f"   Return TDs: {ret_tds}")
             
             # Show offense D/ST stats (for backwards compatibility)
             elif stats.get('points_allowed', -1) >= 0:
-                print(f"   Defense: {stats.get('points_allowed', 0)} pts allowed, {stats.get('sacks', 0)} sacks")
+                lines.append(f"   Defense: {stats.get('points_allowed', 0)} pts allowed, {stats.get('sacks', 0)} sacks")
             
             # Show kicker stats
             if pos == 'K':
@@ -759,25 +689,26 @@ class ChampionshipMatchup:
                 pat_miss = stats.get('pat_missed', 0)
                 
                 if fg_made > 0 or fg_miss > 0 or pat_made > 0:
-                    print(f"   FG: {fg_made}/{fg_made + fg_miss}, XP: {pat_made}/{pat_made + pat_miss}")
+                    lines.append(f"   FG: {fg_made}/{fg_made + fg_miss}, XP: {pat_made}/{pat_made + pat_miss}")
                     if stats.get('fg_0_39', 0) > 0:
-                        print(f"     0-39 yds: {stats['fg_0_39']} made")
+                        lines.append(f"     0-39 yds: {stats['fg_0_39']} made")
                     if stats.get('fg_40_49', 0) > 0:
-                        print(f"     40-49 yds: {stats['fg_40_49']} made")
+                        lines.append(f"     40-49 yds: {stats['fg_40_49']} made")
                     if stats.get('fg_50_plus', 0) > 0:
-                        print(f"     50+ yds: {stats['fg_50_plus']} made")
+                        lines.append(f"     50+ yds: {stats['fg_50_plus']} made")
                     if stats.get('fg_miss_0_39', 0) > 0:
-                        print(f"     0-39 yds: {stats['fg_miss_0_39']} missed (-3 pts each)")
+                        lines.append(f"     0-39 yds: {stats['fg_miss_0_39']} missed (-3 pts each)")
                     if stats.get('fg_miss_40_49', 0) > 0:
-                        print(f"     40-49 yds: {stats['fg_miss_40_49']} missed (-2 pts each)")
+                        lines.append(f"     40-49 yds: {stats['fg_miss_40_49']} missed (-2 pts each)")
                     if stats.get('fg_miss_50_plus', 0) > 0:
-                        print(f"     50+ yds: {stats['fg_miss_50_plus']} missed (0 pts)")
+                        lines.append(f"     50+ yds: {stats['fg_miss_50_plus']} missed (0 pts)")
             
-            print()
+            lines.append('')
         
-        print(f"{'='*80}")
-        print(f"TOTAL POINTS: {total_points}")
-        print(f"{'='*80}\n")
+        lines.append(f"{'='*80}")
+        lines.append(f"TOTAL POINTS: {total_points}")
+        lines.append(f"{'='*80}\n")
+        print('\n'.join(lines))
         
         return total_points
     
@@ -796,138 +727,17 @@ class ChampionshipMatchup:
             return
         
         # Collect all player stats, kicker stats, and defense stats
-        all_players = {}
-        all_kickers = {}
-        all_defenses = {}
+        stats = self.collect_stats(games)
         
-        for event in games:
-            game_id = event.get('id')
-            game_data = self.fetch_game_stats(game_id)
-            if game_data:
-                # Get offensive player stats
-                players = self.parse_all_players(game_data)
-                all_players.update(players)
-                
-                # Get kicker stats from play-by-play
-                kickers = self.parse_kicker_stats(game_data)
-                all_kickers.update(kickers)
-                
-                # Get defense stats
-                defenses = self.parse_defense_stats(game_data)
-                all_defenses.update(defenses)
-        
-        print(f"\n✓ Parsed {len(all_players)} offensive players")
-        print(f"✓ Parsed {len(all_kickers)} kickers from play-by-play")
-        print(f"✓ Parsed {len(all_defenses)} defenses\n")
-        
-        # Calculate Team 1 results
-        team1_results = []
-        print("\n[DEBUG] Processing Team 1 roster...")
-        for player_name, roster_pos, team_abbr in self.team1['roster']:
-            print(f"[DEBUG] Processing: {player_name} ({roster_pos}, {team_abbr})")
-            
-            if 'D/ST' in player_name or 'DST' in player_name:
-                # Handle defense - look up actual stats
-                if team_abbr in all_defenses:
-                    player_stats = all_defenses[team_abbr].copy()
-                    player_stats['name'] = player_name
-                    player_stats['team'] = team_abbr
-                    player_stats['position'] = 'D/ST'
-                else:
-                    player_stats = {
-                        'name': player_name,
-                        'team': team_abbr,
-                        'position': 'D/ST',
-                        'points_allowed': 0,
-                        'sacks': 0,
-                        'defensive_interceptions': 0,
-                        'fumble_recoveries': 0,
-                        'safeties': 0,
-                        'blocked_kicks': 0,
-                        'return_tds': 0
-                    }
-            elif roster_pos == 'K':
-                # Handle kicker - look up in kicker stats
-                player_stats = self.find_kicker(player_name, all_kickers)
-                player_stats['name'] = player_name
-                player_stats['team'] = team_abbr
-                player_stats['position'] = 'K'
-            else:
-                player_stats = self.find_player(player_name, team_abbr, all_players)
-            
-            fantasy_points = self.calculate_fantasy_points(player_stats)
-            
-            # Debug output for D/ST
-            if roster_pos == 'D/ST':
-                print(f"\n[DEBUG] {player_name} stats being calculated:")
-                print(f"  Points Allowed: {player_stats.get('points_allowed', 'N/A')}")
-                print(f"  Sacks: {player_stats.get('sacks', 'N/A')}")
-                print(f"  INTs: {player_stats.get('defensive_interceptions', 'N/A')}")
-                print(f"  Fumbles: {player_stats.get('fumble_recoveries', 'N/A')}")
-                print(f"  Blocked Kicks: {player_stats.get('blocked_kicks', 'N/A')}")
-                print(f"  Return TDs: {player_stats.get('return_tds', 'N/A')}")
-                print(f"  Calculated Points: {fantasy_points}\n")
-            
-            team1_results.append({
-                'name': player_name,
-                'roster_pos': roster_pos,
-                'team': team_abbr,
-                'points': fantasy_points,
-                'stats': player_stats
-            })
+        print(f"\n✓ Parsed {len(stats.players)} offensive players")
+        print(f"✓ Parsed {len(stats.kickers)} kickers from play-by-play")
+        print(f"✓ Parsed {len(stats.defenses)} defenses\n")
         
-        # Calculate Team 2 results
-        team2_results = []
-        for player_name, roster_pos, team_abbr in self.team2['roster']:
-            if 'D/ST' in player_name or 'DST' in player_name:
-                # Handle defense - look up actual stats
-                if team_abbr in all_defenses:
-                    player_stats = all_defenses[team_abbr].copy()
-                    player_stats['name'] = player_name
-                    player_stats['team'] = team_abbr
-                    player_stats['position'] = 'D/ST'
-                else:
-                    player_stats = {
-                        'name': player_name,
-                        'team': team_abbr,
-                        'position': 'D/ST',
-                        'points_allowed': 0,
-                        'sacks': 0,
-                        'defensive_interceptions': 0,
-                        'fumble_recoveries': 0,
-                        'safeties': 0,
-                        'blocked_kicks': 0,
-                        'return_tds': 0
-                    }
-            elif roster_pos == 'K':
-                # Handle kicker - look up in kicker stats
-                player_stats = self.find_kicker(player_name, all_kickers)
-                player_stats['name'] = player_name
-                player_stats['team'] = team_abbr
-                player_stats['position'] = 'K'
-            else:
-                player_stats = self.find_player(player_name, team_abbr, all_players)
-            
-            fantasy_points = self.calculate_fantasy_points(player_stats)
-            
-            # Debug output for D/ST
-            if roster_pos == 'D/ST':
-                print(f"\n[DEBUG] {player_name} stats being calculated:")
-                print(f"  Points Allowed: {player_stats.get('points_allowed', 'N/A')}")
-                print(f"  Sacks: {player_stats.get('sacks', 'N/A')}")
-                print(f"  INTs: {player_stats.get('defensive_interceptions', 'N/A')}")
-                print(f"  Fumbles: {player_stats.get('fumble_recoveries', 'N/A')}")
-                print(f"  Blocked Kicks: {player_stats.get('blocked_kicks', 'N/A')}")
-                print(f"  Return TDs: {player_stats.get('return_tds', 'N/A')}")
-                print(f"  Calculated Points: {fantasy_points}\n")
-            
-            team2_results.append({
-                'name': player_name,
-                'roster_pos': roster_pos,
-                'team': team_abbr,
-                'points': fantasy_points,
-                'stats': player_stats
-            })
+        # Calculate results for both teams
+        team1_results = self.score_roster(self.team1['roster'], stats)
+        team2_results = self.score_roster(self.team2['roster'], stats)
+        
+        self.report_ambiguous(stats.index)
         
         # Display results
         team1_total = self.display_team_results(self.team1, team1_results)
@@ -948,11 +758,117 @@ class ChampionshipMatchup:
         else:
             print(f"\n🤝 TIE GAME!")
         print()
+    
+    @staticmethod
+    def poll_interval(games: List[Dict], live_interval: float, idle_interval: float) -> float:
+        """
+        Seconds to wait before the next scoreboard poll: live_interval while any
+        game is in progress, otherwise idle_interval, shortened so the first
+        poll after a scheduled kickoff happens within live_interval of it.
+        """
+        states = [comp.get('status', {}).get('type', {}).get('state')
+                  for event in games for comp in event.get('competitions', [])]
+        if 'in' in states:
+            return live_interval
+        
+        wait = idle_interval
+        now = datetime.now(timezone.utc)
+        for event in games:
+            competition = (event.get('competitions') or [{}])[0]
+            if competition.get('status', {}).get('type', {}).get('state') != 'pre':
+                continue
+            try:
+                kickoff = datetime.fromisoformat(event.get('date', '').replace('Z', '+00:00'))
+            except ValueError:
+                continue
+            wait = min(wait, max((kickoff - now).total_seconds(), live_interval))
+        return wait
+    
+    def refresh(self, live, stats: SlateStats, simulator=None) -> Tuple[List[Dict], Optional[Dict]]:
+        """
+        One poll of the scoreboard: update stats in place from new plays and
+        box-score rows, then score both rosters.
+        Returns (games, website data); data is None when there are no games.
+        """
+        from generate_website_data import build_website_data
+        
+        games = self.fetch_playoff_games()
+        if not games:
+            return games, None
+        return games, build_website_data(self, self.collect_stats(games, live, stats), games, simulator)
+    
+    def watch(self, output_file: str = 'championship_results.json',
+              live_interval: float = 30, idle_interval: float = 900,
+              simulations: int = 100000, simulation_workers: int = 0):
+        """
+        Stay resident and keep championship_results.json current.
+        Parse state lives in memory between polls, so each poll only processes
+        new plays and changed box-score rows, and the file is rewritten only
+        when the scored results change. While games are live, each refresh also
+        simulates the rest of the slate for win probabilities. Each poll's stage
+        timings and counters go to championship_metrics.json.
+        """
+        # Imported here so the one-shot matchup run doesn't need the website module
+        from generate_website_data import make_simulator, metrics_path, write_results
+        from live_state import LiveSlate
+        
+        live = LiveSlate()
+        stats = SlateStats()
+        simulator = make_simulator(self, simulations, simulation_workers)
+        print(f"Watching scoreboard (every {live_interval:g}s while live, up to {idle_interval:g}s when idle)")
+        
+        try:
+            while True:
+                METRICS.reset()
+                games, data = self.refresh(live, stats, simulator)
+                if data is not None:
+                    if write_results(data, output_file):
+                        print(f"✓ Updated {output_file}: {data['team1']['name']} {data['team1']['total_points']:.2f}"
+                              f" - {data['team2']['total_points']:.2f} {data['team2']['name']}")
+                METRICS.write(metrics_path(output_file))
+                
+                wait = self.poll_interval(games, live_interval, idle_interval)
+                print(f"  next poll in {wait:.0f}s")
+                time.sleep(wait)
+        except KeyboardInterrupt:
+            print("\nStopped watching")
+        finally:
+            if simulator is not None:
+                simulator.close()
 
 
 def main():
+    parser = argparse.ArgumentParser(description='NFL championship fantasy matchup')
+    parser.add_argument('-v', '--verbose', action='store_true', help='log per-slot lookup and scoring details')
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.add_parser('run', help='print the matchup once (default)')
+    watch_parser = subparsers.add_parser('watch', help='keep championship_results.json updated')
+    watch_parser.add_argument('-o', '--output', default='championship_results.json', help='results file to write')
+    serve_parser = subparsers.add_parser('serve', help='serve the website and push score changes over SSE')
+    serve_parser.add_argument('--host', default='127.0.0.1', help='address to listen on')
+    serve_parser.add_argument('--port', type=int, default=8000, help='port to listen on')
+    for subparser in (watch_parser, serve_parser):
+        subparser.add_argument('--live-interval', type=float, default=30,
+                               help='seconds between polls while a game is in progress')
+        subparser.add_argument('--idle-interval', type=float, default=900,
+                               help='longest wait between polls when no game is in progress')
+        subparser.add_argument('--simulations', type=int, default=100000,
+                               help='win probability simulations per refresh while games are live (0 to skip)')
+        subparser.add_argument('--simulation-workers', type=int, default=0,
+                               help='processes to spread the simulations over (0 = in process)')
+    args = parser.parse_args()
+    configure_logging(args.verbose)
+    
     matchup = ChampionshipMatchup()
-    matchup.run_matchup()
+    if args.command == 'watch':
+        matchup.watch(args.output, args.live_interval, args.idle_interval,
+                      args.simulations, args.simulation_workers)
+    elif args.command == 'serve':
+        from live_server import serve
+        serve(matchup, args.host, args.port, args.live_interval, args.idle_interval,
+              args.simulations, args.simulation_workers)
+    else:
+        matchup.run_matchup()
 
 
 if __name__ == '__main__':
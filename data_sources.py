@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Where ChampionshipMatchup gets its ESPN JSON from
+
+ESPNSource talks to the live API through one pooled session and the
+on-disk response cache. Given a record_dir it also saves every body it
+receives, laid out the way ReplaySource reads them back:
+
+    <dir>/scoreboard/<query>.json     e.g. dates=20260125-20260126_limit=100_seasontype=3.json
+    <dir>/scoreboard.json             fallback used for any scoreboard query
+    <dir>/summary/<event id>.json
+
+ReplaySource serves a recorded directory with no network access at all,
+which makes parsing and scoring reproducible and benchmarkable offline.
+Both expose get_json(endpoint, params, pin_when) -> (status_code, body).
+
+Summary documents are trimmed (summary_trim) to the subtrees the parsers
+use - streamed with ijson off the network when installed - so the cache
+and recordings hold the trimmed form too. Pass
+trim_summaries=False to keep whole documents.
+"""
+
+import json
+import os
+import tempfile
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from metrics import METRICS
+from response_cache import ResponseCache
+from summary_trim import load_summary, trim_summary
+
+ESPN_BASE_URL = "https://site.api.espn.com/apis/site/v2/sports/football/nfl"
+
+
+def replay_path(directory: str, endpoint: str, params: Optional[Dict]) -> str:
+    """File a recorded response for endpoint + params lives in"""
+    params = params or {}
+    if endpoint == 'summary' and 'event' in params:
+        return os.path.join(directory, 'summary', f"{params['event']}.json")
+    query = '_'.join(f"{key}={value}" for key, value in sorted(params.items())) or 'index'
+    return os.path.join(directory, endpoint, f"{query}.json")
+
+
+class ESPNSource:
+    """The live ESPN site API, with conditional-request caching and optional recording"""
+
+    def __init__(self, cache_dir: Optional[str] = '.espn_cache', max_workers: int = 8,
+                 record_dir: Optional[str] = None, base_url: str = ESPN_BASE_URL,
+                 trim_summaries: bool = True):
+        self.base_url = base_url
+        self.record_dir = record_dir
+        self.trim_summaries = trim_summaries
+
+        self.max_workers = max_workers
+        self._session = None
+        self._session_lock = threading.Lock()
+
+        # Conditional-request cache for scoreboard/summary payloads (None disables it)
+        self.cache = ResponseCache(cache_dir) if cache_dir else None
+
+    @property
+    def session(self):
+        """
+        One keep-alive session shared by every request (and every worker
+        thread in fetch_game_stats_many) so connections get reused. requests
+        is only imported here, so runs served entirely from pinned cache
+        entries never load the HTTP stack.
+        """
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    import requests
+
+                    session = requests.Session()
+                    adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=self.max_workers)
+                    session.mount('https://', adapter)
+                    session.mount('http://', adapter)
+                    self._session = session
+        return self._session
+
+    def get_json(self, endpoint: str, params: Dict, pin_when=None) -> Tuple[int, Optional[Any]]:
+        """
+        GET a JSON document through the response cache.
+        Pinned entries are returned without touching the network; otherwise the
+        request carries the cached validators and a 304 reuses the cached body.
+        pin_when(body) decides whether a fresh body can be pinned for good.
+        Returns (status_code, body) where body is None on failure.
+        """
+        url = f"{self.base_url}/{endpoint}"
+        entry = self.cache.load(url, params) if self.cache else None
+        if entry and entry.get('pinned'):
+            METRICS.count('cache_hits', endpoint=endpoint, kind='pinned')
+            self.record(endpoint, params, entry['body'])
+            return 200, entry['body']
+
+        headers = ResponseCache.conditional_headers(entry)
+        trim = self.trim_summaries and endpoint == 'summary'
+        with METRICS.stage('http'):
+            response = self.session.get(url, params=params, headers=headers, timeout=30, stream=trim)
+        METRICS.count('http_requests', endpoint=endpoint, status=response.status_code)
+
+        if response.status_code == 304 and entry:
+            # A streamed response holds its connection until closed
+            response.close()
+            METRICS.count('cache_hits', endpoint=endpoint, kind='not_modified')
+            self.record(endpoint, params, entry['body'])
+            return 304, entry['body']
+        if response.status_code != 200:
+            response.close()
+            return response.status_code, None
+
+        # For streamed summaries this includes reading the body off the socket
+        with METRICS.stage('decode'):
+            if trim:
+                # Parse straight off the socket, keeping only what the parsers read
+                response.raw.decode_content = True
+                with response:
+                    body = load_summary(response.raw)
+                    size = response.raw.tell()
+            else:
+                body = response.json()
+                size = len(response.content)
+        METRICS.count('bytes_fetched', size, endpoint=endpoint)
+        if self.cache:
+            self.cache.store(
+                url, params, body,
+                etag=response.headers.get('ETag'),
+                last_modified=response.headers.get('Last-Modified'),
+                pinned=bool(pin_when and pin_when(body)),
+            )
+        self.record(endpoint, params, body)
+        return 200, body
+
+    def record(self, endpoint: str, params: Dict, body: Any):
+        """Save a body under record_dir for later replay (no-op when not recording)"""
+        if not self.record_dir:
+            return
+        path = replay_path(self.record_dir, endpoint, params)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(body, f)
+        os.replace(tmp_path, path)
+
+
+class ReplaySource:
+    """Recorded scoreboard/summary JSON served from a local directory"""
+
+    def __init__(self, directory: str, max_workers: int = 8):
+        if not os.path.isdir(directory):
+            raise FileNotFoundError(f"Replay directory not found: {directory}")
+        self.directory = directory
+        self.max_workers = max_workers
+        self.cache = None
+
+    def get_json(self, endpoint: str, params: Dict, pin_when=None) -> Tuple[int, Optional[Any]]:
+        """Same contract as ESPNSource.get_json; a missing recording is a 404"""
+        for path in (replay_path(self.directory, endpoint, params),
+                     os.path.join(self.directory, f"{endpoint}.json")):
+            if os.path.exists(path):
+                with METRICS.stage('decode'), open(path) as f:
+                    body = json.load(f)
+                METRICS.count('bytes_read', os.path.getsize(path), endpoint=endpoint)
+                # Local files are read one at a time, so a plain load + trim is
+                # cheaper than streaming and keeps the same memory profile afterwards
+                return 200, trim_summary(body) if endpoint == 'summary' else body
+        return 404, None
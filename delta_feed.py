@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Delta feed - a versioned manifest plus JSON Patch deltas for the website
+
+Instead of re-downloading the whole results document on every load, the
+website reads a small manifest and applies the patches between the version
+it already has and the current one. Everything except the manifest is
+named after content hashes, so a file never changes once written and can be
+cached by the browser and any CDN indefinitely.
+
+Layout (feed/ next to championship_results.json):
+
+    manifest.json                  current version, its snapshot, recent patches
+    snapshot.<version>.json        the full document at that version
+    patch.<from>.<to>.json         RFC 6902 JSON Patch from one version to the next
+
+A version is the first 16 hex digits of the document's content_hash. The
+manifest lists the last HISTORY patches in order as one chain; a client
+applies every patch from the last one starting at its version. A client
+older than the chain, or whose patches would add up to more bytes than the
+snapshot, fetches the snapshot instead.
+"""
+
+import json
+import os
+import tempfile
+from typing import Dict, List, Optional
+
+MANIFEST = 'manifest.json'
+
+# Patches listed in the manifest (it grows by ~70 bytes per entry); clients
+# further behind than this fall back to the snapshot
+HISTORY = 8
+
+
+def version_id(content_hash: str) -> str:
+    """Short, filename-friendly version of a results content hash"""
+    return content_hash[:16]
+
+
+def patch_name(from_version: str, to_version: str) -> str:
+    return f"patch.{from_version}.{to_version}.json"
+
+
+def _pointer(path: str, key) -> str:
+    """Append one reference token to a JSON Pointer (RFC 6901 escaping)"""
+    return f"{path}/{str(key).replace('~', '~0').replace('/', '~1')}"
+
+
+def diff(old, new, path: str = '') -> List[Dict]:
+    """
+    JSON Patch operations that turn old into new.
+    Objects are compared key by key and arrays index by index (appends and
+    truncations at the end become add/remove), so a changed score touches
+    only the values that moved rather than the whole document.
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops = []
+        for key in old:
+            if key not in new:
+                ops.append({'op': 'remove', 'path': _pointer(path, key)})
+        for key, value in new.items():
+            if key not in old:
+                ops.append({'op': 'add', 'path': _pointer(path, key), 'value': value})
+            else:
+                ops.extend(diff(old[key], value, _pointer(path, key)))
+        return ops
+
+    if isinstance(old, list) and isinstance(new, list):
+        ops = []
+        for i in range(min(len(old), len(new))):
+            ops.extend(diff(old[i], new[i], _pointer(path, i)))
+        for i in range(len(old), len(new)):
+            ops.append({'op': 'add', 'path': _pointer(path, i), 'value': new[i]})
+        # Remove from the end so earlier indices stay valid
+        for i in range(len(old) - 1, len(new) - 1, -1):
+            ops.append({'op': 'remove', 'path': _pointer(path, i)})
+        return ops
+
+    # type() check keeps 1 -> 1.0 and True -> 1 as changes, since they serialize differently
+    if type(old) is not type(new) or old != new:
+        return [{'op': 'replace', 'path': path, 'value': new}]
+    return []
+
+
+def apply_patch(document, patch: List[Dict]):
+    """Apply add/remove/replace operations (as produced by diff) to a copy of document"""
+    document = json.loads(json.dumps(document))
+    for op in patch:
+        tokens = [token.replace('~1', '/').replace('~0', '~') for token in op['path'].split('/')[1:]]
+        if not tokens:
+            document = op['value']
+            continue
+
+        parent = document
+        for token in tokens[:-1]:
+            parent = parent[int(token) if isinstance(parent, list) else token]
+        key = tokens[-1]
+        if isinstance(parent, list):
+            index = len(parent) if key == '-' else int(key)
+            if op['op'] == 'add':
+                parent.insert(index, op['value'])
+            elif op['op'] == 'remove':
+                del parent[index]
+            else:
+                parent[index] = op['value']
+        elif op['op'] == 'remove':
+            del parent[key]
+        else:
+            parent[key] = op['value']
+    return document
+
+
+def _write_atomic(path: str, text: str):
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.feed.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(text)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _write_once(path: str, text: str):
+    """
+    Write a content-addressed file unless it is already there. A version that
+    comes back (A -> B -> A) keeps its existing file, so it isn't rewritten
+    and re-committed and its cached copies stay valid (its generated_at,
+    which the content hash leaves out, stays that of its first publish).
+    """
+    if not os.path.exists(path):
+        _write_atomic(path, text)
+
+
+def _compact(value) -> str:
+    return json.dumps(value, separators=(',', ':'))
+
+
+def _load(path: str) -> Optional[Dict]:
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def publish(data: Dict, directory: str, history: int = HISTORY) -> bool:
+    """
+    Publish data (which must carry its content_hash) as the feed's newest version.
+    Writes the snapshot, the patch from the previous version, then the manifest
+    last, so a client never sees a manifest pointing at a missing file. Returns
+    False if the feed already serves this version.
+    """
+    os.makedirs(directory, exist_ok=True)
+    manifest_path = os.path.join(directory, MANIFEST)
+    manifest = _load(manifest_path) or {}
+    version = version_id(data['content_hash'])
+    if manifest.get('version') == version:
+        return False
+
+    snapshot = f"snapshot.{version}.json"
+    snapshot_text = _compact(data)
+    _write_once(os.path.join(directory, snapshot), snapshot_text)
+
+    patches = manifest.get('patches', [])
+    previous = _load(os.path.join(directory, manifest['snapshot'])) if manifest.get('snapshot') else None
+    if previous is None:
+        # No previous document to diff against: start a new chain
+        patches = []
+    else:
+        name = patch_name(manifest['version'], version)
+        patch_text = _compact(diff(previous, data))
+        _write_once(os.path.join(directory, name), patch_text)
+        patches.append({'from': manifest['version'], 'to': version, 'bytes': len(patch_text)})
+    patches = patches[-history:]
+
+    # Compact: this is the one file every client re-requests on every refresh
+    _write_atomic(manifest_path, _compact({
+        'version': version,
+        'generated_at': data.get('generated_at'),
+        'snapshot': snapshot,
+        'snapshot_bytes': len(snapshot_text),
+        'patches': patches,
+    }))
+
+    # Keep the previous snapshot for clients that read the old manifest a moment ago
+    keep = {MANIFEST, snapshot, *(patch_name(entry['from'], entry['to']) for entry in patches)}
+    if manifest.get('snapshot'):
+        keep.add(manifest['snapshot'])
+    for name in os.listdir(directory):
+        if name.startswith(('snapshot.', 'patch.')) and name.endswith('.json') and name not in keep:
+            os.unlink(os.path.join(directory, name))
+    return True
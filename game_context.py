@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Per-game lookups shared by the player, kicker and D/ST parsers
+
+A GameContext is built once per summary payload. It walks `header` and
+`boxscore.players` a single time for the team blocks, the ESPN team id ->
+abbreviation map that play-by-play uses to credit blocks and return TDs,
+the score of each team and its opponent. parse_game and LiveGameState.update
+build one and hand it to every parser, instead of each parser re-walking
+the same sections.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+
+class GameContext:
+    """Teams, id map, scores and opponents of one game summary"""
+
+    __slots__ = ('competition', 'teams', 'id_to_abbr', 'scores', 'opponents')
+
+    def __init__(self, game_data: Dict):
+        competitions = game_data.get('header', {}).get('competitions', [])
+        self.competition: Optional[Dict] = competitions[0] if competitions else None
+
+        # Final (or current) score per team, in header order
+        self.scores: Dict[str, int] = {}
+        for competitor in (self.competition or {}).get('competitors', []):
+            self.scores[competitor.get('team', {}).get('abbreviation', '')] = int(competitor.get('score', 0))
+        self.opponents: Dict[str, str] = {
+            abbr: next((other for other in self.scores if other != abbr), None) for abbr in self.scores
+        }
+
+        # Box-score team blocks with their abbreviation, and the id map for play-by-play
+        self.teams: List[Tuple[str, Dict]] = []
+        self.id_to_abbr: Dict[str, str] = {}
+        for team in game_data.get('boxscore', {}).get('players', []):
+            team_info = team.get('team', {})
+            self.teams.append((team_info.get('abbreviation', 'UNK'), team))
+            if team_info.get('id') is not None:
+                self.id_to_abbr[team_info['id']] = team_info.get('abbreviation')
+
+    def points_allowed(self, team_abbr: str) -> int:
+        """The opponent's score, or 0 if the header has none"""
+        opponent = self.opponents.get(team_abbr)
+        if opponent is None:
+            # Not in the header (e.g. 'UNK'): the first other team listed
+            opponent = next((abbr for abbr in self.scores if abbr != team_abbr), None)
+        return self.scores[opponent] if opponent is not None else 0
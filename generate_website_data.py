@@ -4,9 +4,17 @@ Generate JSON data file for the NFL Playoff Fantasy Tracker website
 This script outputs championship_results.json that the website reads
 """
 
+import argparse
+import hashlib
 import json
+import os
+import tempfile
 from datetime import datetime
-from championship_matchup import ChampionshipMatchup
+from championship_matchup import ChampionshipMatchup, configure_logging
+import delta_feed
+from data_sources import ESPNSource, ReplaySource
+from live_state import LiveSlate
+from metrics import METRICS
 
 def format_player_stats(player_stats):
     """Format player stats into a readable string"""
@@ -65,131 +73,179 @@ def format_player_stats(player_stats):
     return ", ".join(stats_parts) if stats_parts else "No stats"
 
 
-def generate_website_json():
-    """Generate JSON file for website"""
-    print("Generating website data...")
-    
-    # Create matchup instance
-    matchup = ChampionshipMatchup()
-    
-    # Fetch games
-    games = matchup.fetch_playoff_games()
-    if not games:
-        print("✗ No games found")
-        return
+def roster_rows(results):
+    """Turn ChampionshipMatchup.score_roster results into website roster rows"""
+    return [
+        {
+            "position": result['roster_pos'],
+            "name": result['name'],
+            "team": result['team'],
+            "stats": format_player_stats(result['stats']),
+            "points": round(result['points'], 2)
+        }
+        for result in results
+    ]
+
+
+def team_payload(name, rows):
+    """Website JSON block for one team"""
+    return {
+        "name": name,
+        "total_points": round(sum(row['points'] for row in rows), 2),
+        "roster": rows
+    }
+
+
+def rank_top_performers(rows, limit=5):
+    """Highest-scoring roster rows, with a 1-based rank added"""
+    top_performers = sorted(rows, key=lambda x: x['points'], reverse=True)[:limit]
+    for i, performer in enumerate(top_performers, 1):
+        performer['rank'] = i
+    return top_performers
+
+
+def make_simulator(matchup, simulations=100000, workers=0):
+    """MatchupSimulator for live win probabilities, or None if disabled or numpy is missing"""
+    if not simulations:
+        return None
+    try:
+        from win_probability import MatchupSimulator
+    except ImportError:
+        print("⚠ numpy not installed - skipping win probability")
+        return None
+    return MatchupSimulator(matchup, simulations, workers)
+
+
+def build_website_data(matchup, stats, games=None, simulator=None):
+    """
+    Score both rosters against a parsed slate and build the website JSON structure.
+    With a simulator and the scoreboard games, a slate that isn't final also gets
+    each team's simulated win probability.
+    """
+    with METRICS.stage('scoring'):
+        team1_roster = roster_rows(matchup.score_roster(matchup.team1['roster'], stats))
+        team2_roster = roster_rows(matchup.score_roster(matchup.team2['roster'], stats))
     
-    # Collect all stats
-    all_players = {}
-    all_kickers = {}
-    all_defenses = {}
-    
-    for event in games:
-        game_id = event.get('id')
-        game_data = matchup.fetch_game_stats(game_id)
-        if game_data:
-            players = matchup.parse_all_players(game_data)
-            all_players.update(players)
-            
-            kickers = matchup.parse_kicker_stats(game_data)
-            all_kickers.update(kickers)
-            
-            defenses = matchup.parse_defense_stats(game_data)
-            all_defenses.update(defenses)
-    
-    # Process Team 1
-    team1_roster = []
-    for player_name, roster_pos, team_abbr in matchup.team1['roster']:
-        if 'D/ST' in player_name or 'DST' in player_name:
-            if team_abbr in all_defenses:
-                player_stats = all_defenses[team_abbr].copy()
-                player_stats['name'] = player_name
-                player_stats['team'] = team_abbr
-                player_stats['position'] = 'D/ST'
-            else:
-                player_stats = {'name': player_name, 'team': team_abbr, 'position': 'D/ST'}
-        elif roster_pos == 'K':
-            player_stats = matchup.find_kicker(player_name, all_kickers)
-            player_stats['name'] = player_name
-            player_stats['team'] = team_abbr
-            player_stats['position'] = 'K'
-        else:
-            player_stats = matchup.find_player(player_name, team_abbr, all_players)
-        
-        fantasy_points = matchup.calculate_fantasy_points(player_stats)
-        
-        team1_roster.append({
-            "position": roster_pos,
-            "name": player_name,
-            "team": team_abbr,
-            "stats": format_player_stats(player_stats),
-            "points": round(fantasy_points, 2)
-        })
-    
-    # Process Team 2
-    team2_roster = []
-    for player_name, roster_pos, team_abbr in matchup.team2['roster']:
-        if 'D/ST' in player_name or 'DST' in player_name:
-            if team_abbr in all_defenses:
-                player_stats = all_defenses[team_abbr].copy()
-                player_stats['name'] = player_name
-                player_stats['team'] = team_abbr
-                player_stats['position'] = 'D/ST'
-            else:
-                player_stats = {'name': player_name, 'team': team_abbr, 'position': 'D/ST'}
-        elif roster_pos == 'K':
-            player_stats = matchup.find_kicker(player_name, all_kickers)
-            player_stats['name'] = player_name
-            player_stats['team'] = team_abbr
-            player_stats['position'] = 'K'
-        else:
-            player_stats = matchup.find_player(player_name, team_abbr, all_players)
-        
-        fantasy_points = matchup.calculate_fantasy_points(player_stats)
-        
-        team2_roster.append({
-            "position": roster_pos,
-            "name": player_name,
-            "team": team_abbr,
-            "stats": format_player_stats(player_stats),
-            "points": round(fantasy_points, 2)
-        })
-    
-    # Calculate totals
-    team1_total = sum(p['points'] for p in team1_roster)
-    team2_total = sum(p['points'] for p in team2_roster)
+    matchup.report_ambiguous(stats.index)
     
     # Get top performers (combine both rosters and sort)
-    all_roster = team1_roster + team2_roster
-    top_performers = sorted(all_roster, key=lambda x: x['points'], reverse=True)[:5]
-    
-    for i, performer in enumerate(top_performers, 1):
-        performer['rank'] = i
+    top_performers = rank_top_performers(team1_roster + team2_roster)
     
-    # Build final JSON structure
     data = {
         "generated_at": datetime.now().isoformat(),
         "weekend": "Conference Championships - Jan 25-26, 2026",
-        "team1": {
-            "name": matchup.team1['name'],
-            "total_points": round(team1_total, 2),
-            "roster": team1_roster
-        },
-        "team2": {
-            "name": matchup.team2['name'],
-            "total_points": round(team2_total, 2),
-            "roster": team2_roster
-        },
+        "team1": team_payload(matchup.team1['name'], team1_roster),
+        "team2": team_payload(matchup.team2['name'], team2_roster),
         "top_performers": top_performers
     }
     
-    # Write to file
-    output_file = 'championship_results.json'
-    with open(output_file, 'w') as f:
-        json.dump(data, f, indent=2)
+    if simulator is not None and games and not all(
+            matchup.is_final(competition) for event in games for competition in event.get('competitions', [])):
+        with METRICS.stage('simulation'):
+            data['win_probability'] = simulator.win_probability(stats, games)
+    return data
+
+
+def content_hash(data):
+    """
+    Hash of the results payload, ignoring when it was generated.
+    Simulated win probabilities move with the game clock on every poll, so only
+    whether there are any (some game still live) counts; they are refreshed
+    whenever a score changes.
+    """
+    payload = {key: value for key, value in data.items()
+               if key not in ('generated_at', 'content_hash', 'win_probability')}
+    payload['live'] = 'win_probability' in data
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+def write_results(data, output_file='championship_results.json'):
+    """
+    Write the results file only if its content changed, atomically.
+    The hash is stored in the file itself, so unchanged scores leave the file
+    byte-for-byte identical and readers never see a half-written file.
+    Each new version is also published to the delta feed next to it.
+    Returns True if the file was written.
+    """
+    digest = content_hash(data)
+    data['content_hash'] = digest
+    try:
+        with open(output_file) as f:
+            changed = json.load(f).get('content_hash') != digest
+    except (OSError, ValueError):
+        changed = True
+    
+    if changed:
+        METRICS.count('results_written')
+        directory = os.path.dirname(os.path.abspath(output_file))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.championship_results.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f, indent=2)
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, output_file)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    
+    # Also catches up a feed that is missing or behind an unchanged results file
+    if delta_feed.publish(data, feed_dir(output_file)):
+        METRICS.count('feed_versions_published')
+    return changed
+
+
+def feed_dir(output_file):
+    """feed/ (manifest, snapshots, patches) in the same directory as the results file"""
+    return os.path.join(os.path.dirname(output_file), 'feed')
+
+
+def metrics_path(output_file):
+    """championship_metrics.json in the same directory as the results file"""
+    return os.path.join(os.path.dirname(output_file), 'championship_metrics.json')
+
+
+def generate_website_json(matchup=None, output_file='championship_results.json', simulations=100000,
+                          prometheus_file=None):
+    """
+    Generate JSON file for website (simulations=0 skips the live win probability).
+    Stage timings and counters for the run go to championship_metrics.json next
+    to it, and to prometheus_file in the Prometheus text format if given.
+    """
+    print("Generating website data...")
+    METRICS.reset()
     
-    print(f"✓ Generated {output_file}")
+    # Create matchup instance
+    matchup = matchup or ChampionshipMatchup()
+    
+    # Fetch games
+    games = matchup.fetch_playoff_games()
+    if not games:
+        print("✗ No games found")
+        METRICS.write(metrics_path(output_file), prometheus_file)
+        return
+    
+    # Parse every game once, then score both rosters against it. Parse state
+    # is kept next to the response cache so the next cron run only processes
+    # plays and box-score rows that changed since this one.
+    live = LiveSlate(os.path.join(matchup.cache.cache_dir, 'live_state.json') if matchup.cache else None)
+    stats = matchup.collect_stats(games, live)
+    simulator = make_simulator(matchup, simulations)
+    data = build_website_data(matchup, stats, games, simulator)
+    team1_total = data['team1']['total_points']
+    team2_total = data['team2']['total_points']
+    
+    # Write to file (skipped when no score changed)
+    if write_results(data, output_file):
+        print(f"✓ Generated {output_file}")
+    else:
+        print(f"✓ {output_file} already up to date")
+    METRICS.write(metrics_path(output_file), prometheus_file)
     print(f"  {matchup.team1['name']}: {team1_total:.2f} points")
     print(f"  {matchup.team2['name']}: {team2_total:.2f} points")
+    if 'win_probability' in data:
+        chances = data['win_probability']
+        print(f"  Win probability: {chances['team1']['win_probability']:.1%} - {chances['team2']['win_probability']:.1%}"
+              f" ({chances['simulations']:,} simulations)")
     
     if team1_total > team2_total:
         print(f"\n🏆 {matchup.team1['name']} WINS by {team1_total - team2_total:.2f} points!")
@@ -199,5 +255,25 @@ def generate_website_json():
         print("\n🤝 TIE GAME!")
 
 
+def main():
+    parser = argparse.ArgumentParser(description='Generate championship_results.json for the website')
+    parser.add_argument('-o', '--output', default='championship_results.json', help='results file to write')
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('--replay', metavar='DIR', help='read recorded ESPN responses instead of the live API')
+    group.add_argument('--record', metavar='DIR', help='also save every ESPN response to DIR for --replay')
+    parser.add_argument('--simulations', type=int, default=100000,
+                        help='win probability simulations while games are live (0 to skip)')
+    parser.add_argument('--prometheus', metavar='FILE', help='also write run metrics in Prometheus text format')
+    parser.add_argument('-v', '--verbose', action='store_true', help='log per-slot lookup and scoring details')
+    args = parser.parse_args()
+    configure_logging(args.verbose)
+    
+    if args.replay:
+        source = ReplaySource(args.replay)
+    else:
+        source = ESPNSource(record_dir=args.record)
+    generate_website_json(ChampionshipMatchup(source=source), args.output, args.simulations, args.prometheus)
+
+
 if __name__ == '__main__':
-    generate_website_json()
+    main()
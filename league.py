@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+League engine - score every head-to-head matchup in one pass
+
+Loads N rosters and the week's matchups from a JSON config file, fetches
+and parses each game on the slate once into a shared stat store, scores
+every team once, then writes all matchups to a single JSON document.
+
+Usage:
+    python league.py league.example.json [-o league_results.json]
+
+Config format:
+    {
+      "name": "My League",
+      "weekend": "Conference Championships - Jan 25-26, 2026",
+      "dates": "20260125-20260126", "seasontype": 3,
+      "teams": [
+        {"id": "jon", "name": "Jon Korsgard's Team",
+         "roster": [["Drake Maye", "QB", "NE"], ["Patriots D/ST", "D/ST", "NE"], ...]},
+        ...
+      ],
+      "matchups": [["jon", "dardan"], ...],
+      "scoring": "league_settings.example.json"
+    }
+
+The slate is picked with "dates" (a day or a range like "20260125-20260126")
+or with "season" and "week" (plus "seasontype": 1 pre, 2 regular - the
+default for weeks - or 3 post). Without either, championship weekend is used.
+If "matchups" is omitted, teams are paired in the order they are listed; an
+odd number of teams is then an error.
+"scoring" is an optional league settings file (see scoring_rules.py),
+relative to the config file; without it the default scoring table is used.
+Leagues with different scoring can share one parsed slate via score_stats().
+"""
+
+import argparse
+import json
+import os
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from championship_matchup import ChampionshipMatchup, configure_logging
+from generate_website_data import rank_top_performers, roster_rows, team_payload
+from scoring_rules import CompiledScoring
+from stat_store import SlateStats
+
+
+class League:
+    """A set of rosters and the head-to-head matchups between them"""
+
+    def __init__(self, config: Dict, matchup: Optional[ChampionshipMatchup] = None, base_dir: str = '.'):
+        self.name = config.get('name', 'League')
+        self.weekend = config.get('weekend', '')
+        self.teams = {}
+        for team in config.get('teams', []):
+            self.teams[team['id']] = {
+                'name': team.get('name', team['id']),
+                'roster': [tuple(slot) for slot in team.get('roster', [])],
+            }
+
+        pairs = config.get('matchups')
+        if pairs is None:
+            team_ids = list(self.teams)
+            if len(team_ids) % 2:
+                raise ValueError(f"Team '{team_ids[-1]}' has no opponent; list the \"matchups\" explicitly")
+            pairs = [team_ids[i:i + 2] for i in range(0, len(team_ids), 2)]
+        for pair in pairs:
+            for team_id in pair:
+                if team_id not in self.teams:
+                    raise ValueError(f"Matchup references unknown team '{team_id}'")
+        self.matchups = [tuple(pair) for pair in pairs]
+
+        # Which scoreboard to score: a date (range), a season week, or championship weekend
+        dates, week = config.get('dates'), config.get('week')
+        if dates is not None and week is not None:
+            raise ValueError('Give either "dates" or "season"/"week", not both')
+        if week is not None and config.get('season') is None:
+            raise ValueError('"week" needs a "season"')
+        if dates is not None:
+            self.scoreboard = ChampionshipMatchup.scoreboard_params(dates, config.get('seasontype'))
+        elif week is not None:
+            self.scoreboard = ChampionshipMatchup.scoreboard_params(config['season'], config.get('seasontype', 2), week)
+        else:
+            self.scoreboard = None
+
+        self.matchup = matchup or ChampionshipMatchup()
+
+        # League-specific scoring, compiled once (None = the matchup's default rules)
+        scoring = config.get('scoring')
+        self.rules = CompiledScoring.from_file(os.path.join(base_dir, scoring)) if scoring else None
+
+    @classmethod
+    def load(cls, config_path: str, matchup: Optional[ChampionshipMatchup] = None) -> 'League':
+        """Build a League from a JSON config file"""
+        with open(config_path) as f:
+            return cls(json.load(f), matchup, os.path.dirname(os.path.abspath(config_path)))
+
+    def fetch_games(self) -> List[Dict]:
+        """The configured slate's scoreboard events"""
+        if self.scoreboard is None:
+            return self.matchup.fetch_playoff_games()
+        query = ', '.join(f"{key}={value}" for key, value in self.scoreboard.items() if key != 'limit')
+        print(f"Fetching games ({query})...")
+        games = self.matchup.fetch_scoreboard(self.scoreboard) or []
+        if games:
+            print(f"✓ Found {len(games)} games\n")
+        return games
+
+    def score(self, games: List[Dict]) -> Dict:
+        """Parse the slate once and score every team and matchup against it"""
+        return self.score_stats(self.matchup.collect_stats(games))
+
+    def score_stats(self, stats: SlateStats) -> Dict:
+        """Score every team and matchup against an already-parsed slate"""
+        # Each team is scored exactly once, however many matchups it appears in
+        teams = {}
+        for team_id, team in self.teams.items():
+            rows = roster_rows(self.matchup.score_roster(team['roster'], stats, rules=self.rules))
+            teams[team_id] = team_payload(team['name'], rows)
+
+        self.matchup.report_ambiguous(stats.index)
+
+        matchups = []
+        for team1_id, team2_id in self.matchups:
+            team1, team2 = teams[team1_id], teams[team2_id]
+            if team1['total_points'] > team2['total_points']:
+                winner = team1_id
+            elif team2['total_points'] > team1['total_points']:
+                winner = team2_id
+            else:
+                winner = None
+            matchups.append({
+                "team1_id": team1_id,
+                "team2_id": team2_id,
+                "team1": team1,
+                "team2": team2,
+                "winner": winner,
+                "margin": round(abs(team1['total_points'] - team2['total_points']), 2)
+            })
+
+        all_rows = [row for team in teams.values() for row in team['roster']]
+        return {
+            "generated_at": datetime.now().isoformat(),
+            "league": self.name,
+            "weekend": self.weekend,
+            "games_parsed": stats.games,
+            "matchups": matchups,
+            "top_performers": rank_top_performers(all_rows)
+        }
+
+    def run(self, output_file: str = 'league_results.json') -> Optional[Dict]:
+        """Fetch the slate, score the league and write the results file"""
+        games = self.fetch_games()
+        if not games:
+            print("✗ No games found")
+            return None
+
+        data = self.score(games)
+        with open(output_file, 'w') as f:
+            json.dump(data, f, indent=2)
+
+        # One write for the whole summary; leagues can have hundreds of matchups
+        lines = [f"✓ Generated {output_file} ({len(data['matchups'])} matchups, {data['games_parsed']} games)"]
+        for result in data['matchups']:
+            team1, team2 = result['team1'], result['team2']
+            lines.append(f"  {team1['name']} {team1['total_points']:.2f} - {team2['total_points']:.2f} {team2['name']}")
+        print('\n'.join(lines))
+        return data
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Score every matchup in a league')
+    parser.add_argument('config', help='league config JSON file')
+    parser.add_argument('-o', '--output', default='league_results.json', help='results file to write')
+    parser.add_argument('-v', '--verbose', action='store_true', help='log per-slot lookup and scoring details')
+    args = parser.parse_args()
+    configure_logging(args.verbose)
+
+    League.load(args.config).run(args.output)
+
+
+if __name__ == '__main__':
+    main()
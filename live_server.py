@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Live server - push score changes to browsers over Server-Sent Events
+
+An optional alternative to the static site plus cron: one asyncio process
+polls ESPN exactly like watch mode, holds the latest results in memory,
+and serves the website itself. Browsers connected to /events get each new
+version as soon as a poll produces it instead of waiting for a commit and
+a Pages deploy.
+
+All clients share one poller and one LiveState. Each version is encoded
+once, as a full 'snapshot' event and as a 'patch' event (the delta_feed
+JSON Patch from the previous version). Fanning out is a socket write per
+client; nothing per client ever reaches ESPN. A client that was too slow to
+take the previous version gets the snapshot instead of the patch.
+
+Routes:
+    /, /index.html, /script.js, /styles.css    the website
+    /events                                    SSE stream (snapshot, then patches)
+    /championship_results.json                 latest results, same shape as the file
+    /metrics                                   last poll's metrics, Prometheus text
+
+Usage:
+    python championship_matchup.py serve [--host 127.0.0.1] [--port 8000]
+"""
+
+import asyncio
+import json
+import logging
+import os
+from typing import Dict, Optional
+
+import delta_feed
+from metrics import METRICS
+
+logger = logging.getLogger(__name__)
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+STATIC_FILES = {
+    '/': ('index.html', 'text/html; charset=utf-8'),
+    '/index.html': ('index.html', 'text/html; charset=utf-8'),
+    '/script.js': ('script.js', 'text/javascript; charset=utf-8'),
+    '/styles.css': ('styles.css', 'text/css; charset=utf-8'),
+}
+
+# Comment line sent to idle streams so proxies keep them open and dead clients are noticed
+HEARTBEAT_SECONDS = 15
+
+# Browser reconnect delay after a dropped stream
+RETRY_MILLISECONDS = 5000
+
+REASONS = {200: 'OK', 404: 'Not Found', 405: 'Method Not Allowed', 503: 'Service Unavailable'}
+
+
+def sse_message(event: str, payload: Dict) -> bytes:
+    """One encoded Server-Sent Events message"""
+    return f"event: {event}\ndata: {json.dumps(payload, separators=(',', ':'))}\n\n".encode()
+
+
+class LiveState:
+    """Latest results shared by every connected client, each version encoded once"""
+
+    def __init__(self):
+        self.version: Optional[str] = None
+        self.previous_version: Optional[str] = None
+        self.data: Optional[Dict] = None
+        self.body = b''
+        self.snapshot_event = b''
+        self.patch_event = b''
+        self.clients = 0
+        self._changed = asyncio.Event()
+
+    def publish(self, data: Dict) -> bool:
+        """Make data (carrying its content_hash) the current version; False if unchanged"""
+        version = delta_feed.version_id(data['content_hash'])
+        if version == self.version:
+            return False
+
+        if self.data is not None:
+            self.patch_event = sse_message('patch', {'from': self.version, 'to': version,
+                                                     'patch': delta_feed.diff(self.data, data)})
+        self.previous_version, self.version, self.data = self.version, version, data
+        self.snapshot_event = sse_message('snapshot', {'version': version, 'data': data})
+        self.body = json.dumps(data, indent=2).encode()
+
+        # Wake every waiting stream, and give later waiters a fresh event
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+        return True
+
+    def event_for(self, client_version: Optional[str]) -> bytes:
+        """The patch if the client has the previous version, otherwise the snapshot"""
+        if client_version is not None and client_version == self.previous_version:
+            return self.patch_event
+        return self.snapshot_event
+
+    async def wait(self, client_version: Optional[str], timeout: float):
+        """Return once there is a version newer than client_version, or after timeout"""
+        if self.version != client_version:
+            return
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+
+class LiveServer:
+    """One scoreboard poller plus an HTTP/SSE front end for any number of browsers"""
+
+    def __init__(self, matchup, live_interval: float = 30, idle_interval: float = 900,
+                 simulations: int = 100000, simulation_workers: int = 0):
+        self.matchup = matchup
+        self.live_interval = live_interval
+        self.idle_interval = idle_interval
+        self.simulations = simulations
+        self.simulation_workers = simulation_workers
+        self.state: Optional[LiveState] = None
+
+    async def poll_forever(self):
+        """Refresh the shared state like watch mode, without writing any files"""
+        # Imported here so importing the server module stays light
+        from generate_website_data import content_hash, make_simulator
+        from live_state import LiveSlate
+        from stat_store import SlateStats
+
+        live = LiveSlate()
+        stats = SlateStats()
+        simulator = make_simulator(self.matchup, self.simulations, self.simulation_workers)
+        try:
+            while True:
+                METRICS.reset()
+                try:
+                    # Blocking fetch/parse/score runs off the event loop, so streams keep flowing
+                    games, data = await asyncio.to_thread(self.matchup.refresh, live, stats, simulator)
+                except Exception:
+                    # Keep serving the last version and retry soon
+                    logger.exception('Poll failed')
+                    await asyncio.sleep(self.live_interval)
+                    continue
+                if data is not None:
+                    data['content_hash'] = content_hash(data)
+                    if self.state.publish(data):
+                        print(f"✓ Pushed {data['team1']['name']} {data['team1']['total_points']:.2f}"
+                              f" - {data['team2']['total_points']:.2f} {data['team2']['name']}"
+                              f" to {self.state.clients} client{'s' if self.state.clients != 1 else ''}")
+
+                wait = self.matchup.poll_interval(games, self.live_interval, self.idle_interval)
+                await asyncio.sleep(wait)
+        finally:
+            if simulator is not None:
+                simulator.close()
+
+    async def stream(self, writer: asyncio.StreamWriter):
+        """Send the current version, then every new one, until the client goes away"""
+        writer.write(b'HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\n'
+                     b'Cache-Control: no-cache\r\nConnection: keep-alive\r\n\r\n'
+                     + f"retry: {RETRY_MILLISECONDS}\n\n".encode())
+        state = self.state
+        state.clients += 1
+        version = None
+        try:
+            while True:
+                if state.version is not None and state.version != version:
+                    message = state.event_for(version)
+                    METRICS.count('sse_events_sent', kind='patch' if message is state.patch_event else 'snapshot')
+                    version = state.version
+                else:
+                    message = b': ping\n\n'
+                writer.write(message)
+                # A slow client only holds up its own coroutine; it catches up with a snapshot
+                await writer.drain()
+                await state.wait(version, HEARTBEAT_SECONDS)
+        finally:
+            state.clients -= 1
+
+    def respond(self, writer: asyncio.StreamWriter, status: int, content_type: str, body: bytes,
+                head: bool = False, cache: str = 'no-cache'):
+        writer.write(f"HTTP/1.1 {status} {REASONS[status]}\r\nContent-Type: {content_type}\r\n"
+                     f"Content-Length: {len(body)}\r\nCache-Control: {cache}\r\n"
+                     f"Connection: close\r\n\r\n".encode() + (b'' if head else body))
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve one HTTP/1.1 request"""
+        try:
+            request = (await reader.readline()).decode('latin-1').split()
+            while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                pass
+            if len(request) < 2 or request[0] not in ('GET', 'HEAD'):
+                self.respond(writer, 405, 'text/plain', b'Method Not Allowed\n')
+                return
+            head = request[0] == 'HEAD'
+            path = request[1].split('?')[0]
+
+            if path == '/events' and not head:
+                await self.stream(writer)
+            elif path == '/championship_results.json':
+                if self.state.data is None:
+                    self.respond(writer, 503, 'text/plain', b'First poll still running\n', head)
+                else:
+                    self.respond(writer, 200, 'application/json', self.state.body, head)
+            elif path == '/metrics':
+                self.respond(writer, 200, 'text/plain; version=0.0.4', METRICS.prometheus().encode(), head)
+            elif path in STATIC_FILES:
+                name, content_type = STATIC_FILES[path]
+                with open(os.path.join(ROOT, name), 'rb') as f:
+                    self.respond(writer, 200, content_type, f.read(), head)
+            else:
+                self.respond(writer, 404, 'text/plain', b'Not Found\n', head)
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except asyncio.CancelledError:
+            # Server shutting down with streams still open
+            pass
+        finally:
+            writer.close()
+
+    async def run(self, host: str = '127.0.0.1', port: int = 8000):
+        self.state = LiveState()
+        server = await asyncio.start_server(self.handle, host, port)
+        print(f"Serving live scores on http://{host}:{port}/ "
+              f"(polling every {self.live_interval:g}s while live, up to {self.idle_interval:g}s when idle)")
+        async with server:
+            await asyncio.gather(server.serve_forever(), self.poll_forever())
+
+
+def serve(matchup, host: str = '127.0.0.1', port: int = 8000, live_interval: float = 30,
+          idle_interval: float = 900, simulations: int = 100000, simulation_workers: int = 0):
+    """Run a LiveServer until interrupted"""
+    try:
+        asyncio.run(LiveServer(matchup, live_interval, idle_interval, simulations, simulation_workers).run(host, port))
+    except KeyboardInterrupt:
+        print("\nStopped serving")
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Incremental live scoring
+
+During live games each refresh re-downloads the same summary with a few
+more plays and a few changed box-score rows. LiveGameState remembers, per
+game, how far into each drive it has already classified plays, the
+play-by-play events found so far and a copy of every box-score row. An
+update then classifies only the new plays and rebuilds only the players
+whose rows changed. Besides a per-drive id/length check, only the text of
+the last RECHECK_PLAYS plays is re-verified (reviews edit recent plays in
+place), so the play-by-play side of a refresh costs time proportional to
+the new activity rather than the whole game.
+
+LiveSlate holds the state for every game on a slate and can be saved to
+and loaded from a JSON file, so a cron job that cold-starts each run still
+benefits.
+"""
+
+import json
+import os
+import tempfile
+import zlib
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import play_by_play
+from game_context import GameContext
+from metrics import METRICS
+from play_by_play import PlayEvent
+
+STATE_VERSION = 4
+
+# Most recent processed plays whose type and text are re-checked on every
+# update, to catch a review editing a play in place (same id, new result).
+# Several polls' worth of plays, since a review can land a few snaps later.
+RECHECK_PLAYS = 12
+
+
+def plays_fingerprint(plays: List[Dict]) -> int:
+    """Checksum of the plays' type and text, stable across processes"""
+    return zlib.crc32('\n'.join(f"{play.get('type', {}).get('text', '')}\t{play.get('text', '')}"
+                                for play in plays).encode())
+
+
+class LiveGameState:
+    """Play cursor, events and box-score fingerprints for one game"""
+
+    def __init__(self):
+        self.drives: List[List] = []      # [drive_id, plays_processed, last_play_id] per drive
+        self.tail_fingerprint: Optional[int] = None   # of the last RECHECK_PLAYS processed plays
+        self.events: List[PlayEvent] = []
+        self.rows: Dict[str, List[str]] = {}     # "team|category|athlete_id" -> stats array
+        self.players: Dict[str, Dict] = {}       # player_key -> offensive stat line
+        self.new_plays = 0
+        self.changed_players = 0
+
+    def _reset_plays(self):
+        self.drives = []
+        self.tail_fingerprint = None
+        self.events = []
+
+    def _processed_tail(self, previous: List[Dict]) -> List[Dict]:
+        """The last RECHECK_PLAYS already-processed plays, walking back across drives"""
+        tail: List[Dict] = []
+        for i in range(min(len(self.drives), len(previous)) - 1, -1, -1):
+            plays = previous[i].get('plays', [])[:self.drives[i][1]]
+            tail[:0] = plays[max(0, len(plays) - (RECHECK_PLAYS - len(tail))):]
+            if len(tail) >= RECHECK_PLAYS:
+                break
+        return tail
+
+    def _update_plays(self, game_data: Dict, context: GameContext) -> int:
+        """Classify only plays not seen before; rescan everything if history was rewritten"""
+        previous = game_data.get('drives', {}).get('previous', [])
+
+        # ESPN occasionally rewrites earlier plays (reviews, penalties). If any
+        # known drive changed id or lost plays, start over from scratch. A review
+        # usually edits a recent play in place (a FG turned no good, a return TD
+        # overturned) with the same id, so the latest plays' text is checked too.
+        for i, (drive_id, processed, last_play_id) in enumerate(self.drives):
+            plays = previous[i].get('plays', []) if i < len(previous) else None
+            if (plays is None or previous[i].get('id') != drive_id or len(plays) < processed
+                    or (processed and plays[processed - 1].get('id') != last_play_id)):
+                self._reset_plays()
+                break
+        else:
+            if self.drives and plays_fingerprint(self._processed_tail(previous)) != self.tail_fingerprint:
+                self._reset_plays()
+
+        id_map = context.id_to_abbr
+        new_plays = 0
+        for i, drive in enumerate(previous):
+            plays = drive.get('plays', [])
+            processed = self.drives[i][1] if i < len(self.drives) else 0
+            if processed == len(plays) and i < len(self.drives):
+                continue
+
+            self.events.extend(play_by_play.scan_play_list(plays[processed:], id_map))
+            new_plays += len(plays) - processed
+            cursor = [drive.get('id'), len(plays), plays[-1].get('id') if plays else None]
+            if i < len(self.drives):
+                self.drives[i] = cursor
+            else:
+                self.drives.append(cursor)
+
+        if new_plays or self.tail_fingerprint is None:
+            self.tail_fingerprint = plays_fingerprint(self._processed_tail(previous))
+        return new_plays
+
+    def _update_players(self, matchup, context: GameContext) -> int:
+        """Rebuild only the players whose box-score rows changed"""
+        seen = {}
+        dirty = set()
+        athletes = {}
+
+        for team_abbr, team in context.teams:
+            for stat_category in team.get('statistics', []):
+                category = stat_category.get('name', '').lower()
+                for athlete in stat_category.get('athletes', []):
+                    athlete_info = athlete.get('athlete', {})
+                    player_name = athlete_info.get('displayName', 'Unknown')
+                    player_id = athlete_info.get('id', player_name)
+                    player_key = f"{team_abbr}_{player_id}"
+                    row_key = f"{team_abbr}|{category}|{player_id}"
+                    stats_array = athlete.get('stats', [])
+
+                    seen[row_key] = stats_array
+                    athletes.setdefault(player_key, (player_name, team_abbr,
+                                                     athlete_info.get('position', {}).get('abbreviation', 'N/A')))
+                    if self.rows.get(row_key) != stats_array or player_key not in self.players:
+                        dirty.add(player_key)
+
+        # Rows that disappeared also invalidate their player
+        for row_key in self.rows.keys() - seen.keys():
+            team_abbr, _, player_id = row_key.split('|', 2)
+            dirty.add(f"{team_abbr}_{player_id}")
+
+        self.rows = seen
+        for player_key in dirty:
+            if player_key not in athletes:
+                self.players.pop(player_key, None)
+                continue
+            team_abbr, _, player_id = player_key.partition('_')
+            player = matchup.new_player_line(*athletes[player_key])
+            for category in ('passing', 'rushing', 'receiving', 'fumbles'):
+                stats_array = seen.get(f"{team_abbr}|{category}|{player_id}")
+                if stats_array is not None:
+                    matchup.apply_boxscore_row(player, category, stats_array)
+            self.players[player_key] = player
+
+        return len(dirty)
+
+    def update(self, matchup, game_data: Dict) -> Tuple[Dict[str, Dict], Dict[str, Dict], Dict[str, Dict]]:
+        """Apply a fresh summary and return (players, kickers, defenses) like parse_game"""
+        context = GameContext(game_data)
+        with METRICS.stage('play_by_play'):
+            self.new_plays = self._update_plays(game_data, context)
+        with METRICS.stage('parse_players'):
+            self.changed_players = self._update_players(matchup, context)
+        METRICS.count('players_rebuilt', self.changed_players)
+
+        # Kicker and D/ST lines are cheap folds over the (short) event list
+        with METRICS.stage('parse_kickers'):
+            kickers = matchup.parse_kicker_stats(game_data, self.events)
+        with METRICS.stage('parse_defenses'):
+            defenses = matchup.parse_defense_stats(game_data, self.events, context)
+        return dict(self.players), kickers, defenses
+
+    def to_dict(self) -> Dict:
+        return {'drives': self.drives, 'tail_fingerprint': self.tail_fingerprint,
+                'events': [list(event) for event in self.events], 'rows': self.rows}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'LiveGameState':
+        state = cls()
+        state.drives = data.get('drives', [])
+        state.tail_fingerprint = data.get('tail_fingerprint')
+        state.events = [PlayEvent(*event) for event in data.get('events', [])]
+        # Players are rebuilt from rows on the first update
+        state.rows = data.get('rows', {})
+        return state
+
+
+class LiveSlate:
+    """LiveGameState for every game on a slate, optionally persisted to disk"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.games: Dict[str, LiveGameState] = {}
+        if path and os.path.exists(path):
+            try:
+                with open(path) as f:
+                    data = json.load(f)
+                if data.get('version') == STATE_VERSION:
+                    self.games = {game_id: LiveGameState.from_dict(game)
+                                  for game_id, game in data.get('games', {}).items()}
+            except (OSError, ValueError):
+                self.games = {}
+
+    def update(self, matchup, game_id: str, game_data: Dict) -> Tuple[Dict[str, Dict], Dict[str, Dict], Dict[str, Dict]]:
+        """Incrementally parse one game's latest summary"""
+        state = self.games.setdefault(game_id, LiveGameState())
+        return state.update(matchup, game_data)
+
+    def prune(self, game_ids: Iterable[str]):
+        """Forget games that are no longer on the slate, so the state file doesn't grow week over week"""
+        keep = set(game_ids)
+        for game_id in self.games.keys() - keep:
+            del self.games[game_id]
+
+    def save(self):
+        """Write the state file atomically (no-op without a path)"""
+        if not self.path:
+            return
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'version': STATE_VERSION,
+                       'games': {game_id: state.to_dict() for game_id, state in self.games.items()}}, f)
+        os.replace(tmp_path, self.path)
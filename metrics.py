@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Run instrumentation - per-stage wall times and counters
+
+One process-wide Metrics object (METRICS) collects:
+
+- stages: wall time and call count per pipeline stage ('http', 'decode',
+  'parse_players', 'play_by_play', 'lookup', ...), recorded with
+  `with METRICS.stage('http'):`
+- counters: bytes fetched, HTTP statuses, plays scanned, play-by-play
+  pattern hits per event kind, name lookup hits and misses, ... with
+  optional labels, e.g. METRICS.count('lookup_misses', name='Drake Maye')
+
+Stages are timed once per request or per game, never per play, and
+counters are bumped once per batch, so leaving this on costs well under a
+millisecond per run. Stage times from worker threads are summed, so
+'http' can exceed the run's wall time when downloads overlap.
+
+generate_website_data.py writes a snapshot to championship_metrics.json
+next to the results file (and a Prometheus text file with --prometheus).
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterator, Optional, Tuple
+
+PROMETHEUS_PREFIX = 'championship_'
+
+
+def _label_text(labels: Tuple[Tuple[str, str], ...]) -> str:
+    return ','.join(f"{key}={value}" for key, value in labels)
+
+
+def _escape(text: str) -> str:
+    """Prometheus label value escaping"""
+    return text.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(value)
+
+
+def _write_atomic(path: str, text: str):
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.metrics.', suffix='.tmp')
+    with os.fdopen(fd, 'w') as f:
+        f.write(text)
+    os.chmod(tmp_path, 0o644)
+    os.replace(tmp_path, path)
+
+
+class Metrics:
+    """Thread-safe stage timers and labelled counters"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Start a new run"""
+        with self._lock:
+            self.started = time.perf_counter()
+            self.seconds: Dict[str, float] = defaultdict(float)
+            self.calls: Dict[str, int] = defaultdict(int)
+            self.counters: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float] = defaultdict(float)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the enclosed block under a stage name"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.seconds[name] += elapsed
+                self.calls[name] += 1
+
+    @staticmethod
+    def _key(metric: str, labels: Dict) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+        return metric, tuple(sorted((label, str(text)) for label, text in labels.items()))
+
+    def count(self, metric: str, value: float = 1, /, **labels):
+        """Add to a counter, optionally split by labels"""
+        key = self._key(metric, labels)
+        with self._lock:
+            self.counters[key] += value
+
+    def count_each(self, metric: str, label: str, counts: Dict):
+        """count() for several values of one label at once, e.g. a Counter of event kinds"""
+        with self._lock:
+            for text, value in counts.items():
+                self.counters[metric, ((label, str(text)),)] += value
+
+    def value(self, metric: str, /, **labels) -> float:
+        """Current value of one counter (0 if nothing was counted)"""
+        key = self._key(metric, labels)
+        with self._lock:
+            return self.counters.get(key, 0)
+
+    def snapshot(self) -> Dict:
+        """Everything recorded since the last reset, as plain JSON data"""
+        with self._lock:
+            counters: Dict[str, object] = {}
+            for (name, labels), value in sorted(self.counters.items()):
+                value = int(value) if float(value).is_integer() else round(value, 6)
+                if labels:
+                    counters.setdefault(name, {})[_label_text(labels)] = value
+                else:
+                    counters[name] = value
+            return {
+                'generated_at': datetime.now().isoformat(),
+                'wall_seconds': round(time.perf_counter() - self.started, 6),
+                'stages': {name: {'seconds': round(self.seconds[name], 6), 'calls': self.calls[name]}
+                           for name in sorted(self.seconds)},
+                'counters': counters,
+            }
+
+    def prometheus(self) -> str:
+        """Snapshot in the Prometheus text exposition format"""
+        with self._lock:
+            lines = [f"# TYPE {PROMETHEUS_PREFIX}stage_seconds_total counter"]
+            lines += [f'{PROMETHEUS_PREFIX}stage_seconds_total{{stage="{name}"}} {seconds:.6f}'
+                      for name, seconds in sorted(self.seconds.items())]
+            lines.append(f"# TYPE {PROMETHEUS_PREFIX}stage_calls_total counter")
+            lines += [f'{PROMETHEUS_PREFIX}stage_calls_total{{stage="{name}"}} {self.calls[name]}'
+                      for name in sorted(self.seconds)]
+
+            previous = None
+            for (name, labels), value in sorted(self.counters.items()):
+                metric = f"{PROMETHEUS_PREFIX}{name}_total"
+                if name != previous:
+                    lines.append(f"# TYPE {metric} counter")
+                    previous = name
+                label_text = ','.join(f'{key}="{_escape(text)}"' for key, text in labels)
+                lines.append(f"{metric}{{{label_text}}} {_number(value)}" if labels else f"{metric} {_number(value)}")
+            return '\n'.join(lines) + '\n'
+
+    def write(self, json_path: str, prometheus_path: Optional[str] = None):
+        """Write the snapshot as JSON (and Prometheus text), atomically"""
+        _write_atomic(json_path, json.dumps(self.snapshot(), indent=2) + '\n')
+        if prometheus_path:
+            _write_atomic(prometheus_path, self.prometheus())
+
+
+# Shared by every module in the process
+METRICS = Metrics()
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Single-pass play-by-play scanner
+
+Walks drives.previous[*].plays[*] of an ESPN summary once and emits typed
+events. Each play's text is lowercased once; ordinary runs and passes are
+skipped after a few keyword checks, and classify_play dispatches the rest
+on the keywords present to precompiled named-group grammars that extract
+kicker, distance, result and recovering team. The kicker and D/ST
+aggregators in ChampionshipMatchup both consume the same event list, so a
+summary's plays are only lowercased and matched once per parse.
+
+benchmarks/play_corpus.json holds play strings in ESPN's formats with the
+events each should produce; `python -m benchmarks.bench_play_classifier`
+checks them and reports plays/sec.
+"""
+
+import re
+from collections import Counter
+from typing import Dict, List, NamedTuple, Optional
+
+from game_context import GameContext
+from metrics import METRICS
+
+
+# Event kinds
+FG_ATTEMPT = 'fg_attempt'
+PAT = 'pat'
+FUMBLE_RECOVERY = 'fumble_recovery'
+MUFF_RECOVERY = 'muff_recovery'
+BLOCKED_KICK = 'blocked_kick'
+RETURN_TD = 'return_td'
+
+# Kick results
+GOOD = 'good'
+MISSED = 'missed'
+
+# Play text keywords, matched in lowercased text
+FIELD_GOAL = 'field goal'
+EXTRA_POINT = 'extra point'
+RECOVERED_BY = 'recovered by'
+BLOCKED = 'blocked'
+TOUCHDOWN = 'touchdown'
+IS_GOOD = 'is good'
+NO_GOOD = 'no good'
+MISSED_KICK = 'missed'
+FUMBLE = 'fumble'
+MUFF = 'muff'
+KICK = 'kick'
+
+# Extraction grammars, run on the original-case text only when their keyword
+# is present. Kicker names appear as "W.Lutz".
+# Example: "W.Lutz 54 yard field goal is No Good, Wide Right, Center-M.Cox, Holder-R.Dixon."
+FIELD_GOAL_RE = re.compile(r'(?P<kicker>[A-Z]\.[A-Za-z]+)\s+(?P<distance>\d+)\s*(?i:yard\s+field\s+goal)')
+# Example: "W.Lutz extra point is GOOD, Center-M.Cox, Holder-R.Dixon."
+EXTRA_POINT_RE = re.compile(r'(?P<kicker>[A-Z]\.[A-Za-z]+)\s+extra\s+point')
+# Example: "FUMBLES (J.Smith), RECOVERED by SEA-D.Young at SEA 30."
+RECOVERED_BY_RE = re.compile(r'recovered by (?P<team>[A-Z]{2,3})-', re.IGNORECASE)
+# Fallbacks for field goal text that doesn't follow the usual grammar
+KICKER_RE = re.compile(r'[A-Z]\.[A-Za-z]+')
+DISTANCE_RE = re.compile(r'(\d+)\s*yard')
+
+
+class PlayEvent(NamedTuple):
+    """One scoring-relevant thing that happened on a play"""
+    kind: str
+    kicker: Optional[str] = None
+    distance: Optional[int] = None
+    result: Optional[str] = None
+    team: Optional[str] = None    # kicking team for FG/PAT, credited team otherwise
+
+
+def team_ids_to_abbr(game_data: Dict) -> Dict[str, str]:
+    """Map ESPN team ids to abbreviations using the boxscore teams"""
+    return GameContext(game_data).id_to_abbr
+
+
+def participant_team(play: Dict, id_map: Dict[str, str], role: str) -> Optional[str]:
+    """Abbreviation of the first team listed as role ("offense"/"defense") on a play"""
+    for participant in play.get('teamParticipants', []):
+        if participant.get('type') == role:
+            return id_map.get(participant.get('id'))
+    return None
+
+
+def defense_team(play: Dict, id_map: Dict[str, str]) -> Optional[str]:
+    """Abbreviation of the first team listed as "defense" on a play"""
+    return participant_team(play, id_map, 'defense')
+
+
+def kicking_team(play: Dict, id_map: Dict[str, str]) -> Optional[str]:
+    """Team attempting a FG or PAT: the offense, else the team with the ball at the snap"""
+    team = participant_team(play, id_map, 'offense')
+    if team is None:
+        team = id_map.get(play.get('start', {}).get('team', {}).get('id'))
+    return team
+
+
+def kick_result(text_lower: str) -> Optional[str]:
+    """GOOD, MISSED or None (e.g. a penalty wiped out the kick)"""
+    if IS_GOOD in text_lower:
+        return GOOD
+    if NO_GOOD in text_lower or MISSED_KICK in text_lower or BLOCKED in text_lower:
+        return MISSED
+    return None
+
+
+def classify_play(play: Dict, id_map: Dict[str, str], text_lower: Optional[str] = None) -> List[PlayEvent]:
+    """Return the events found in a single play"""
+    if text_lower is None:
+        text_lower = play.get('text', '').lower()
+    events = []
+    _classify_into(play, id_map, text_lower, events.append)
+    return events
+
+
+def _classify_into(play: Dict, id_map: Dict[str, str], text_lower: str, emit):
+    """classify_play's body, handing each event to emit (the scanner's list.append)"""
+    # Kicking: field goals take precedence over extra points
+    if FIELD_GOAL in text_lower:
+        text = play.get('text', '')
+        match = FIELD_GOAL_RE.search(text)
+        if match:
+            emit(PlayEvent(FG_ATTEMPT, match.group('kicker'), int(match.group('distance')),
+                           kick_result(text_lower), kicking_team(play, id_map)))
+        else:
+            # e.g. "(Field Goal formation)" text: first name and first distance anywhere
+            name_match = KICKER_RE.search(text)
+            if name_match:
+                dist_match = DISTANCE_RE.search(text_lower)
+                emit(PlayEvent(FG_ATTEMPT, name_match.group(),
+                               int(dist_match.group(1)) if dist_match else None,
+                               kick_result(text_lower) if dist_match else None,
+                               kicking_team(play, id_map)))
+    elif EXTRA_POINT in text_lower:
+        match = EXTRA_POINT_RE.search(play.get('text', ''))
+        if match:
+            emit(PlayEvent(PAT, match.group('kicker'), None, kick_result(text_lower), kicking_team(play, id_map)))
+
+    # Recoveries: a fumble and a muff on the same play are counted separately
+    if RECOVERED_BY in text_lower:
+        fumble, muff = FUMBLE in text_lower, MUFF in text_lower
+        match = RECOVERED_BY_RE.search(play.get('text', '')) if fumble or muff else None
+        if match:
+            if fumble:
+                emit(PlayEvent(FUMBLE_RECOVERY, team=match.group('team')))
+            if muff:
+                emit(PlayEvent(MUFF_RECOVERY, team=match.group('team')))
+
+    # Blocked kicks are credited to the team on defense
+    if BLOCKED in text_lower and (FIELD_GOAL in text_lower or KICK in text_lower):
+        blocking_team = defense_team(play, id_map)
+        if blocking_team:
+            emit(PlayEvent(BLOCKED_KICK, team=blocking_team))
+
+    # Non-interception return TDs (kick/punt/fumble returns, blocked kick
+    # returns). Pick-sixes come from the boxscore interceptions category.
+    if TOUCHDOWN in text_lower:
+        play_type = play.get('type', {}).get('text', '').lower()
+        if 'touchdown' in play_type and 'interception' not in play_type and (
+                'return' in play_type or 'blocked' in play_type):
+            scoring_team = defense_team(play, id_map)
+            if scoring_team:
+                emit(PlayEvent(RETURN_TD, team=scoring_team))
+
+
+def _classify_plays(plays: List[Dict], id_map: Dict[str, str], events: List[PlayEvent]) -> int:
+    """Append the events of each play; returns how many plays needed classifying"""
+    candidates = 0
+    emit = events.append
+    for play in plays:
+        text_lower = play.get('text', '').lower()
+        # Most plays are ordinary runs and passes; skip them with a few
+        # substring checks before doing any regex work
+        if (FIELD_GOAL in text_lower or EXTRA_POINT in text_lower or RECOVERED_BY in text_lower
+                or BLOCKED in text_lower or TOUCHDOWN in text_lower):
+            candidates += 1
+            _classify_into(play, id_map, text_lower, emit)
+    return candidates
+
+
+def _record_scan(scanned: int, candidates: int, events: List[PlayEvent]):
+    """Scan counters, bumped once per call rather than per play"""
+    METRICS.count('plays_scanned', scanned)
+    METRICS.count('plays_classified', candidates)
+    METRICS.count_each('play_events', 'kind', Counter(event.kind for event in events))
+
+
+def scan_play_list(plays: List[Dict], id_map: Dict[str, str]) -> List[PlayEvent]:
+    """Classify a run of plays (e.g. just the ones added since the last refresh)"""
+    events = []
+    _record_scan(len(plays), _classify_plays(plays, id_map, events), events)
+    return events
+
+
+def scan_plays(game_data: Dict, context: Optional[GameContext] = None) -> List[PlayEvent]:
+    """Walk every drive's plays once and return all events in game order"""
+    id_map = (context or GameContext(game_data)).id_to_abbr
+    events = []
+    scanned = candidates = 0
+    for drive in game_data.get('drives', {}).get('previous', []):
+        plays = drive.get('plays', [])
+        scanned += len(plays)
+        candidates += _classify_plays(plays, id_map, events)
+    _record_scan(scanned, candidates, events)
+    return events
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Indexed player / kicker lookup
+
+PlayerIndex is built once per slate from the parsed box-score players and
+play-by-play kickers. Roster names resolve through dict lookups keyed by
+normalized (team, full name), (team, last name) and (team, play-by-play
+abbreviation) like "W.Lutz", instead of scanning every athlete per roster
+slot. A lookup that matches more than one athlete is reported as
+ambiguous rather than silently picking one.
+"""
+
+import re
+import unicodedata
+from collections import defaultdict
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+NAME_SUFFIXES = {'jr', 'sr', 'ii', 'iii', 'iv', 'v'}
+_PUNCTUATION_RE = re.compile(r"[.'’`]")
+_SEPARATOR_RE = re.compile(r'[\s\-_,]+')
+
+
+def normalize_name(name: str) -> str:
+    """'Kenneth Walker III' -> 'kenneth walker', 'Amon-Ra St. Brown' -> 'amon ra st brown'"""
+    name = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode('ascii')
+    tokens = _SEPARATOR_RE.split(_PUNCTUATION_RE.sub('', name.lower()))
+    tokens = [t for t in tokens if t]
+    while len(tokens) > 1 and tokens[-1] in NAME_SUFFIXES:
+        tokens.pop()
+    return ' '.join(tokens)
+
+
+def normalize_abbreviation(name: str) -> str:
+    """Play-by-play style key: 'Will Lutz' or 'W.Lutz' -> 'w.lutz'"""
+    if '.' in name and ' ' not in name.strip():
+        first, _, last = name.partition('.')
+        return f"{first[:1].lower()}.{normalize_name(last).replace(' ', '')}"
+    tokens = normalize_name(name).split(' ')
+    if len(tokens) < 2:
+        return tokens[0]
+    return f"{tokens[0][0]}.{''.join(tokens[1:])}"
+
+
+def last_name(name: str) -> str:
+    """Last token of a normalized name"""
+    return normalize_name(name).split(' ')[-1]
+
+
+class LookupResult(NamedTuple):
+    """Outcome of an index lookup: the matched record, or the candidates if ambiguous"""
+    record: Optional[Dict]
+    candidates: Tuple[str, ...] = ()
+
+    @property
+    def ambiguous(self) -> bool:
+        return self.record is None and len(self.candidates) > 1
+
+
+class PlayerIndex:
+    """O(1) name resolution over one slate's players and kickers"""
+
+    def __init__(self, all_players: Dict[str, Dict], all_kickers: Optional[Dict[str, Dict]] = None):
+        self.players = all_players
+        self.kickers = all_kickers or {}
+
+        self.by_full = defaultdict(list)
+        self.by_abbrev = defaultdict(list)
+        self.by_last = defaultdict(list)
+        # Keys are visited in sorted order so candidate lists are deterministic
+        for key in sorted(self.players):
+            player = self.players[key]
+            team = player.get('team')
+            name = player.get('name', '')
+            self.by_full[(team, normalize_name(name))].append(key)
+            self.by_abbrev[(team, normalize_abbreviation(name))].append(key)
+            self.by_last[(team, last_name(name))].append(key)
+
+        self.kicker_by_abbrev = defaultdict(list)
+        self.kicker_by_last = defaultdict(list)
+        for key in sorted(self.kickers):
+            kicker = self.kickers[key]
+            team = kicker.get('team')
+            name = kicker.get('name') or key.partition('_')[2]
+            self.kicker_by_abbrev[(team, normalize_abbreviation(name))].append(key)
+            self.kicker_by_last[(team, last_name(name.partition('.')[2] or name))].append(key)
+
+        # (name, candidate keys) of ambiguous lookups, in first-seen order. A dict
+        # so the same slot looked up on every poll of a cached index is kept once
+        self.ambiguous: Dict[Tuple[str, Tuple[str, ...]], None] = {}
+
+    def _resolve(self, name: str, records: Dict[str, Dict], levels: List[List[str]]) -> LookupResult:
+        """Take the first level with any candidates; more than one candidate is ambiguous"""
+        for keys in levels:
+            if len(keys) == 1:
+                return LookupResult(records[keys[0]], tuple(keys))
+            if keys:
+                self.ambiguous[(name, tuple(keys))] = None
+                return LookupResult(None, tuple(keys))
+        return LookupResult(None)
+
+    def find_player(self, player_name: str, team_abbr: str) -> LookupResult:
+        """Resolve a roster name on a team: full name, then abbreviation, then last name"""
+        empty = []
+        return self._resolve(player_name, self.players, [
+            self.by_full.get((team_abbr, normalize_name(player_name)), empty),
+            self.by_abbrev.get((team_abbr, normalize_abbreviation(player_name)), empty),
+            self.by_last.get((team_abbr, last_name(player_name)), empty),
+        ])
+
+    def find_kicker(self, player_name: str, team_abbr: str) -> LookupResult:
+        """Resolve a roster kicker on a team to a play-by-play line ("Will Lutz" -> "DEN_W.Lutz")"""
+        empty = []
+        return self._resolve(player_name, self.kickers, [
+            self.kicker_by_abbrev.get((team_abbr, normalize_abbreviation(player_name)), empty),
+            self.kicker_by_last.get((team_abbr, last_name(player_name)), empty),
+        ])
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+On-disk HTTP response cache for the ESPN API
+
+Each cached response is stored as one JSON file holding the decoded body
+plus the ETag / Last-Modified validators ESPN sent with it, so the next
+request can be made conditional and a 304 reuses the cached body.
+Entries for final games are pinned and never re-requested.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+
+class ResponseCache:
+    """Stores ESPN JSON bodies and their validators on disk"""
+
+    def __init__(self, cache_dir: str = '.espn_cache'):
+        self.cache_dir = cache_dir
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _path(self, url: str, params: Optional[Dict]) -> str:
+        """Cache file path for a url + query params combination"""
+        key = json.dumps([url, sorted((params or {}).items())], default=str)
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.json")
+
+    def load(self, url: str, params: Optional[Dict] = None) -> Optional[Dict]:
+        """Return the cached entry for a request, or None"""
+        try:
+            with open(self._path(url, params)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def store(self, url: str, params: Optional[Dict], body: Any, etag: Optional[str] = None,
+              last_modified: Optional[str] = None, pinned: bool = False):
+        """Write (or replace) the cached entry for a request"""
+        entry = {
+            'url': url,
+            'params': params or {},
+            'etag': etag,
+            'last_modified': last_modified,
+            'pinned': pinned,
+            'fetched_at': datetime.now().isoformat(),
+            'body': body,
+        }
+
+        # Write to a temp file and rename so concurrent fetch threads (or a
+        # killed run) never leave a truncated entry behind
+        path = self._path(url, params)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    @staticmethod
+    def conditional_headers(entry: Optional[Dict]) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers from a cached entry"""
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
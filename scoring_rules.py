@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Declarative league scoring compiled into a fast evaluator
+
+A league's scoring is described in a settings file (JSON, TOML or YAML)
+as an ordered list of rules:
+
+    {
+      "name": "Championship League",
+      "rules": [
+        {"category": "passing",
+         "gate": ["passing_yards", "passing_tds"],
+         "linear": {"passing_yards": "1/25", "passing_tds": 8, "interceptions": -3},
+         "bonuses": {"passing_yards": [[300, 5], [400, 10]]}},
+        {"category": "kicking",
+         "linear": {"pat_made": 1, "pat_missed": -3},
+         "field_goals": {"made": [[39, 3], [49, 4], [null, 6]],
+                         "missed": [[39, -3], [49, -2], [null, 0]]}},
+        {"category": "points_allowed",
+         "tiers": {"points_allowed": [[0, 15], [6, 12], [13, 9], [null, -9]]}},
+        ...
+      ]
+    }
+
+- gate: the rule only applies if any of these stats is > 0
+- linear: points per unit; "1/25" means one point per 25 units
+- bonuses: [at_least, points] steps; only the highest step reached counts
+- tiers: [at_most, points] steps (null = no upper bound); skipped when the
+  stat is missing or negative
+- field_goals: [at_most_yards, points] steps for made and missed kicks
+
+CompiledScoring turns that into flat tuples of operations with bisect
+lookup tables for every step ladder, then generates one straight-line
+Python function from them, so scoring a stat line involves no per-player
+rule interpretation. The vectorized scorer runs the same operation tuples
+over NumPy columns. Several leagues can score the same parsed
+stats, each with its own CompiledScoring.
+"""
+
+import json
+import math
+import os
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from stat_records import StatLine
+
+# Operation codes
+MUL = 0
+DIV = 1
+BONUS = 2
+TIER = 3
+FIELD_GOALS = 4
+
+# Kicker bucket stats produced by ChampionshipMatchup.parse_kicker_stats,
+# with the longest distance in each bucket
+FG_MADE_BUCKETS = [('fg_0_39', 39), ('fg_40_49', 49), ('fg_50_plus', 50)]
+FG_MISSED_BUCKETS = [('fg_miss_0_39', 39), ('fg_miss_40_49', 49), ('fg_miss_50_plus', 50)]
+
+
+def load_settings(path: str) -> Dict:
+    """Read a league settings file; the format is picked from the extension"""
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.toml':
+        import tomllib
+        with open(path, 'rb') as f:
+            return tomllib.load(f)
+    if ext in ('.yaml', '.yml'):
+        try:
+            import yaml
+        except ImportError:
+            raise RuntimeError(f"Reading {path} needs PyYAML (pip install pyyaml)")
+        with open(path) as f:
+            return yaml.safe_load(f)
+    with open(path) as f:
+        return json.load(f)
+
+
+def settings_from_scoring_table(scoring: Dict[str, float], name: str = 'League') -> Dict:
+    """Settings equivalent to the flat ChampionshipMatchup.scoring table"""
+    s = scoring
+    return {
+        'name': name,
+        'rules': [
+            {'category': 'passing', 'gate': ['passing_yards', 'passing_tds'],
+             'linear': {'passing_yards': f"1/{s['passing_yards_per_point']}", 'passing_tds': s['passing_td'],
+                        'passing_2pt': s['passing_2pt'], 'interceptions': s['interception']},
+             'bonuses': {'passing_yards': [[300, s['passing_bonus_300']], [400, s['passing_bonus_400']]]}},
+            {'category': 'rushing', 'gate': ['rushing_yards', 'rushing_tds'],
+             'linear': {'rushing_yards': f"1/{s['rushing_yards_per_point']}", 'rushing_tds': s['rushing_td'],
+                        'rushing_2pt': s['rushing_2pt']},
+             'bonuses': {'rushing_yards': [[100, s['rushing_bonus_100']], [200, s['rushing_bonus_200']]]}},
+            {'category': 'receiving', 'gate': ['receptions', 'receiving_tds'],
+             'linear': {'receptions': s['reception'], 'receiving_yards': f"1/{s['receiving_yards_per_point']}",
+                        'receiving_tds': s['receiving_td'], 'receiving_2pt': s['receiving_2pt']},
+             'bonuses': {'receiving_yards': [[100, s['receiving_bonus_100']], [200, s['receiving_bonus_200']]]}},
+            {'category': 'fumbles', 'linear': {'fumbles_lost': s['fumble_lost']}},
+            {'category': 'kicking', 'linear': {'pat_made': s['pat_made'], 'pat_missed': s['pat_missed']},
+             'field_goals': {
+                 'made': [[39, s['fg_0_39']], [49, s['fg_40_49']], [None, s['fg_50_plus']]],
+                 'missed': [[39, s['fg_miss_0_39']], [49, s['fg_miss_40_49']], [None, s['fg_miss_50_plus']]]}},
+            {'category': 'points_allowed', 'tiers': {'points_allowed': [
+                [0, s['dst_points_0']], [6, s['dst_points_1_6']], [13, s['dst_points_7_13']],
+                [17, s['dst_points_14_17']], [21, s['dst_points_18_21']], [27, s['dst_points_22_27']],
+                [34, s['dst_points_28_34']], [45, s['dst_points_35_45']], [None, s['dst_points_46_plus']]]}},
+            {'category': 'defense',
+             'linear': {'sacks': s['dst_sack'], 'defensive_interceptions': s['dst_interception'],
+                        'fumble_recoveries': s['dst_fumble_recovery'], 'safeties': s['dst_safety'],
+                        'blocked_kicks': s['dst_blocked_kick'], 'return_tds': s['dst_return_td']}},
+        ],
+    }
+
+
+def _bound(value: Any) -> float:
+    """Upper bound of a step; null / "inf" mean unbounded"""
+    if value is None or (isinstance(value, str) and value.lower() in ('inf', 'infinity')):
+        return math.inf
+    return float(value)
+
+
+def _linear(category: str, stat: str, value: Any) -> Tuple[int, float]:
+    """(MUL, points per unit) or (DIV, units per point) for a linear value (a number or "1/N")"""
+    text = value.replace(' ', '') if isinstance(value, str) else None
+    try:
+        if text is not None and text.startswith('1/'):
+            divisor = float(text[2:])
+            if divisor == 0:
+                raise ValueError
+            return DIV, divisor
+        return MUL, float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Rule '{category}': linear value for {stat} must be a number or \"1/N\", "
+                         f"got {value!r}") from None
+
+
+def _steps(steps: List) -> Tuple[Tuple[float, ...], Tuple[float, ...]]:
+    """Split [[bound, points], ...] into sorted bound and points tuples"""
+    pairs = sorted(((_bound(bound), points) for bound, points in steps), key=lambda pair: pair[0])
+    return tuple(bound for bound, _ in pairs), tuple(points for _, points in pairs)
+
+
+def _step_points(bounds: Tuple[float, ...], points: Tuple[float, ...], value: float) -> float:
+    """Points of the first [at_most, points] step covering value (0 past the last step)"""
+    i = bisect_left(bounds, value)
+    return points[i] if i < len(points) else 0
+
+
+class CompiledScoring:
+    """A league's scoring rules compiled into flat operation tuples and lookup tables"""
+
+    def __init__(self, settings: Dict):
+        self.settings = settings
+        self.name = settings.get('name', 'League')
+        self.groups = []
+
+        for rule in settings.get('rules', []):
+            ops = []
+            for stat, value in rule.get('linear', {}).items():
+                op, operand = _linear(rule.get('category', '?'), stat, value)
+                ops.append((op, stat, operand, None))
+            for stat, steps in rule.get('bonuses', {}).items():
+                thresholds, points = _steps(steps)
+                ops.append((BONUS, stat, thresholds, points))
+            if 'field_goals' in rule:
+                made = _steps(rule['field_goals'].get('made', []))
+                missed = _steps(rule['field_goals'].get('missed', []))
+                buckets = self.fg_bucket_points(made, FG_MADE_BUCKETS) + self.fg_bucket_points(missed, FG_MISSED_BUCKETS)
+                ops.append((FIELD_GOALS, None, (made, missed), tuple(buckets)))
+            for stat, steps in rule.get('tiers', {}).items():
+                bounds, points = _steps(steps)
+                ops.append((TIER, stat, bounds, points))
+            self.groups.append((tuple(rule.get('gate', ())), tuple(ops)))
+
+        self._score = self._compile_scalar()
+        # Scorers specialized per stat record class, compiled on first use
+        self._scorers = {dict: self._score}
+
+    def __reduce__(self):
+        # The generated scorers can't be pickled; worker processes recompile from the settings
+        return type(self), (self.settings,)
+
+    @classmethod
+    def from_file(cls, path: str) -> 'CompiledScoring':
+        return cls(load_settings(path))
+
+    @classmethod
+    def from_scoring_table(cls, scoring: Dict[str, float], name: str = 'League') -> 'CompiledScoring':
+        return cls(settings_from_scoring_table(scoring, name))
+
+    @staticmethod
+    def bonus_points(thresholds: Tuple[float, ...], points: Tuple[float, ...], value: float) -> float:
+        """Points of the highest [at_least, points] step reached (0 below the first)"""
+        i = bisect_right(thresholds, value) - 1
+        return points[i] if i >= 0 else 0
+
+    @staticmethod
+    def fg_bucket_points(steps: Tuple[Tuple[float, ...], Tuple[float, ...]],
+                         buckets: List[Tuple[str, int]]) -> List[Tuple[str, float]]:
+        """Points per kick for each parser bucket stat (fg_0_39, ...) under these steps"""
+        bounds, points = steps
+        return [(stat, _step_points(bounds, points, distance)) for stat, distance in buckets]
+
+    def _compile_scalar(self, record_type: Optional[type] = None):
+        """
+        Generate a straight-line Python scorer from the operation tuples.
+        Each stat is read once per rule, steps become bisect lookups into
+        constant tuples, and nothing about the rules is re-interpreted per call.
+        For a StatLine record_type, stats are read as attributes (or folded to
+        their default when the record has no such field) instead of via get().
+        """
+        consts = {'bisect_left': bisect_left, 'bisect_right': bisect_right, 'fg_distance_points': _fg_distance_points}
+        fields = record_type.FIELD_SET if record_type else None
+        lines = ['def score(stats):'] + (['    get = stats.get'] if fields is None else []) + ['    points = 0.0']
+
+        def read(stat, default):
+            if fields is None:
+                return f"get({stat!r}, {default!r})"
+            if stat not in fields:
+                return repr(default)
+            # None means "absent" in a StatLine
+            return f"(stats.{stat} if stats.{stat} is not None else {default!r})"
+
+        def has(stat):
+            if fields is None:
+                return f"{stat!r} in stats"
+            return f"stats.{stat} is not None" if stat in fields else 'False'
+
+        def const(value):
+            name = f"C{len(consts)}"
+            consts[name] = value
+            return name
+
+        for gate, ops in self.groups:
+            indent = '    '
+            local = {}
+
+            def load(stat, default=0):
+                if (stat, default) not in local:
+                    local[(stat, default)] = f"v{len(local)}"
+                    lines.append(f"{indent}{local[(stat, default)]} = {read(stat, default)}")
+                return local[(stat, default)]
+
+            if gate:
+                names = [load(stat) for stat in gate]
+                lines.append(f"{indent}if {' or '.join(f'{name} > 0' for name in names)}:")
+                indent += '    '
+                if not ops:
+                    lines.append(f"{indent}pass")
+
+            for op, stat, a, b in ops:
+                if op == MUL:
+                    lines.append(f"{indent}points += {load(stat)} * {a!r}")
+                elif op == DIV:
+                    lines.append(f"{indent}points += {load(stat)} / {a!r}")
+                elif op == BONUS:
+                    i = f"i{len(lines)}"
+                    lines.append(f"{indent}{i} = bisect_right({const(a)}, {load(stat)}) - 1")
+                    lines.append(f"{indent}if {i} >= 0:")
+                    lines.append(f"{indent}    points += {const(b)}[{i}]")
+                elif op == TIER:
+                    value, i = load(stat, -1), f"i{len(lines)}"
+                    lines.append(f"{indent}if {value} >= 0:")
+                    lines.append(f"{indent}    {i} = bisect_left({const(a)}, {value})")
+                    lines.append(f"{indent}    if {i} < {len(b)}:")
+                    lines.append(f"{indent}        points += {const(b)}[{i}]")
+                else:
+                    # Exact distances when the parser kept them, else bucket counts
+                    lines.append(f"{indent}if {has('fg_made_distances')}:")
+                    lines.append(f"{indent}    points += fg_distance_points(stats, {const(a)})")
+                    lines.append(f"{indent}else:")
+                    for bucket_stat, each in b:
+                        lines.append(f"{indent}    points += {read(bucket_stat, 0)} * {each!r}")
+
+        lines.append('    return round(points, 2)')
+        source = '\n'.join(lines)
+        if record_type is None:
+            self.source = source
+        exec(compile(source, f"<scoring rules: {self.name}>", 'exec'), consts)
+        return consts['score']
+
+    def score(self, stats: Mapping) -> float:
+        """Fantasy points for one stat line, rounded to 2 decimals"""
+        scorer = self._scorers.get(type(stats))
+        if scorer is None:
+            record_type = type(stats)
+            scorer = self._compile_scalar(record_type) if issubclass(record_type, StatLine) else self._score
+            self._scorers[record_type] = scorer
+        return scorer(stats)
+
+
+def _fg_distance_points(stats: Mapping, steps) -> float:
+    """Sum made/missed field goal points from the per-kick distance lists"""
+    made, missed = steps
+    points = 0.0
+    for distance in stats.get('fg_made_distances', ()):
+        points += _step_points(made[0], made[1], distance)
+    for distance in stats.get('fg_missed_distances', ()):
+        points += _step_points(missed[0], missed[1], distance)
+    return points
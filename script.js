@@ -1,47 +1,244 @@
-// Function to load data with cache-busting
+// Delta feed written by generate_website_data.py (see delta_feed.py)
+const FEED_DIR = 'feed';
+const FEED_STORAGE_KEY = 'championshipFeed';
+const REFRESH_INTERVAL_MS = 60000;
+
+// Last document shown and its feed version
+let feedState = readFeedState();
+
+function readFeedState() {
+    try {
+        return JSON.parse(localStorage.getItem(FEED_STORAGE_KEY)) || { version: null, data: null };
+    } catch (error) {
+        return { version: null, data: null };
+    }
+}
+
+function saveFeedState() {
+    try {
+        localStorage.setItem(FEED_STORAGE_KEY, JSON.stringify(feedState));
+    } catch (error) {
+        // Storage full or disabled: the next visit just starts from the snapshot
+    }
+}
+
+async function fetchJson(url, options) {
+    const response = await fetch(url, options);
+    if (!response.ok) {
+        throw new Error(`HTTP error! status: ${response.status}`);
+    }
+    return response.json();
+}
+
+// Apply RFC 6902 add/remove/replace operations to a copy of a document
+function applyPatch(document, patch) {
+    let result = structuredClone(document);
+    patch.forEach(op => {
+        const tokens = op.path.split('/').slice(1).map(token => token.replace(/~1/g, '/').replace(/~0/g, '~'));
+        if (tokens.length === 0) {
+            result = op.value;
+            return;
+        }
+        let parent = result;
+        tokens.slice(0, -1).forEach(token => {
+            parent = parent[Array.isArray(parent) ? Number(token) : token];
+        });
+        const key = tokens[tokens.length - 1];
+        if (Array.isArray(parent)) {
+            const index = key === '-' ? parent.length : Number(key);
+            if (op.op === 'add') {
+                parent.splice(index, 0, op.value);
+            } else if (op.op === 'remove') {
+                parent.splice(index, 1);
+            } else {
+                parent[index] = op.value;
+            }
+        } else if (op.op === 'remove') {
+            delete parent[key];
+        } else {
+            parent[key] = op.value;
+        }
+    });
+    return result;
+}
+
+// Bring feedState up to the manifest's version: patches if they're smaller, else the snapshot
+async function updateFromFeed(manifest) {
+    if (feedState.data && feedState.version === manifest.version) {
+        return false;
+    }
+    const patches = manifest.patches || [];
+    let start = -1;
+    patches.forEach((entry, i) => {
+        if (entry.from === feedState.version) {
+            start = i;
+        }
+    });
+    const steps = start >= 0 && feedState.data ? patches.slice(start) : [];
+    const patchBytes = steps.reduce((total, entry) => total + entry.bytes, 0);
+    
+    if (steps.length > 0 && patchBytes < manifest.snapshot_bytes) {
+        try {
+            // Patch and snapshot files never change, so the default (cached) fetch is fine
+            let data = feedState.data;
+            for (const entry of steps) {
+                data = applyPatch(data, await fetchJson(`${FEED_DIR}/patch.${entry.from}.${entry.to}.json`));
+            }
+            feedState = { version: manifest.version, data };
+            return true;
+        } catch (error) {
+            console.warn('Patch failed, loading snapshot instead:', error);
+        }
+    }
+    feedState = { version: manifest.version, data: await fetchJson(`${FEED_DIR}/${manifest.snapshot}`) };
+    return true;
+}
+
+let renderedOnce = false;
+
+// Load the latest results: manifest + deltas, or the full file if there is no feed
 async function loadData() {
+    const previous = feedState.data;
+    let changed;
     try {
-        // Add timestamp to prevent CDN caching
-        const cacheBuster = new Date().getTime();
-        const response = await fetch(`championship_results.json?v=${cacheBuster}`);
-        
-        if (!response.ok) {
-            throw new Error(`HTTP error! status: ${response.status}`);
+        // Only the small manifest bypasses caches
+        const manifest = await fetchJson(`${FEED_DIR}/manifest.json?v=${Date.now()}`);
+        changed = await updateFromFeed(manifest);
+    } catch (feedError) {
+        try {
+            const data = await fetchJson(`championship_results.json?v=${Date.now()}`);
+            changed = data.content_hash !== (previous && previous.content_hash);
+            // Same version ids as the feed and the live server
+            feedState = { version: data.content_hash ? data.content_hash.slice(0, 16) : null, data };
+        } catch (error) {
+            console.error('Error loading data:', error);
+            if (!previous) {
+                showDataError();
+                return;
+            }
+            // Offline: keep showing the last version we had
+            changed = false;
         }
-        
-        const data = await response.json();
-        
-        // Update scores and populate tables
-        updateScoreboard(data);
-        populateRoster('team1', data.team1);
-        populateRoster('team2', data.team2);
-        populateTopPerformers(data.top_performers);
-        updateLastUpdated(data.generated_at);
-        
-        // Determine winner
-        showWinner(data.team1, data.team2);
-        
-    } catch (error) {
-        console.error('Error loading data:', error);
-        // Show error message to user
-        document.querySelector('.main').innerHTML = `
-            <div style="text-align: center; padding: 60px 20px; color: #FF6B35;">
-                <h2 style="font-size: 32px; margin-bottom: 20px;">⚠️ Data Not Available</h2>
-                <p style="font-size: 18px; color: #8B92B8;">
-                    Run <code style="background: #151B3B; padding: 4px 8px; border-radius: 4px;">python generate_website_data.py</code> to generate the data file.
-                </p>
-            </div>
-        `;
     }
+    
+    showFeedState(previous, changed);
+}
+
+// Render on first load, and afterwards only when the version changed
+function showFeedState(previous, changed) {
+    if (changed || !renderedOnce) {
+        saveFeedState();
+        render(feedState.data, renderedOnce ? previous : null);
+        renderedOnce = true;
+    }
+}
+
+function showVersion(version, data) {
+    const previous = feedState.data;
+    const changed = version !== feedState.version || !previous;
+    feedState = { version, data };
+    showFeedState(previous, changed);
+}
+
+let pollTimer = null;
+
+function startPolling() {
+    if (pollTimer === null) {
+        pollTimer = setInterval(loadData, REFRESH_INTERVAL_MS);
+    }
+}
+
+function stopPolling() {
+    clearInterval(pollTimer);
+    pollTimer = null;
+}
+
+// Served by `championship_matchup.py serve`: new versions are pushed over SSE
+function connectLiveUpdates() {
+    if (!window.EventSource) {
+        return;
+    }
+    const source = new EventSource('events');
+    let connected = false;
+    
+    source.addEventListener('snapshot', event => {
+        connected = true;
+        stopPolling();
+        const message = JSON.parse(event.data);
+        showVersion(message.version, message.data);
+    });
+    source.addEventListener('patch', event => {
+        const message = JSON.parse(event.data);
+        if (feedState.version !== message.from) {
+            // Missed a version: reconnecting starts with a fresh snapshot
+            source.close();
+            connectLiveUpdates();
+            return;
+        }
+        showVersion(message.to, applyPatch(feedState.data, message.patch));
+    });
+    source.addEventListener('error', () => {
+        if (!connected) {
+            // Static hosting has no /events: keep polling the manifest
+            source.close();
+        } else {
+            // The browser keeps reconnecting; poll until the next snapshot arrives
+            startPolling();
+        }
+    });
+}
+
+// Update scores and populate tables
+function render(data, previous) {
+    updateScoreboard(data, previous);
+    populateRoster('team1', data.team1);
+    populateRoster('team2', data.team2);
+    populateTopPerformers(data.top_performers);
+    updateLastUpdated(data.generated_at);
+    
+    // Determine winner
+    showWinner(data.team1, data.team2);
+}
+
+// Show error message to user
+function showDataError() {
+    document.querySelector('.main').innerHTML = `
+        <div style="text-align: center; padding: 60px 20px; color: #FF6B35;">
+            <h2 style="font-size: 32px; margin-bottom: 20px;">⚠️ Data Not Available</h2>
+            <p style="font-size: 18px; color: #8B92B8;">
+                Run <code style="background: #151B3B; padding: 4px 8px; border-radius: 4px;">python generate_website_data.py</code> to generate the data file.
+            </p>
+        </div>
+    `;
 }
 
 // Update scoreboard
-function updateScoreboard(data) {
+function updateScoreboard(data, previous) {
     const team1Score = document.getElementById('team1-score');
     const team2Score = document.getElementById('team2-score');
     
-    animateNumber(team1Score, 0, data.team1.total_points, 2000);
-    animateNumber(team2Score, 0, data.team2.total_points, 2000);
+    // Count up from the last scores shown on a refresh, from 0 on first load
+    animateNumber(team1Score, previous ? previous.team1.total_points : 0, data.team1.total_points, 2000);
+    animateNumber(team2Score, previous ? previous.team2.total_points : 0, data.team2.total_points, 2000);
+    
+    updateWinProbability(data.win_probability);
+}
+
+// Show simulated win probability while games are live
+function updateWinProbability(winProbability) {
+    ['team1', 'team2'].forEach(teamId => {
+        const element = document.getElementById(`${teamId}-win-prob`);
+        if (!element) {
+            return;
+        }
+        if (!winProbability) {
+            element.classList.add('hidden');
+            return;
+        }
+        const team = winProbability[teamId];
+        element.textContent = `${(team.win_probability * 100).toFixed(1)}% to win • proj ${team.projected_points.toFixed(2)}`;
+        element.classList.remove('hidden');
+    });
 }
 
 // Animate number counting up
@@ -139,8 +336,13 @@ function updateLastUpdated(timestamp) {
     element.textContent = date.toLocaleString();
 }
 
-// Load data when page loads
-document.addEventListener('DOMContentLoaded', loadData);
+// Load data when page loads, then check for new versions: pushed by a live
+// server if there is one, otherwise by polling the manifest
+document.addEventListener('DOMContentLoaded', () => {
+    loadData();
+    startPolling();
+    connectLiveUpdates();
+});
 
 // Add CSS animation for table rows
 const style = document.createElement('style');
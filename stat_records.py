@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Compact stat line records
+
+Offensive, kicker and D/ST stat lines used to be plain dicts with 8-15
+keys each. For a season of player-game rows that is a lot of per-row hash
+tables, so the parsers now build __slots__ dataclasses instead: fixed
+attributes, no per-instance dict, attribute access in the hot loops.
+
+Every record is also a MutableMapping over its fields, so existing code
+that does stats.get('passing_yards', 0), stats['name'] = ..., .copy() or
+compares against a dict keeps working. A field holding None is treated as
+absent (e.g. a D/ST line for a team that didn't play has no
+'points_allowed'), which keeps the mapping view identical to the dicts
+the parsers produced before.
+"""
+
+from collections.abc import MutableMapping
+from dataclasses import dataclass, fields
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+
+class StatLine(MutableMapping):
+    """Dict-compatible view over a record's slot fields"""
+
+    __slots__ = ()
+    FIELDS: Tuple[str, ...] = ()
+    FIELD_SET: FrozenSet[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if '__dataclass_fields__' in cls.__dict__:
+            cls.FIELDS = tuple(f.name for f in fields(cls))
+            cls.FIELD_SET = frozenset(cls.FIELDS)
+
+    def get(self, key, default=None):
+        if key in self.FIELD_SET:
+            value = getattr(self, key)
+            if value is not None:
+                return value
+        return default
+
+    def __getitem__(self, key):
+        if key in self.FIELD_SET:
+            value = getattr(self, key)
+            if value is not None:
+                return value
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key not in self.FIELD_SET:
+            raise KeyError(f"{type(self).__name__} has no field '{key}'")
+        setattr(self, key, value)
+
+    def __delitem__(self, key):
+        if self.get(key) is None:
+            raise KeyError(key)
+        setattr(self, key, None)
+
+    def __contains__(self, key):
+        return key in self.FIELD_SET and getattr(self, key) is not None
+
+    def __iter__(self):
+        return (name for name in self.FIELDS if getattr(self, name) is not None)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def copy(self):
+        """Shallow copy, like dict.copy()"""
+        return type(self)(*(getattr(self, name) for name in self.FIELDS))
+
+    def to_dict(self) -> Dict:
+        return {name: getattr(self, name) for name in self}
+
+
+@dataclass(slots=True, eq=False)
+class PlayerLine(StatLine):
+    """Offensive stat line for one player in one game"""
+    name: Optional[str] = None
+    team: Optional[str] = None
+    position: Optional[str] = None
+    passing_yards: int = 0
+    passing_tds: int = 0
+    passing_2pt: int = 0
+    interceptions: int = 0
+    rushing_yards: int = 0
+    rushing_tds: int = 0
+    rushing_2pt: int = 0
+    receptions: int = 0
+    receiving_yards: int = 0
+    receiving_tds: int = 0
+    receiving_2pt: int = 0
+    fumbles_lost: int = 0
+
+
+@dataclass(slots=True, eq=False)
+class KickerLine(StatLine):
+    """Kicking stat line; the distance lists are None when only bucket counts are known"""
+    name: Optional[str] = None
+    pat_made: int = 0
+    pat_missed: int = 0
+    fg_0_39: int = 0
+    fg_40_49: int = 0
+    fg_50_plus: int = 0
+    fg_miss_0_39: int = 0
+    fg_miss_40_49: int = 0
+    fg_miss_50_plus: int = 0
+    fg_made_distances: Optional[List[int]] = None
+    fg_missed_distances: Optional[List[int]] = None
+    team: Optional[str] = None
+    position: Optional[str] = None
+
+
+@dataclass(slots=True, eq=False)
+class DefenseLine(StatLine):
+    """Team D/ST stat line; points_allowed is None when the team didn't play"""
+    points_allowed: Optional[int] = None
+    sacks: float = 0
+    defensive_interceptions: int = 0
+    fumble_recoveries: int = 0
+    safeties: int = 0
+    blocked_kicks: int = 0
+    return_tds: int = 0
+    name: Optional[str] = None
+    team: Optional[str] = None
+    position: Optional[str] = None
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Shared per-slate stat store
+
+Every game on a slate is fetched and parsed once into a SlateStats; any
+number of rosters can then be scored against it without re-fetching or
+re-parsing anything.
+
+Stat lines are kept per (game_id, entity), where the entity is the
+parser's key: "TEAM_athleteid" for players, "TEAM_W.Lutz" (kicking team
+and play-by-play name) for kickers and the team abbreviation for D/ST. A slate that
+spans several games for the same entity (multi-week windows, both rounds
+of a two-week playoff) therefore keeps every game instead of letting the
+last one overwrite the rest. players / kickers / defenses hold the
+aggregated line per entity for lookup and display; fantasy points are
+scored per game and summed (entity_points), so per-game rules such as
+yardage bonuses and D/ST points-allowed tiers stay correct.
+
+replace_game() swaps one game's lines and re-aggregates only the entities
+that game touches, so refreshing a live game costs time proportional to
+that game.
+"""
+
+from itertools import count
+from typing import Callable, Dict, List, Mapping, Optional, Set, Tuple
+
+from player_index import PlayerIndex
+
+KINDS = ('player', 'kicker', 'defense')
+
+
+def combine_lines(lines: List[Mapping]) -> Mapping:
+    """Sum several games' stat lines for one entity (counts add, distance lists concatenate)"""
+    total = lines[0].copy()
+    for line in lines[1:]:
+        for key, value in line.items():
+            current = total.get(key)
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                total[key] = (current or 0) + value
+            elif isinstance(value, list):
+                total[key] = list(current or []) + value
+            elif current is None:
+                total[key] = value
+    return total
+
+
+class SlateStats:
+    """Parsed player, kicker and D/ST stats for every game on a slate"""
+
+    def __init__(self):
+        # kind -> entity key -> game_id -> stat line
+        self.lines: Dict[str, Dict[str, Dict[str, Mapping]]] = {kind: {} for kind in KINDS}
+        self.game_entities: Dict[str, Tuple[Tuple[str, ...], ...]] = {}
+        # Games parsed from their final summary, whose lines can't change again
+        self.final_games: Set[str] = set()
+
+        # Aggregated line per entity across all games
+        self.players: Dict[str, Dict] = {}
+        self.kickers: Dict[str, Dict] = {}
+        self.defenses: Dict[str, Dict] = {}
+        self._aggregates = dict(zip(KINDS, (self.players, self.kickers, self.defenses)))
+
+        self._index: Optional[PlayerIndex] = None
+        self._game_ids = count()
+
+    @property
+    def games(self) -> int:
+        return len(self.game_entities)
+
+    def add_game(self, players: Dict[str, Dict], kickers: Dict[str, Dict], defenses: Dict[str, Dict],
+                 game_id: Optional[str] = None):
+        """Add one game's parsed stats (pass game_id so the game can be replaced later)"""
+        if game_id is None:
+            game_id = f"game-{next(self._game_ids)}"
+        self.replace_game(game_id, players, kickers, defenses)
+
+    def replace_game(self, game_id: str, players: Dict[str, Dict], kickers: Dict[str, Dict],
+                     defenses: Dict[str, Dict]):
+        """Set (or reset) one game's stats, re-aggregating only the entities involved"""
+        old_entities = self.game_entities.get(game_id, ((), (), ()))
+        new_entities = []
+
+        for kind, parsed, old_keys in zip(KINDS, (players, kickers, defenses), old_entities):
+            lines = self.lines[kind]
+            for key in old_keys:
+                if key not in parsed:
+                    del lines[key][game_id]
+            for key, line in parsed.items():
+                lines.setdefault(key, {})[game_id] = line
+            for key in set(old_keys) | parsed.keys():
+                self._aggregate(kind, key)
+            new_entities.append(tuple(parsed))
+
+        self.game_entities[game_id] = tuple(new_entities)
+        self._index = None
+
+    def remove_game(self, game_id: str):
+        """Drop one game's stats"""
+        if game_id in self.game_entities:
+            self.replace_game(game_id, {}, {}, {})
+            del self.game_entities[game_id]
+        self.final_games.discard(game_id)
+
+    def _aggregate(self, kind: str, key: str):
+        by_game = self.lines[kind].get(key)
+        aggregates = self._aggregates[kind]
+        if not by_game:
+            self.lines[kind].pop(key, None)
+            aggregates.pop(key, None)
+        elif len(by_game) == 1:
+            aggregates[key] = next(iter(by_game.values()))
+        else:
+            aggregates[key] = combine_lines(list(by_game.values()))
+
+    def game_lines(self, kind: str, key: str) -> List[Mapping]:
+        """One stat line per game for an entity (empty if it has none)"""
+        return list(self.lines[kind].get(key, {}).values())
+
+    def entity_points(self, kind: str, key: Optional[str], score: Callable[[Mapping], float]) -> Optional[float]:
+        """Fantasy points summed over the entity's games, or None if it has none"""
+        lines = self.game_lines(kind, key) if key is not None else []
+        if not lines:
+            return None
+        return round(sum(score(line) for line in lines), 2)
+
+    @property
+    def index(self) -> PlayerIndex:
+        """Name lookup index, built on first use after the last change"""
+        if self._index is None:
+            self._index = PlayerIndex(self.players, self.kickers)
+        return self._index
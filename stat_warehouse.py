@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+SQLite stat warehouse - every parsed stat line, per game and per player
+
+Stores the offensive, kicker and D/ST stat lines of every ingested game
+together with their fantasy points, indexed by (season, week, team,
+player_id). Scoring a past week, trying a new league format or building a
+season leaderboard is then a query instead of a re-fetch and re-parse of
+ESPN summaries.
+
+Usage:
+    python backfill.py 2025 --warehouse stats.db          # fill it
+    python stat_warehouse.py stats.db leaderboard 2025 [--week 3] [--position QB] [--settings FILE]
+    python stat_warehouse.py stats.db league 2025 3 league.example.json
+"""
+
+import argparse
+import json
+import sqlite3
+from typing import Dict, Iterable, List, Optional
+
+from scoring_rules import CompiledScoring
+from stat_records import DefenseLine, KickerLine, PlayerLine, StatLine
+from stat_store import SlateStats
+
+# Parser output order in parse_game, and the record type of each kind
+RECORD_TYPES = {'player': PlayerLine, 'kicker': KickerLine, 'defense': DefenseLine}
+
+IDENTITY_FIELDS = ('name', 'team', 'position')
+# Roster position of the kinds whose parsed lines don't carry one
+KIND_POSITIONS = {'kicker': 'K', 'defense': 'D/ST'}
+LIST_FIELDS = ('fg_made_distances', 'fg_missed_distances')
+
+# One numeric column per stat field across all record types
+STAT_FIELDS = []
+for _record_type in RECORD_TYPES.values():
+    for _field in _record_type.FIELDS:
+        if _field not in IDENTITY_FIELDS and _field not in LIST_FIELDS and _field not in STAT_FIELDS:
+            STAT_FIELDS.append(_field)
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS games (
+    game_id TEXT PRIMARY KEY,
+    season INTEGER,
+    seasontype INTEGER,
+    week INTEGER
+);
+CREATE TABLE IF NOT EXISTS stat_lines (
+    game_id TEXT NOT NULL REFERENCES games(game_id),
+    season INTEGER,
+    seasontype INTEGER,
+    week INTEGER,
+    kind TEXT NOT NULL,
+    entity_key TEXT NOT NULL,
+    player_id TEXT,
+    name TEXT,
+    team TEXT,
+    position TEXT,
+    {', '.join(f'{field} REAL' for field in STAT_FIELDS)},
+    fg_distances TEXT,
+    points REAL,
+    PRIMARY KEY (game_id, kind, entity_key)
+);
+CREATE INDEX IF NOT EXISTS stat_lines_season_week_team_player
+    ON stat_lines (season, week, team, player_id);
+CREATE INDEX IF NOT EXISTS stat_lines_player ON stat_lines (player_id, season);
+"""
+
+
+def stat_rows(matchup, game_id: str, parsed, rules: Optional[CompiledScoring] = None) -> List[Dict]:
+    """Flatten parse_game output into scored row dicts (kind, key, stats..., points)"""
+    rows = []
+    for kind, lines in zip(RECORD_TYPES, parsed):
+        for key, line in lines.items():
+            # Kickers score from their play-by-play line; the box-score row is a zero-point duplicate
+            if kind == 'player' and line.position == 'K':
+                continue
+            row = line.to_dict()
+            row.update(game_id=game_id, kind=kind, key=key,
+                       points=matchup.calculate_fantasy_points(line, rules))
+            if kind in KIND_POSITIONS:
+                row['position'] = KIND_POSITIONS[kind]
+            if kind == 'defense':
+                row.setdefault('team', key)
+            rows.append(row)
+    return rows
+
+
+def _player_id(kind: str, key: str) -> str:
+    """Stable id per entity: ESPN athlete id, team + play-by-play name for kickers ("DEN_W.Lutz"), or team"""
+    if kind == 'player':
+        return key.partition('_')[2] or key
+    # Kickers only have their short name in the play text, so the team keeps two "B.Smith"s apart
+    return key
+
+
+def _week(week) -> Optional[int]:
+    return week if isinstance(week, int) else None
+
+
+class StatWarehouse:
+    """Per-game, per-player stat lines and points in one SQLite file"""
+
+    def __init__(self, path: str = 'stats.db'):
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.row_factory = sqlite3.Row
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    # BackfillStore-compatible interface, so backfill.py can write straight here
+
+    def has(self, season, seasontype: int, week, game_id: str) -> bool:
+        return self.db.execute('SELECT 1 FROM games WHERE game_id = ?', (game_id,)).fetchone() is not None
+
+    def save(self, season, seasontype: int, week, game_id: str, rows: Iterable[Dict]):
+        """Replace one game's stat lines"""
+        week = _week(week)
+        columns = ['game_id', 'season', 'seasontype', 'week', 'kind', 'entity_key', 'player_id',
+                   *IDENTITY_FIELDS, *STAT_FIELDS, 'fg_distances', 'points']
+        values = []
+        for row in rows:
+            distances = {field: row[field] for field in LIST_FIELDS if field in row}
+            values.append((game_id, season, seasontype, week, row['kind'], row['key'],
+                           _player_id(row['kind'], row['key']),
+                           *(row.get(field) for field in IDENTITY_FIELDS),
+                           *(row.get(field) for field in STAT_FIELDS),
+                           json.dumps(distances) if distances else None, row.get('points')))
+
+        with self.db:
+            self.db.execute('DELETE FROM stat_lines WHERE game_id = ?', (game_id,))
+            self.db.execute('INSERT OR REPLACE INTO games VALUES (?, ?, ?, ?)', (game_id, season, seasontype, week))
+            self.db.executemany(f"INSERT INTO stat_lines ({', '.join(columns)}) "
+                                f"VALUES ({', '.join('?' * len(columns))})", values)
+
+    def add_game(self, matchup, game_id: str, game_data: Dict, season, seasontype: int, week,
+                 rules: Optional[CompiledScoring] = None):
+        """Parse, score and store one summary"""
+        self.save(season, seasontype, week, game_id, stat_rows(matchup, game_id, matchup.parse_game(game_data), rules))
+
+    def query(self, season=None, week=None, team=None, player_id=None, kind=None,
+              seasontype=None, position=None) -> List[sqlite3.Row]:
+        """Stat line rows matching every given filter"""
+        filters = {'season': season, 'week': week, 'team': team, 'player_id': player_id,
+                   'kind': kind, 'seasontype': seasontype, 'position': position}
+        where = [f"{column} = ?" for column, value in filters.items() if value is not None]
+        sql = 'SELECT * FROM stat_lines' + (f" WHERE {' AND '.join(where)}" if where else '')
+        return self.db.execute(sql, [value for value in filters.values() if value is not None]).fetchall()
+
+    @staticmethod
+    def record(row: sqlite3.Row) -> StatLine:
+        """Rebuild the parser's stat record from a stored row"""
+        record_type = RECORD_TYPES[row['kind']]
+        values = {field: row[field] for field in record_type.FIELDS if field in row.keys()}
+        for field in STAT_FIELDS:
+            # Stored as REAL; counts come back as ints like the parsers produce
+            value = values.get(field)
+            if isinstance(value, float) and value.is_integer() and field != 'sacks':
+                values[field] = int(value)
+        if row['fg_distances']:
+            values.update(json.loads(row['fg_distances']))
+        if row['kind'] == 'defense':
+            # D/ST identity comes from the roster slot, not the parse
+            values.update(name=None, team=None, position=None)
+        elif row['kind'] == 'kicker':
+            # The kicking team stays: roster kickers are looked up by team. The
+            # position column is only there for queries; parsed kicker lines have none
+            values.update(position=None)
+        return record_type(**values)
+
+    def slate(self, season, week, seasontype: Optional[int] = None) -> SlateStats:
+        """A past week as a SlateStats, ready for score_roster / League.score_stats"""
+        stats = SlateStats()
+        by_game: Dict[str, tuple] = {}
+        for row in self.query(season=season, week=week, seasontype=seasontype):
+            parsed = by_game.setdefault(row['game_id'], ({}, {}, {}))
+            parsed[list(RECORD_TYPES).index(row['kind'])][row['entity_key']] = self.record(row)
+        for game_id, parsed in by_game.items():
+            stats.add_game(*parsed, game_id=game_id)
+        return stats
+
+    def leaderboard(self, season, week=None, position=None, limit: int = 20,
+                    rules: Optional[CompiledScoring] = None) -> List[Dict]:
+        """Top scorers over a season (or one week); rules re-scores with another format"""
+        if rules is None:
+            filters = {'season': season, 'week': week, 'position': position}
+            where = [f"{column} = ?" for column, value in filters.items() if value is not None]
+            sql = ('SELECT kind, player_id, name, team, position, COUNT(*) AS games, SUM(points) AS points '
+                   'FROM stat_lines' + (f" WHERE {' AND '.join(where)}" if where else '')
+                   + ' GROUP BY kind, player_id ORDER BY points DESC LIMIT ?')
+            rows = self.db.execute(
+                sql,
+                [value for value in filters.values() if value is not None] + [limit]).fetchall()
+            return [dict(row, points=round(row['points'], 2)) for row in rows]
+
+        totals: Dict[tuple, Dict] = {}
+        for row in self.query(season=season, week=week, position=position):
+            entry = totals.setdefault((row['kind'], row['player_id']), {
+                'kind': row['kind'], 'player_id': row['player_id'], 'name': row['name'],
+                'team': row['team'], 'position': row['position'], 'games': 0, 'points': 0.0})
+            entry['games'] += 1
+            entry['points'] += rules.score(self.record(row))
+        ranked = sorted(totals.values(), key=lambda entry: entry['points'], reverse=True)[:limit]
+        for entry in ranked:
+            entry['points'] = round(entry['points'], 2)
+        return ranked
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Query the stat warehouse')
+    parser.add_argument('database', help='SQLite file written by backfill.py --warehouse')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    board = commands.add_parser('leaderboard', help='top fantasy scorers')
+    board.add_argument('season', type=int)
+    board.add_argument('--week', type=int)
+    board.add_argument('--position')
+    board.add_argument('--limit', type=int, default=20)
+    board.add_argument('--settings', help='re-score with this league settings file')
+
+    league = commands.add_parser('league', help='score a league config against a past week')
+    league.add_argument('season', type=int)
+    league.add_argument('week', type=int)
+    league.add_argument('config', help='league config JSON file')
+    league.add_argument('--seasontype', type=int, default=2)
+    args = parser.parse_args()
+
+    warehouse = StatWarehouse(args.database)
+    if args.command == 'leaderboard':
+        rules = CompiledScoring.from_file(args.settings) if args.settings else None
+        for i, entry in enumerate(warehouse.leaderboard(args.season, args.week, args.position,
+                                                        args.limit, rules), 1):
+            print(f"{i:3}. {entry['name'] or entry['player_id']:<28} {entry['team'] or '':<4} "
+                  f"{entry['position'] or '':<5} {entry['games']:3} games {entry['points']:8.2f}")
+    else:
+        from league import League
+        data = League.load(args.config).score_stats(warehouse.slate(args.season, args.week, args.seasontype))
+        for result in data['matchups']:
+            team1, team2 = result['team1'], result['team2']
+            print(f"  {team1['name']} {team1['total_points']:.2f} - {team2['total_points']:.2f} {team2['name']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Keep only the parts of an ESPN summary document the parsers read
+
+A summary payload is hundreds of KB to several MB, mostly news, odds,
+win probability and video metadata. The parsers only use
+header.competitions, boxscore.players and drives.previous, so
+load_summary() builds just those subtrees and skips the rest while
+reading. With ijson installed (pip install ijson) the document is parsed
+as a stream and the unused parts are never materialized; without it the
+whole document is decoded once and trimmed immediately, so only the
+trimmed form outlives the call.
+
+Trimmed summaries can also be stored on disk: ESPNSource caches and
+records the trimmed form, and running this module rewrites an existing
+recording directory in place:
+
+    python summary_trim.py recordings/champ
+"""
+
+import json
+import os
+import sys
+import tempfile
+from typing import IO, Dict
+
+# ijson module, imported on the first load_summary (None if not installed)
+_ijson = False
+
+# Dotted paths of every subtree the parsers read
+KEEP_PATHS = ('header.id', 'header.competitions', 'boxscore.players', 'drives.previous')
+
+
+def trim_summary(document: Dict) -> Dict:
+    """Copy of a decoded summary holding only KEEP_PATHS"""
+    trimmed = {}
+    for path in KEEP_PATHS:
+        node = document
+        keys = path.split('.')
+        for key in keys:
+            if not isinstance(node, dict) or key not in node:
+                break
+            node = node[key]
+        else:
+            target = trimmed
+            for key in keys[:-1]:
+                target = target.setdefault(key, {})
+            target[keys[-1]] = node
+    return trimmed
+
+
+def streaming_parser():
+    """The ijson module if it is installed, else None (imported on first use)"""
+    global _ijson
+    if _ijson is False:
+        try:
+            import ijson
+        except ImportError:
+            ijson = None
+        _ijson = ijson
+    return _ijson
+
+
+def _stream_summary(fp: IO[bytes], ijson) -> Dict:
+    """Build only KEEP_PATHS from a byte stream with ijson"""
+    trimmed = {}
+    builder, building = None, None
+
+    for prefix, event, value in ijson.parse(fp, use_float=True):
+        if builder is not None:
+            if prefix == building and event in ('end_map', 'end_array'):
+                builder.event(event, value)
+                target = trimmed
+                keys = building.split('.')
+                for key in keys[:-1]:
+                    target = target.setdefault(key, {})
+                target[keys[-1]] = builder.value
+                builder, building = None, None
+            else:
+                builder.event(event, value)
+            continue
+
+        if prefix in KEEP_PATHS:
+            if event in ('start_map', 'start_array'):
+                builder, building = ijson.ObjectBuilder(), prefix
+                builder.event(event, value)
+            elif event not in ('map_key', 'end_map', 'end_array'):
+                keys = prefix.split('.')
+                target = trimmed
+                for key in keys[:-1]:
+                    target = target.setdefault(key, {})
+                target[keys[-1]] = value
+
+    return trimmed
+
+
+def load_summary(fp: IO[bytes]) -> Dict:
+    """Read a summary document from a binary stream, keeping only what the parsers use"""
+    ijson = streaming_parser()
+    if ijson is not None:
+        return _stream_summary(fp, ijson)
+    return trim_summary(json.load(fp))
+
+
+def trim_directory(directory: str) -> int:
+    """Rewrite every recorded summary under directory/summary in trimmed form"""
+    summary_dir = os.path.join(directory, 'summary')
+    saved = 0
+    for filename in sorted(os.listdir(summary_dir)):
+        if not filename.endswith('.json'):
+            continue
+        path = os.path.join(summary_dir, filename)
+        before = os.path.getsize(path)
+        with open(path, 'rb') as f:
+            trimmed = load_summary(f)
+        fd, tmp_path = tempfile.mkstemp(dir=summary_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(trimmed, f)
+        os.replace(tmp_path, path)
+        saved += before - os.path.getsize(path)
+    return saved
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 2:
+        print(f"Usage: {sys.argv[0]} RECORDING_DIR")
+        sys.exit(1)
+    print(f"✓ Trimmed summaries, saved {trim_directory(sys.argv[1]) / 1024:.0f} KB")
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Columnar fantasy scoring with NumPy
+
+score_columns() applies a league's compiled scoring rules to many
+player-game rows at once. Input is a dict of arrays (or a NumPy structured
+array) keyed by the same stat names the parsers produce ('passing_yards',
+'rushing_tds', 'fg_40_49', 'points_allowed', ...). Every operation in a
+CompiledScoring (category gates, linear terms, yardage bonuses, D/ST
+points-allowed tiers, field-goal buckets) runs as array operations in the
+same order as CompiledScoring.score, so the result matches the scalar
+scorer row for row.
+
+Requires numpy (pip install numpy).
+"""
+
+from typing import Dict, Iterable, Mapping, Union
+
+import numpy as np
+
+from scoring_rules import BONUS, DIV, MUL, TIER, CompiledScoring
+
+Columns = Union[Mapping[str, Iterable], np.ndarray]
+
+# Stat columns read by the scorer; missing ones default to 0
+# (points_allowed defaults to -1, meaning "not a D/ST row")
+STAT_COLUMNS = [
+    'passing_yards', 'passing_tds', 'passing_2pt', 'interceptions',
+    'rushing_yards', 'rushing_tds', 'rushing_2pt',
+    'receptions', 'receiving_yards', 'receiving_tds', 'receiving_2pt',
+    'fumbles_lost',
+    'pat_made', 'pat_missed', 'fg_0_39', 'fg_40_49', 'fg_50_plus', 'fg_miss_0_39', 'fg_miss_40_49',
+    'fg_miss_50_plus',
+    'points_allowed', 'sacks', 'defensive_interceptions', 'fumble_recoveries', 'safeties',
+    'blocked_kicks', 'return_tds',
+]
+
+
+def stats_to_columns(rows: Iterable[Mapping]) -> Dict[str, np.ndarray]:
+    """Convert per-player stat dicts into a dict of float64 columns"""
+    rows = list(rows)
+    columns = {}
+    for name in STAT_COLUMNS:
+        default = -1 if name == 'points_allowed' else 0
+        columns[name] = np.fromiter((row.get(name, default) for row in rows), dtype=np.float64, count=len(rows))
+    return columns
+
+
+def _column_getter(columns: Columns):
+    """Return (n_rows, get(name, default) -> float64 array)"""
+    if isinstance(columns, np.ndarray):
+        names = columns.dtype.names or ()
+        n = len(columns)
+        lookup = {name: columns[name] for name in names}
+    else:
+        lookup = dict(columns)
+        n = len(next(iter(lookup.values()))) if lookup else 0
+
+    def get(name: str, default: float = 0.0) -> np.ndarray:
+        if name in lookup:
+            return np.asarray(lookup[name], dtype=np.float64)
+        return np.full(n, default, dtype=np.float64)
+
+    return n, get
+
+
+def score_columns(columns: Columns, rules: Union[CompiledScoring, Dict[str, float]]) -> np.ndarray:
+    """Fantasy points for every row, rounded to 2 decimals like the scalar scorer"""
+    if not isinstance(rules, CompiledScoring):
+        rules = CompiledScoring.from_scoring_table(rules)
+
+    n, col = _column_getter(columns)
+    points = np.zeros(n, dtype=np.float64)
+
+    for gate, ops in rules.groups:
+        mask = None
+        if gate:
+            mask = np.zeros(n, dtype=bool)
+            for stat in gate:
+                mask |= col(stat) > 0
+
+        for op, stat, a, b in ops:
+            if op == MUL:
+                term = col(stat) * a
+            elif op == DIV:
+                term = col(stat) / a
+            elif op == BONUS:
+                # Highest [at_least, points] step reached, 0 below the first
+                step_points = np.array((0,) + tuple(b), dtype=np.float64)
+                term = step_points[np.searchsorted(np.array(a, dtype=np.float64), col(stat), side='right')]
+            elif op == TIER:
+                # Lookup table instead of an if/elif ladder; rows without the stat are skipped
+                value = col(stat, -1.0)
+                step_points = np.array(tuple(b) + (0,), dtype=np.float64)
+                term = np.where(value >= 0, step_points[np.searchsorted(np.array(a, dtype=np.float64), value)], 0.0)
+            else:
+                # Columns carry bucket counts (fg_0_39, ...), not per-kick distances
+                for bucket_stat, each in b:
+                    term = col(bucket_stat) * each
+                    points = points + term if mask is None else np.where(mask, points + term, points)
+                continue
+
+            # Terms are added one at a time so float rounding matches the scalar path
+            points = points + term if mask is None else np.where(mask, points + term, points)
+
+    return np.round(points, 2)
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Monte Carlo win probability for a live matchup
+
+For every roster slot still playing, the rest of its game is simulated
+many times: remaining production is drawn from a simple per-position
+distribution (Poisson for touchdowns, receptions, sacks, ...; a rounded
+normal for yardage and points allowed), scaled by the share of the game
+clock left on the scoreboard. Each simulated final stat line - what the
+player already has plus the sampled remainder - is scored with the
+league's compiled rules through the columnar scorer, so yardage bonuses
+and D/ST points-allowed tiers apply to the simulated totals exactly as
+they would to a real final line.
+
+Slots whose games are over contribute their realized points; slots whose
+team hasn't kicked off are simulated for a full game. Sampling and
+scoring are vectorized over batches of simulations, and the batches can
+be spread across a process pool (workers=N).
+
+Simulations are seeded (seed=0 by default), so an unchanged slate gives
+the same probabilities on every refresh and the results file is only
+rewritten when something actually happened.
+
+Usage:
+    python win_probability.py [--simulations 100000] [--workers 4] [--replay DIR]
+
+Requires numpy (pip install numpy).
+"""
+
+import argparse
+import math
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from scoring_rules import CompiledScoring
+from stat_store import SlateStats
+from vectorized_scoring import STAT_COLUMNS, score_columns
+
+REGULATION_SECONDS = 3600
+QUARTER_SECONDS = 900
+
+# Full-game production of a starter at each position:
+# ('poisson', mean) or ('normal', mean, standard deviation)
+POSITION_PROFILES: Dict[str, Dict[str, Tuple]] = {
+    'QB': {
+        'passing_yards': ('normal', 235, 70), 'passing_tds': ('poisson', 1.6),
+        'interceptions': ('poisson', 0.8), 'rushing_yards': ('normal', 18, 15),
+        'rushing_tds': ('poisson', 0.15), 'fumbles_lost': ('poisson', 0.1),
+    },
+    'RB': {
+        'rushing_yards': ('normal', 65, 30), 'rushing_tds': ('poisson', 0.45),
+        'receptions': ('poisson', 2.5), 'receiving_yards': ('normal', 20, 15),
+        'receiving_tds': ('poisson', 0.12), 'fumbles_lost': ('poisson', 0.05),
+    },
+    'WR': {
+        'receptions': ('poisson', 5), 'receiving_yards': ('normal', 65, 30),
+        'receiving_tds': ('poisson', 0.4), 'rushing_yards': ('normal', 3, 5),
+        'fumbles_lost': ('poisson', 0.03),
+    },
+    'TE': {
+        'receptions': ('poisson', 3.5), 'receiving_yards': ('normal', 40, 25),
+        'receiving_tds': ('poisson', 0.3), 'fumbles_lost': ('poisson', 0.02),
+    },
+    'K': {
+        'pat_made': ('poisson', 2.4), 'pat_missed': ('poisson', 0.1),
+        'fg_0_39': ('poisson', 0.9), 'fg_40_49': ('poisson', 0.6), 'fg_50_plus': ('poisson', 0.3),
+        'fg_miss_0_39': ('poisson', 0.05), 'fg_miss_40_49': ('poisson', 0.12),
+        'fg_miss_50_plus': ('poisson', 0.15),
+    },
+    'D/ST': {
+        'points_allowed': ('normal', 22, 9), 'sacks': ('poisson', 2.5),
+        'defensive_interceptions': ('poisson', 0.8), 'fumble_recoveries': ('poisson', 0.6),
+        'safeties': ('poisson', 0.03), 'blocked_kicks': ('poisson', 0.05), 'return_tds': ('poisson', 0.12),
+    },
+}
+
+
+class SlotPlan(NamedTuple):
+    """One roster slot, ready to simulate"""
+    name: str
+    profile: str                  # key into POSITION_PROFILES
+    fixed_points: float           # points from games that are already over
+    base: Dict[str, float]        # stats so far in the game still to play
+    fraction: float               # share of that game left, 0.0 - 1.0
+
+
+def remaining_fraction(competition: Dict) -> float:
+    """Share of regulation left in a scoreboard competition (1.0 before kickoff, 0.0 when over)"""
+    status = competition.get('status', {})
+    state = status.get('type', {}).get('state')
+    if state == 'pre':
+        return 1.0
+    if state != 'in':
+        return 0.0
+
+    period = status.get('period') or 1
+    clock = status.get('clock')
+    if clock is None:
+        minutes, _, seconds = str(status.get('displayClock', '0:00')).partition(':')
+        try:
+            clock = int(minutes) * 60 + float(seconds or 0)
+        except ValueError:
+            clock = 0
+    if period > 4:
+        # Overtime: whatever is left of the period, as a share of a full game
+        return min(clock / REGULATION_SECONDS, 1.0)
+    return min(max(((4 - period) * QUARTER_SECONDS + clock) / REGULATION_SECONDS, 0.0), 1.0)
+
+
+def team_games(games: List[Dict]) -> Dict[str, Tuple[str, float]]:
+    """Team abbreviation -> (game id, share of the game left) for every scoreboard game"""
+    teams = {}
+    for event in games:
+        for competition in event.get('competitions', [])[:1]:
+            fraction = remaining_fraction(competition)
+            for competitor in competition.get('competitors', []):
+                abbr = competitor.get('team', {}).get('abbreviation')
+                if abbr:
+                    teams[abbr] = (str(event.get('id', competition.get('id'))), fraction)
+    return teams
+
+
+def _draw(rng: np.random.Generator, distribution: Tuple, fraction: float, n: int) -> np.ndarray:
+    """Remaining production for n simulations, scaled to the share of the game left"""
+    if distribution[0] == 'poisson':
+        return rng.poisson(distribution[1] * fraction, n)
+    _, mean, sd = distribution
+    return np.maximum(np.rint(rng.normal(mean * fraction, sd * math.sqrt(fraction), n)), 0)
+
+
+def _sample_columns(slots: List[SlotPlan], n: int, rng: np.random.Generator) -> Dict[str, np.ndarray]:
+    """Simulated final stat columns, n rows per slot, slot after slot"""
+    columns = {}
+    for stat in STAT_COLUMNS:
+        default = -1.0 if stat == 'points_allowed' else 0.0
+        base = [slot.base.get(stat, default) for slot in slots]
+        sampled = [(i, POSITION_PROFILES[slot.profile][stat]) for i, slot in enumerate(slots)
+                   if stat in POSITION_PROFILES[slot.profile]]
+        if not sampled and all(value == default for value in base):
+            continue
+        column = np.repeat(np.array(base, dtype=np.float64), n).reshape(len(slots), n)
+        for i, distribution in sampled:
+            column[i] += _draw(rng, distribution, slots[i].fraction, n)
+        columns[stat] = column.reshape(-1)
+    return columns
+
+
+def simulate_totals(plans: List[List[SlotPlan]], rules: CompiledScoring, simulations: int,
+                    seed, batch_size: int = 5_000) -> np.ndarray:
+    """Simulated fantasy totals, shape (teams, simulations); runs in worker processes too"""
+    rng = np.random.default_rng(seed)
+    totals = np.zeros((len(plans), simulations))
+    for t, slots in enumerate(plans):
+        totals[t] += sum(slot.fixed_points for slot in slots)
+        live = [slot for slot in slots if slot.fraction > 0]
+        if not live:
+            continue
+        for start in range(0, simulations, batch_size):
+            n = min(batch_size, simulations - start)
+            points = score_columns(_sample_columns(live, n, rng), rules)
+            totals[t, start:start + n] += points.reshape(len(live), n).sum(axis=0)
+    return totals
+
+
+class MatchupSimulator:
+    """Win probabilities for the matchup's rosters from the current slate"""
+
+    def __init__(self, matchup, simulations: int = 100_000, workers: int = 0, seed: int = 0,
+                 rules: Optional[CompiledScoring] = None, batch_size: int = 5_000):
+        self.matchup = matchup
+        self.rules = rules or matchup.rules
+        self.simulations = simulations
+        self.workers = workers
+        self.seed = seed
+        self.batch_size = batch_size
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def plan_roster(self, roster: List[Tuple[str, str, str]], stats: SlateStats,
+                    teams: Dict[str, Tuple[str, float]]) -> List[SlotPlan]:
+        """Split each slot into realized points and the part of its game still to play"""
+        plans = []
+        for player_name, roster_pos, team_abbr in roster:
+            kind, key = self.matchup.roster_slot_key(player_name, roster_pos, team_abbr, stats)
+            game_id, fraction = teams.get(team_abbr, (None, 0.0))
+            by_game = stats.lines[kind].get(key, {}) if key is not None else {}
+
+            live_game = game_id if fraction > 0 else None
+            fixed = sum(self.matchup.calculate_fantasy_points(line, self.rules)
+                        for other_game, line in by_game.items() if other_game != live_game)
+            current = by_game.get(live_game, {})
+
+            if kind == 'defense':
+                profile = 'D/ST'
+            elif kind == 'kicker':
+                profile = 'K'
+            else:
+                position = next((line.get('position') for line in by_game.values()), None)
+                profile = next((pos for pos in (position, roster_pos) if pos in POSITION_PROFILES), 'WR')
+
+            base = {stat: float(current[stat]) for stat in STAT_COLUMNS if current.get(stat) is not None}
+            if profile == 'D/ST' and fraction > 0:
+                base['points_allowed'] = max(base.get('points_allowed', 0.0), 0.0)
+            plans.append(SlotPlan(player_name, profile, fixed, base, fraction))
+        return plans
+
+    def simulate(self, rosters: List[List[Tuple[str, str, str]]], stats: SlateStats,
+                 games: List[Dict]) -> np.ndarray:
+        """Simulated totals for each roster, shape (rosters, simulations)"""
+        teams = team_games(games)
+        plans = [self.plan_roster(roster, stats, teams) for roster in rosters]
+
+        if self.workers <= 1:
+            return simulate_totals(plans, self.rules, self.simulations, self.seed, self.batch_size)
+
+        # Independent random streams per worker, split from the one seed
+        seeds = np.random.SeedSequence(self.seed).spawn(self.workers)
+        chunks = [self.simulations // self.workers + (i < self.simulations % self.workers)
+                  for i in range(self.workers)]
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        futures = [self._pool.submit(simulate_totals, plans, self.rules, n, seed, self.batch_size)
+                   for n, seed in zip(chunks, seeds) if n]
+        return np.concatenate([future.result() for future in futures], axis=1)
+
+    def win_probability(self, stats: SlateStats, games: List[Dict]) -> Dict:
+        """Win probability and projected points for team1 and team2 (ties split evenly)"""
+        teams = [self.matchup.team1, self.matchup.team2]
+        totals = self.simulate([team['roster'] for team in teams], stats, games)
+
+        leaders = totals == totals.max(axis=0)
+        shares = leaders / leaders.sum(axis=0)
+        result = {'simulations': self.simulations,
+                  'tie_probability': round(float(np.mean(leaders.sum(axis=0) > 1)), 4)}
+        for i, team in enumerate(teams):
+            low, high = np.percentile(totals[i], [10, 90])
+            result[f"team{i + 1}"] = {
+                'name': team['name'],
+                'win_probability': round(float(shares[i].mean()), 4),
+                'projected_points': round(float(totals[i].mean()), 2),
+                'p10': round(float(low), 2),
+                'p90': round(float(high), 2),
+            }
+        return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Monte Carlo win probability for the live matchup')
+    parser.add_argument('--simulations', type=int, default=100_000)
+    parser.add_argument('--workers', type=int, default=0, help='simulation processes (0 = this process)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--settings', help='league settings file to score with')
+    parser.add_argument('--replay', metavar='DIR', help='read recorded ESPN responses instead of the live API')
+    args = parser.parse_args()
+
+    from championship_matchup import ChampionshipMatchup
+    from data_sources import ReplaySource
+
+    source = ReplaySource(args.replay) if args.replay else None
+    matchup = ChampionshipMatchup(settings_path=args.settings, source=source)
+    games = matchup.fetch_playoff_games()
+    if not games:
+        print("✗ No games found")
+        return
+
+    simulator = MatchupSimulator(matchup, args.simulations, args.workers, args.seed)
+    try:
+        result = simulator.win_probability(matchup.collect_stats(games), games)
+    finally:
+        simulator.close()
+
+    print(f"\n{result['simulations']:,} simulations")
+    for team in (result['team1'], result['team2']):
+        print(f"  {team['name']:<28} {team['win_probability'] * 100:6.1f}%   "
+              f"projected {team['projected_points']:7.2f} ({team['p10']:.2f} - {team['p90']:.2f})")
+    if result['tie_probability']:
+        print(f"  tie {result['tie_probability'] * 100:.1f}%")
+
+
+if __name__ == '__main__':
+    main()